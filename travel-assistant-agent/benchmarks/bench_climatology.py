@@ -0,0 +1,98 @@
+"""
+Climatology benchmark: memory-mapped day-of-year slices vs per-day Python
+
+Compiles a store for D synthetic destinations, then gets the normals for
+a trip of N days at every destination twice: once as one fancy-indexed
+slice of the memory-mapped array, and once with a Python loop that
+interpolates the monthly normals for each destination and day. It also
+times a ``get_weather`` call for a 90-day trip.
+
+Usage:
+    python benchmarks/bench_climatology.py [destinations] [days]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server.skills.climatology import FIELDS, ClimateStore  # noqa: E402
+from mcp_server.skills.weather import GetWeatherSkill  # noqa: E402
+
+START = date(2024, 11, 20)
+
+
+def build_climate(destinations: int):
+    rng = np.random.default_rng(5)
+    months = np.arange(12)
+
+    def normals():
+        high = 20 + rng.uniform(-12, 10) * np.cos((months - rng.integers(0, 12)) / 6 * np.pi)
+        return {
+            "temperature_high": np.round(high, 1).tolist(),
+            "temperature_low": np.round(high - rng.uniform(4, 10), 1).tolist(),
+            "precipitation_chance": rng.integers(5, 80, 12).tolist(),
+        }
+
+    return {
+        "destinations": {f"city {i}": normals() for i in range(destinations)},
+        "default": normals(),
+    }
+
+
+def scalar(climate, days: int):
+    """Linear interpolation between mid-month normals, one value at a time"""
+    out = []
+    for monthly in climate["destinations"].values():
+        rows = []
+        for offset in range(days):
+            day = START + timedelta(days=offset)
+            length = (date(day.year + day.month // 12, day.month % 12 + 1, 1)
+                      - date(day.year, day.month, 1)).days
+            position = (day.day - 0.5) / length - 0.5
+            month = day.month - 1 + (position >= 0) - 1
+            weight = position + (position < 0)
+            rows.append([
+                monthly[field][month % 12] * (1 - weight) + monthly[field][(month + 1) % 12] * weight
+                for field in FIELDS
+            ])
+        out.append(rows)
+    return out
+
+
+def timed(fn, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main(destinations: int = 1000, days: int = 30) -> None:
+    climate = build_climate(destinations)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        build_ms, store = timed(lambda: ClimateStore.load(climate, cache_dir=cache_dir), 1)
+        open_ms, store = timed(lambda: ClimateStore.load(climate, cache_dir=cache_dir), 5)
+        print(f"{destinations} destinations: compile {build_ms:.1f} ms, "
+              f"reopen (digest + mmap) {open_ms:.1f} ms, {store.normals.nbytes / 1e6:.1f} MB")
+
+        rows = [store.row(name) for name in climate["destinations"]]
+        slice_ms, _ = timed(lambda: store.normals_for(rows, START, days), 20)
+        loop_ms, _ = timed(lambda: scalar(climate, days), 1)
+        print(f"  {days}-day normals for every destination: slice {slice_ms:.2f} ms, "
+              f"Python loop {loop_ms:.1f} ms ({loop_ms / slice_ms:.0f}x slower)")
+
+    skill = GetWeatherSkill()
+    end = (START + timedelta(days=89)).isoformat()
+    call_ms, result = timed(
+        lambda: asyncio.run(skill.execute("Tokyo", START.isoformat(), end)), 20
+    )
+    print(f"  get_weather for a {len(result['forecast'])}-day trip: {call_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,118 @@
+"""
+Destination lookup benchmark over a large synthetic catalog
+
+Builds a ``DestinationIndex`` over N synthetic destination names (plus
+the real catalog with its aliases) and times each kind of query:
+exact names, CJK aliases, prefixes, typos, names inside a longer query
+and misses. The linear substring scan the skill used before the index
+is timed on the same catalog for comparison.
+
+The index holds about a million small objects; they are moved out of
+the collector's reach with ``gc.freeze()`` after the build (as a
+long-running server would after warm-up) so full collections do not
+show up as lookup latency.
+
+Usage:
+    python benchmarks/bench_destination_index.py [destinations] [queries]
+"""
+import gc
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server.skills.catalog import get_catalog  # noqa: E402
+from mcp_server.skills.destination_index import DestinationIndex  # noqa: E402
+
+# Onset/vowel/coda inventory for place-like names (about 1,800 syllables)
+ONSETS = ("", "b", "c", "d", "f", "g", "h", "j", "k", "l", "m", "n", "p", "r", "s",
+          "t", "v", "w", "z", "br", "ch", "sh", "st", "tr", "gr", "kr", "pl", "qu")
+VOWELS = ("a", "e", "i", "o", "u", "ai", "ou", "ia")
+CODAS = ("", "", "n", "r", "l", "s", "m", "k", "t")
+PREFIXES = ("",) * 12 + ("san ", "port ", "new ", "saint ", "el ", "bad ")
+SUFFIXES = ("",) * 12 + (" city", " bay", " springs", " island", " valley", "-sur-mer")
+
+
+def synthetic_names(count: int, rng: random.Random) -> dict:
+    names = {}
+    while len(names) < count:
+        word = "".join(
+            rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS)
+            for _ in range(rng.randint(2, 3))
+        )
+        name = (rng.choice(PREFIXES) + word + rng.choice(SUFFIXES)).title()
+        names.setdefault(name.lower(), (name,))
+    return names
+
+
+def typo(name: str, rng: random.Random) -> str:
+    i = rng.randrange(1, len(name))
+    return name[:i] + rng.choice("aeioxz") + name[i + 1:]
+
+
+def linear_lookup(entries: dict, destination: str):
+    """The pre-index lookup: exact key, then the first substring match"""
+    key = destination.lower().strip()
+    if key in entries:
+        return entries[key]
+    for name, entry in entries.items():
+        if key in name or name in key:
+            return entry
+    return None
+
+
+def timed(fn, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return (
+        statistics.median(samples),
+        samples[int(len(samples) * 0.99) - 1],
+        samples[-1],
+    )
+
+
+def main(count: int = 100_000, per_kind: int = 2_000) -> None:
+    rng = random.Random(7)
+    catalog = get_catalog()
+    names = synthetic_names(count, rng)
+    aliases = catalog.section("aliases")
+    for key, entry in catalog.section("destinations").items():
+        names[key] = (entry["destination"], *aliases.get(key, ()))
+
+    start = time.perf_counter()
+    index = DestinationIndex(names)
+    print(f"indexed {len(index)} destinations in {time.perf_counter() - start:.2f}s")
+    gc.collect()
+    gc.freeze()
+
+    keys = list(names)
+    sample = [rng.choice(keys) for _ in range(per_kind)]
+    cjk = [alias for values in aliases.values() for alias in values if not alias.isascii()]
+    queries = {
+        "exact": sample,
+        "alias (CJK)": [rng.choice(cjk) for _ in range(per_kind)],
+        "prefix": [key[:max(3, len(key) // 2)] for key in sample],
+        "typo": [typo(key, rng) for key in sample],
+        "in longer query": [f"{key} holiday" for key in sample],
+        "miss": ["".join(rng.choice("wxyzq") for _ in range(8)) for _ in range(per_kind)],
+    }
+
+    print(f"{'query':<18}{'p50 us':>10}{'p99 us':>10}{'max us':>10}")
+    for kind, batch in queries.items():
+        p50, p99, worst = timed(index.best, batch)
+        print(f"{kind:<18}{p50:>10.1f}{p99:>10.1f}{worst:>10.1f}")
+
+    # The old scan is O(N) per miss, so a small sample is enough
+    scan = timed(lambda query: linear_lookup(names, query), queries["typo"][:50])
+    print(f"{'linear scan typo':<18}{scan[0]:>10.1f}{scan[1]:>10.1f}{scan[2]:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
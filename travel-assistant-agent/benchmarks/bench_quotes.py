@@ -0,0 +1,130 @@
+"""
+Quote engine benchmark: vectorized grids vs per-option Python arithmetic
+
+Prices a synthetic inventory of H hotels x every room type x 1..14
+nights x 1..6 guests, once with ``QuoteEngine`` (NumPy broadcasting plus
+a filtered top-k) and once with a scalar loop doing what
+``QueryPricesSkill`` used to do per hotel. It also times
+``bulk_quotes`` over many destinations x date pairs, and a year-long
+``price_calendar`` against one ``query_prices`` call per check-in date.
+
+Usage:
+    python benchmarks/bench_quotes.py [hotels] [repeat]
+"""
+import asyncio
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server.skills.catalog import get_catalog  # noqa: E402
+from mcp_server.skills.pricing import QueryPricesSkill  # noqa: E402
+from mcp_server.skills.quote_engine import QuoteEngine  # noqa: E402
+
+NIGHTS = np.arange(1, 15)
+GUESTS = np.arange(1, 7)
+
+
+def build_engine(hotels: int) -> QuoteEngine:
+    rng = np.random.default_rng(11)
+    pricing = dict(get_catalog().section("pricing"))
+    pricing["hotels"] = [
+        {
+            "name": f"Hotel {i}",
+            "rating": round(float(rating), 1),
+            "price_per_night": int(rate),
+            "amenities": ["WiFi"],
+            "location": "City Center",
+        }
+        for i, (rating, rate) in enumerate(zip(
+            rng.uniform(2.5, 5.0, hotels), rng.integers(40, 900, hotels)
+        ))
+    ]
+    return QuoteEngine(pricing)
+
+
+def vectorized(engine: QuoteEngine, limit: int = 50):
+    # (hotels, room types, nights) x rooms needed per (room type, guests)
+    rooms = -(-GUESTS[None, :] // engine.room_capacity[:, None])            # (R, G)
+    totals = engine.hotel_totals(NIGHTS)[:, :, :, None] * rooms[None, :, None, :]
+    mask = totals <= 2500
+    flat = totals[mask]
+    best = np.argpartition(flat, limit)[:limit]
+    return flat[best[np.argsort(flat[best])]], int(mask.sum())
+
+
+def scalar(engine: QuoteEngine, limit: int = 50):
+    rates = engine.hotel_rates.tolist()
+    multipliers = engine.room_multipliers.tolist()
+    capacity = engine.room_capacity.tolist()
+    matches = []
+    for rate in rates:
+        for multiplier, cap in zip(multipliers, capacity):
+            for nights in NIGHTS.tolist():
+                for guests in GUESTS.tolist():
+                    total = rate * multiplier * nights * -(-guests // cap)
+                    if total <= 2500:
+                        matches.append(total)
+    matches.sort()
+    return matches[:limit], len(matches)
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main(hotels: int = 2000, repeat: int = 5) -> None:
+    engine = build_engine(hotels)
+    options = hotels * len(engine.room_types) * len(NIGHTS) * len(GUESTS)
+    print(f"{hotels} hotels x {len(engine.room_types)} room types x "
+          f"{len(NIGHTS)} stays x {len(GUESTS)} party sizes = {options} options")
+
+    vec_ms, (vec_top, vec_count) = timed(lambda: vectorized(engine), repeat)
+    py_ms, (py_top, py_count) = timed(lambda: scalar(engine), max(1, repeat // 5))
+    assert vec_count == py_count and np.allclose(vec_top, py_top)
+    print(f"  vectorized {vec_ms:8.1f} ms   ({options / vec_ms / 1000:.1f}M options/s)")
+    print(f"  scalar     {py_ms:8.1f} ms   ({py_ms / vec_ms:.0f}x slower)")
+
+    destinations = [f"City {i}" for i in range(100)] + ["Tokyo", "Paris", "Bali"]
+    pairs = [
+        (f"2024-07-{day:02d}", f"2024-07-{day + stay:02d}")
+        for day in range(1, 11) for stay in (2, 4, 7)
+    ]
+    bulk_ms, quotes = timed(
+        lambda: get_catalog().quote_engine.bulk_quotes(destinations, pairs), repeat
+    )
+    print(f"  bulk_quotes {len(quotes)} quotes ({len(destinations)} destinations x "
+          f"{len(pairs)} date pairs): {bulk_ms:.1f} ms")
+
+    first = date(2024, 1, 1)
+    calendar_ms, calendar = timed(
+        lambda: get_catalog().quote_engine.price_calendar(
+            "Tokyo", first.isoformat(), "2024-12-31", nights=7
+        ),
+        repeat,
+    )
+    skill = QueryPricesSkill()
+
+    async def per_date():
+        for day in range(len(calendar["windows"])):
+            check_in = first + timedelta(days=day)
+            await skill.execute(
+                destination="Tokyo",
+                check_in=check_in.isoformat(),
+                check_out=(check_in + timedelta(days=7)).isoformat(),
+            )
+
+    loop_ms, _ = timed(lambda: asyncio.run(per_date()), max(1, repeat // 5))
+    print(f"  price_calendar {len(calendar['windows'])} check-in dates: {calendar_ms:.1f} ms "
+          f"(one query_prices per date: {loop_ms:.1f} ms, before any round trips)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
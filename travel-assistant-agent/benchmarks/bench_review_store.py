@@ -0,0 +1,94 @@
+"""
+Review store benchmark: pre-aggregated summaries and keyset pages
+
+Ingests N synthetic reviews for one destination in batches, then
+compares the store with recomputing per request from a plain list:
+the summary (histograms vs a pass over every review) and a page deep
+in the rating order (cursor slice vs sorting every review). It also
+times single-review ingestion followed by a page read.
+
+Usage:
+    python benchmarks/bench_review_store.py [reviews] [batch]
+"""
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server.skills.review_store import DestinationReviews  # noqa: E402
+
+PAGE = 20
+
+
+def synthetic(count: int):
+    rng = np.random.default_rng(13)
+    first = date(2015, 1, 1)
+    days = [(first + timedelta(days=d)).isoformat() for d in range(4000)]
+    return [
+        {"author": f"user{i}", "rating": rating, "date": days[day], "title": "", "content": ""}
+        for i, (rating, day) in enumerate(zip(
+            rng.integers(1, 6, count).tolist(), rng.integers(0, 4000, count).tolist()
+        ))
+    ]
+
+
+def recompute_summary(reviews):
+    counts = [0] * 6
+    for review in reviews:
+        counts[review["rating"]] += 1
+    total = len(reviews)
+    return {
+        "overall_rating": round(sum(i * c for i, c in enumerate(counts)) / total, 1),
+        "rating_breakdown": {f"{i}_star": round(counts[i] * 100 / total) for i in range(5, 0, -1)},
+    }
+
+
+def timed(fn, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main(count: int = 1_000_000, batch: int = 10_000) -> None:
+    reviews = synthetic(count)
+    store = DestinationReviews()
+
+    def ingest_all():
+        for start in range(0, count, batch):
+            store.ingest(reviews[start:start + batch])
+        store.page("recency", limit=1)
+
+    ingest_ms, _ = timed(ingest_all, 1)
+    print(f"{count} reviews ingested in batches of {batch}: {ingest_ms:.0f} ms "
+          f"(including the first merge)")
+
+    summary_ms, summary = timed(store.summary, 1000)
+    scan_ms, scanned = timed(lambda: recompute_summary(reviews), 3)
+    assert summary["overall_rating"] == scanned["overall_rating"]
+    print(f"  summary: histograms {summary_ms * 1000:.1f} us, full scan {scan_ms:.1f} ms")
+
+    offset = count // 2
+    cursor = store.page("rating", offset=offset - PAGE, limit=PAGE).next_cursor
+    page_ms, page = timed(lambda: store.page("rating", limit=PAGE, cursor=cursor), 1000)
+    sort_ms, ranked = timed(
+        lambda: sorted(reviews, key=lambda r: (r["rating"], r["date"]), reverse=True)[offset:offset + PAGE],
+        1,
+    )
+    assert [r["rating"] for r in page.reviews] == [r["rating"] for r in ranked]
+    print(f"  page {offset // PAGE} by rating: cursor {page_ms * 1000:.1f} us, sort per request {sort_ms:.0f} ms")
+
+    def ingest_one_and_read():
+        store.ingest([{"rating": 4, "date": "2026-01-01"}])
+        return store.page("recency", limit=PAGE)
+
+    one_ms, _ = timed(ingest_one_and_read, 20)
+    print(f"  ingest one review + read a page: {one_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,66 @@
+"""
+Per-skill allocation micro-benchmark
+
+Calls each catalog-backed skill's ``execute`` directly (no server, no
+validation) and reports, per call:
+
+- peak bytes allocated while the call runs (tracemalloc)
+- bytes still referenced by the returned result
+- wall-clock time
+
+Usage:
+    python benchmarks/bench_skill_allocations.py [calls]
+"""
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server.skills import get_skill  # noqa: E402
+
+CASES = (
+    ("search_destination", {"destination": "Tokyo"}),
+    ("search_destination", {"destination": "Reykjavik"}),
+    ("get_weather", {"destination": "Paris", "include_forecast": False}),
+    ("get_destination_reviews", {"destination": "Bali", "limit": 3}),
+    ("get_destination_reviews", {"destination": "Bali", "include_sentiment": False}),
+    ("create_travel_plan", {"destination": "Tokyo", "duration_days": 3, "budget": 2000}),
+)
+
+
+async def _measure(skill, parameters, calls: int):
+    # Warm up: imports, catalog loading, interned strings
+    await skill.execute(**parameters)
+
+    tracemalloc.start()
+    peak_total = retained_total = 0
+    for _ in range(calls):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = await skill.execute(**parameters)
+        after, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - before
+        retained_total += after - before
+        del result
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        await skill.execute(**parameters)
+    elapsed = time.perf_counter() - started
+    return peak_total / calls, retained_total / calls, elapsed / calls * 1e6
+
+
+async def main(calls: int = 2000):
+    print(f"{'skill':<26}{'case':<34}{'peak B/call':>13}{'result B':>10}{'us/call':>9}")
+    for name, parameters in CASES:
+        peak, retained, micros = await _measure(get_skill(name), parameters, calls)
+        case = ", ".join(f"{k}={v}" for k, v in parameters.items())
+        print(f"{name:<26}{case[:33]:<34}{peak:>13.0f}{retained:>10.0f}{micros:>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
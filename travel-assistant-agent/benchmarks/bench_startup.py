@@ -0,0 +1,46 @@
+"""
+Startup time benchmark
+
+Times cold imports in fresh interpreters, which is what a container
+healthcheck waits on before the service can answer.
+
+Usage:
+    python benchmarks/bench_startup.py [runs]
+"""
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+SCENARIOS = {
+    "import mcp_server + list skills": (
+        "import mcp_server; mcp_server.get_skill_definitions()"
+    ),
+    "first skill call": (
+        "import asyncio, mcp_server;"
+        "asyncio.run(mcp_server.get_mcp_server().call_skill("
+        "'search_destination', {'destination': 'Tokyo'}))"
+    ),
+    "import main (FastAPI app)": "import main",
+}
+
+
+def time_run(code: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR, check=True)
+    return (time.perf_counter() - started) * 1000
+
+
+def main(runs: int = 5):
+    baseline = statistics.median(time_run("pass") for _ in range(runs))
+    print(f"{'scenario':<34}{'median ms':>10}{'over bare python':>18}")
+    for label, code in SCENARIOS.items():
+        median = statistics.median(time_run(code) for _ in range(runs))
+        print(f"{label:<34}{median:>10.1f}{median - baseline:>18.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,62 @@
+"""
+MCP transport throughput benchmark
+
+Starts the stdio MCP server as a child process and pushes skill calls
+through it in groups of 1, 10 and 100. Each group is sent either as
+separate request frames (one call per frame, pipelined) or as a single
+JSON-RPC batch frame.
+
+Usage:
+    python benchmarks/bench_transport.py [calls]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from agents.mcp_transport import StdioTransport, default_server_command  # noqa: E402
+
+GROUP_SIZES = (1, 10, 100)
+
+
+def _requests(count: int, offset: int):
+    return [
+        ("skills/call", {
+            "name": "get_weather",
+            "arguments": {"destination": f"City {offset + i}"}
+        })
+        for i in range(count)
+    ]
+
+
+async def _run(transport: StdioTransport, total: int, group: int, batched: bool) -> float:
+    started = time.perf_counter()
+    for offset in range(0, total, group):
+        requests = _requests(group, offset)
+        if batched:
+            await transport.request_batch(requests)
+        else:
+            await asyncio.gather(*(transport.request(m, p) for m, p in requests))
+    return total / (time.perf_counter() - started)
+
+
+async def main(total: int = 2000):
+    transport = StdioTransport(default_server_command() + ["--no-process-pool"])
+    await transport.connect()
+    try:
+        # Warm up skill imports and validators in the server
+        await _run(transport, 100, 100, batched=True)
+
+        print(f"{'group size':>12}{'per-call calls/s':>18}{'batched calls/s':>17}{'speedup':>9}")
+        for group in GROUP_SIZES:
+            single = await _run(transport, total, group, batched=False)
+            batched = await _run(transport, total, group, batched=True)
+            print(f"{group:>12}{single:>18.0f}{batched:>17.0f}{batched / single:>8.2f}x")
+    finally:
+        await transport.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
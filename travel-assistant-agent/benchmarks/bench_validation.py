@@ -0,0 +1,50 @@
+"""
+Skill input validation benchmark
+
+Measures the per-call cost of the precompiled skill input validators.
+
+Usage:
+    python benchmarks/bench_validation.py [iterations]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mcp_server.skills import get_skill_validator  # noqa: E402
+
+SAMPLE_PARAMETERS = {
+    "search_destination": {"destination": "Tokyo", "include_tips": "true"},
+    "query_prices": {
+        "destination": "Paris",
+        "check_in": "2024-04-01",
+        "check_out": "2024-04-06",
+        "guests": "2",
+    },
+    "get_destination_reviews": {"destination": "Bali", "limit": 5},
+    "get_weather": {
+        "destination": "Tokyo",
+        "start_date": "2024-04-01",
+        "end_date": "2024-04-06",
+    },
+    "create_travel_plan": {
+        "destination": "Paris",
+        "duration_days": 5,
+        "budget": 2000,
+        "travel_dates": {"start": "2024-04-01", "end": "2024-04-06"},
+        "interests": ["art", "food"],
+    },
+}
+
+
+def main(iterations: int = 100_000):
+    print(f"{'skill':<28}{'us/call':>10}")
+    for skill_name, parameters in SAMPLE_PARAMETERS.items():
+        validator = get_skill_validator(skill_name)
+        seconds = timeit.timeit(lambda: validator(parameters), number=iterations)
+        print(f"{skill_name:<28}{seconds / iterations * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
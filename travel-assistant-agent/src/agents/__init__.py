@@ -2,8 +2,19 @@ from .info_collection import InfoCollectionAgent
 from .search import SearchAgent
 from .recommendation import RecommendationAgent
 from .booking import BookingAgent
+from .admission import AdmissionController, AdmissionRejected, Priority
 from .mcp_client import MCPClient, get_mcp_client, init_mcp_client, MCPSkill, MCPSkillResult
-from .skill_agent import SkillBasedAgent, MCPSkillsPlanner
+from .mcp_transport import (
+    MCPTransport,
+    MCPTransportError,
+    InProcessTransport,
+    StdioTransport,
+    SSETransport,
+    create_transport,
+)
+from .skill_cache import SkillResultCache, TTLSkillResultCache
+from .skill_resilience import CircuitBreaker, CircuitOpenError
+from .skill_agent import SkillBasedAgent, MCPSkillsPlanner, SkillDAGExecutor, SkillDAGResult
 
 __all__ = [
     "InfoCollectionAgent",
@@ -15,6 +26,21 @@ __all__ = [
     "init_mcp_client",
     "MCPSkill",
     "MCPSkillResult",
+    "AdmissionController",
+    "AdmissionRejected",
+    "Priority",
+    "MCPTransport",
+    "MCPTransportError",
+    "InProcessTransport",
+    "StdioTransport",
+    "SSETransport",
+    "create_transport",
+    "SkillResultCache",
+    "TTLSkillResultCache",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "SkillBasedAgent",
     "MCPSkillsPlanner",
+    "SkillDAGExecutor",
+    "SkillDAGResult",
 ]
@@ -0,0 +1,322 @@
+"""
+Skill admission control
+
+Bounds how many skill executions an ``MCPClient`` runs at once, globally
+and per skill. Calls over the limit wait in a bounded FIFO queue; once
+the queue (or the skill's share of it) is full, new calls are rejected
+straight away with ``AdmissionRejected`` and a Retry-After estimate
+instead of piling up as coroutines.
+
+Each call has a ``Priority``. Interactive calls (a user waiting on a
+plan) are served before queued batch work, and can take a queue place
+from a batch call when the queue is full. Batch work still gets a
+guaranteed minimum share of the slots, so it never starves.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+
+class Priority(str, Enum):
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a skill call cannot even be queued, or (``preempted``)
+    when a queued batch call gave its place to an interactive one
+    """
+
+    def __init__(
+        self,
+        skill_name: str,
+        reason: str,
+        retry_after: float,
+        preempted: bool = False
+    ):
+        self.skill_name = skill_name
+        self.reason = reason
+        self.retry_after = retry_after
+        self.preempted = preempted
+        super().__init__(
+            f"Skill '{skill_name}' rejected: {reason}; retry after {retry_after:.0f}s"
+        )
+
+
+class AdmissionController:
+    """
+    Global and per-skill concurrency limits with bounded, prioritized
+    wait queues.
+
+    A call is admitted when both the global limit and its skill's limit
+    have room. Freed slots go to waiting interactive calls first, unless
+    batch calls are waiting and hold fewer than their reserved share
+    (``batch_min_share`` of ``max_concurrent``). Within a priority,
+    waiters are served in FIFO order, except that a call whose skill is
+    saturated does not block calls to other skills queued behind it.
+    Slots already running are never taken away.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 64,
+        max_queued: int = 256,
+        skill_limits: Optional[Dict[str, int]] = None,
+        default_skill_limit: Optional[int] = None,
+        skill_queue_limit: Optional[int] = None,
+        batch_min_share: float = 0.1,
+        min_retry_after: float = 1.0,
+        clock=time.monotonic
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.skill_limits = dict(skill_limits or {})
+        self.default_skill_limit = default_skill_limit
+        self.skill_queue_limit = skill_queue_limit
+        self.batch_min_share = batch_min_share
+        self.min_retry_after = min_retry_after
+        self._clock = clock
+
+        self.active = 0
+        self._active_by_skill: Dict[str, int] = {}
+        self._active_by_priority: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._queued_by_skill: Dict[Tuple[Priority, str], int] = {}
+        self._queues: Dict[Priority, Deque[Tuple[str, asyncio.Future]]] = {
+            p: deque() for p in Priority
+        }
+        # Woken whenever the queue drops below max_queued
+        self._room_waiters: List[asyncio.Future] = []
+        # Smoothed time a slot is held, for Retry-After estimates
+        self._hold_seconds: Optional[float] = None
+
+        self.admitted = 0
+        self.rejected = 0
+        self.preempted = 0
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def batch_reserved(self) -> int:
+        """Slots batch work is guaranteed when it has calls waiting"""
+        if self.batch_min_share <= 0:
+            return 0
+        return max(1, math.ceil(self.batch_min_share * self.max_concurrent))
+
+    def skill_limit(self, skill_name: str) -> Optional[int]:
+        return self.skill_limits.get(skill_name, self.default_skill_limit)
+
+    def try_acquire(
+        self,
+        skill_name: str,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> bool:
+        """Take a slot if one is free right now and nobody ahead is waiting for it"""
+        if self._queued_for(skill_name, Priority.INTERACTIVE):
+            return False
+        if priority is Priority.BATCH and self._queued_for(skill_name, Priority.BATCH):
+            return False
+        if not self._has_room(skill_name):
+            return False
+        self._grant(skill_name, priority)
+        return True
+
+    async def acquire(
+        self,
+        skill_name: str,
+        priority: Priority = Priority.INTERACTIVE,
+        timeout: Optional[float] = None
+    ) -> None:
+        """
+        Take a slot, waiting in the queue if needed.
+
+        Raises ``AdmissionRejected`` when the call cannot be queued and
+        ``asyncio.TimeoutError`` when no slot frees up within ``timeout``.
+        """
+        if self.try_acquire(skill_name, priority):
+            return
+
+        # Every other rejection comes first: a batch call is only evicted
+        # for an interactive call that will actually take its place
+        key = (priority, skill_name)
+        queued_for_skill = self._queued_by_skill.get(key, 0)
+        if self.skill_queue_limit is not None and queued_for_skill >= self.skill_queue_limit:
+            self._reject(skill_name, "too many queued calls for this skill")
+        if self.queued >= self.max_queued and not (
+            priority is Priority.INTERACTIVE and self._preempt_batch()
+        ):
+            self._reject(skill_name, "too many queued skill calls")
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (skill_name, waiter)
+        self._queues[priority].append(entry)
+        self._queued_by_skill[key] = queued_for_skill + 1
+        try:
+            if timeout is None:
+                await waiter
+            else:
+                await asyncio.wait_for(asyncio.shield(waiter), max(0.0, timeout))
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # Granted just as we gave up: hand the slot back
+                self.release(skill_name, priority=priority)
+            elif entry in self._queues[priority]:
+                self._queues[priority].remove(entry)
+                self._queued_by_skill[key] -= 1
+                waiter.cancel()
+                self._notify_room()
+            raise
+
+    async def wait_for_queue_room(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until a new call could be queued without being rejected.
+
+        Raises ``asyncio.TimeoutError`` if the queue stays full for
+        ``timeout`` seconds.
+        """
+
+        async def wait() -> None:
+            while self.queued >= self.max_queued:
+                waiter = asyncio.get_running_loop().create_future()
+                self._room_waiters.append(waiter)
+                try:
+                    await waiter
+                finally:
+                    if waiter in self._room_waiters:
+                        self._room_waiters.remove(waiter)
+
+        await asyncio.wait_for(wait(), None if timeout is None else max(0.0, timeout))
+
+    def release(
+        self,
+        skill_name: str,
+        held_seconds: Optional[float] = None,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> None:
+        self.active -= 1
+        self._active_by_skill[skill_name] -= 1
+        self._active_by_priority[priority] -= 1
+        if held_seconds is not None:
+            if self._hold_seconds is None:
+                self._hold_seconds = held_seconds
+            else:
+                self._hold_seconds += 0.2 * (held_seconds - self._hold_seconds)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        skill_name: str,
+        priority: Priority = Priority.INTERACTIVE,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """Hold an execution slot for the duration of the block"""
+        await self.acquire(skill_name, priority, timeout)
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.release(skill_name, self._clock() - started, priority)
+
+    def retry_after(self) -> float:
+        """Rough time until queued work drains enough to admit a new call"""
+        if self._hold_seconds is None:
+            return self.min_retry_after
+        backlog = (self.queued + 1) / self.max_concurrent
+        return max(self.min_retry_after, math.ceil(self._hold_seconds * backlog))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+            "batch_reserved": self.batch_reserved,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "preempted": self.preempted,
+            "active_by_priority": {p.value: n for p, n in self._active_by_priority.items()},
+            "queued_by_priority": {p.value: len(q) for p, q in self._queues.items()},
+            "active_by_skill": {k: v for k, v in self._active_by_skill.items() if v},
+        }
+
+    def _queued_for(self, skill_name: str, priority: Priority) -> int:
+        return self._queued_by_skill.get((priority, skill_name), 0)
+
+    def _has_room(self, skill_name: str) -> bool:
+        if self.active >= self.max_concurrent:
+            return False
+        limit = self.skill_limit(skill_name)
+        return limit is None or self._active_by_skill.get(skill_name, 0) < limit
+
+    def _grant(self, skill_name: str, priority: Priority) -> None:
+        self.active += 1
+        self._active_by_skill[skill_name] = self._active_by_skill.get(skill_name, 0) + 1
+        self._active_by_priority[priority] += 1
+        self.admitted += 1
+
+    def _reject(self, skill_name: str, reason: str):
+        self.rejected += 1
+        raise AdmissionRejected(skill_name, reason, self.retry_after())
+
+    def _preempt_batch(self) -> bool:
+        """Reject the newest queued batch call to make room for an interactive one"""
+        queue = self._queues[Priority.BATCH]
+        for index in range(len(queue) - 1, -1, -1):
+            skill_name, waiter = queue[index]
+            if waiter.done():
+                continue
+            del queue[index]
+            self._queued_by_skill[(Priority.BATCH, skill_name)] -= 1
+            self.rejected += 1
+            self.preempted += 1
+            waiter.set_exception(AdmissionRejected(
+                skill_name, "preempted by interactive calls", self.retry_after(), preempted=True
+            ))
+            return True
+        return False
+
+    def _dispatch(self) -> None:
+        """Grant freed slots to waiters: reserved batch share, then interactive, then batch"""
+        while self.active < self.max_concurrent:
+            if self._active_by_priority[Priority.BATCH] < self.batch_reserved:
+                order = (Priority.BATCH, Priority.INTERACTIVE)
+            else:
+                order = (Priority.INTERACTIVE, Priority.BATCH)
+            if not any(self._grant_next(priority) for priority in order):
+                break
+        self._notify_room()
+
+    def _notify_room(self) -> None:
+        if self.queued < self.max_queued:
+            waiters, self._room_waiters = self._room_waiters, []
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    def _grant_next(self, priority: Priority) -> bool:
+        """Grant a slot to the oldest waiter of ``priority`` whose skill has room"""
+        queue = self._queues[priority]
+        for index, (skill_name, waiter) in enumerate(queue):
+            # Cancelled waiters are removed by their owner when it resumes
+            if not waiter.done() and self._has_room(skill_name):
+                del queue[index]
+                self._queued_by_skill[(priority, skill_name)] -= 1
+                self._grant(skill_name, priority)
+                waiter.set_result(None)
+                return True
+        return False
+
+
+__all__ = [
+    "Priority",
+    "AdmissionController",
+    "AdmissionRejected",
+]
@@ -5,6 +5,9 @@ MVP 阶段先定义统一接口，后续可替换为更复杂的 DeepAgent / 工
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
+from utils.deadline import expired
+from utils.logger import app_logger
+
 
 class BaseAgent(ABC):
     name: str = "base_agent"
@@ -13,3 +16,11 @@ class BaseAgent(ABC):
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """处理输入状态并返回更新后的状态"""
         raise NotImplementedError
+
+    def out_of_time(self, state: Dict[str, Any]) -> bool:
+        """请求截止时间已过时记录跳过的阶段；返回 True 时调用方应直接返回 state"""
+        if not expired():
+            return False
+        app_logger.warning(f"[{self.name}] Request deadline passed, skipping")
+        state["skipped_stages"] = [*(state.get("skipped_stages") or []), self.name]
+        return True
@@ -13,6 +13,8 @@ class BookingAgent(BaseAgent):
 
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         app_logger.info(f"[{self.name}] Starting booking process")
+        if self.out_of_time(state):
+            return state
 
         recommendations = state.get("recommendations", [])
 
@@ -9,6 +9,7 @@
 from typing import Any, Dict
 from utils.logger import app_logger
 from utils.claude import claude_client
+from utils.deadline import DeadlineExceeded
 from .base import BaseAgent
 
 
@@ -17,6 +18,8 @@ class InfoCollectionAgent(BaseAgent):
 
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         app_logger.info(f"[{self.name}] Starting information collection")
+        if self.out_of_time(state):
+            return state
 
         user_message = state.get("user_message", "")
         if not user_message:
@@ -39,12 +42,7 @@ class InfoCollectionAgent(BaseAgent):
     async def _extract_info(self, user_message: str) -> Dict[str, Any]:
         if not claude_client.is_ready():
             app_logger.warning("Claude client not ready, using mock data")
-            return {
-                "destination": "未指定",
-                "dates": "未指定",
-                "budget": "未指定",
-                "preferences": []
-            }
+            return self._unspecified_info()
 
         prompt = f"""
 从以下用户消息中提取旅行规划所需的关键信息：
@@ -61,7 +59,7 @@ class InfoCollectionAgent(BaseAgent):
 """
 
         try:
-            response = await claude_client.llm.ainvoke(prompt)
+            response = await claude_client.ainvoke(prompt, stage=self.name)
             # TODO: 解析 LLM 响应为结构化数据
             return {
                 "destination": "北京",
@@ -69,6 +67,19 @@ class InfoCollectionAgent(BaseAgent):
                 "budget": "3000-5000元",
                 "preferences": ["文化", "美食"]
             }
+        except DeadlineExceeded as e:
+            # 预算不足以等待 LLM：降级为未指定信息，由请求中的 metadata 补充
+            app_logger.warning(f"{e}; using unspecified info")
+            return self._unspecified_info()
         except Exception as e:
             app_logger.error(f"Failed to extract info: {e}")
             raise
+
+    @staticmethod
+    def _unspecified_info() -> Dict[str, Any]:
+        return {
+            "destination": "未指定",
+            "dates": "未指定",
+            "budget": "未指定",
+            "preferences": []
+        }
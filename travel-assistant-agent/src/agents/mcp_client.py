@@ -6,14 +6,50 @@ and invoke skills via the MCP protocol.
 """
 
 import asyncio
+import copy
+import itertools
 import json
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
+import time
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass, replace
 from enum import Enum
 import logging
 
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    stop_any,
+    wait_random_exponential,
+)
+
+from mcp_server.config import MCPClientConfig
+from mcp_server.metrics import LatencyHistogram
+from mcp_server.skills.catalog import unfreeze
+from mcp_server.validation import SkillInputValidator, SkillValidationError, compile_validator
+from utils.deadline import DeadlineExceeded, bound_timeout, expired, get_deadline, remaining
+from .admission import AdmissionController, AdmissionRejected, Priority
+from .mcp_transport import MCPTransport, MCPTransportError, create_transport
+from .skill_cache import SkillResultCache, TTLSkillResultCache, make_cache_key
+from .skill_resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryableSkillFailure,
+    hedged_call,
+    is_retryable_response,
+)
+
 logger = logging.getLogger(__name__)
 
+# Process-wide so versions from different client instances never collide
+_catalog_versions = itertools.count(1)
+
+# Failures worth another attempt
+_RETRYABLE_ERRORS = (asyncio.TimeoutError, MCPTransportError, RetryableSkillFailure)
+
 
 class MCPSkillCategory(Enum):
     """Skill categories for filtering"""
@@ -24,7 +60,7 @@ class MCPSkillCategory(Enum):
     PLANNING = "planning"
 
 
-@dataclass
+@dataclass(frozen=True)
 class MCPSkill:
     """Represents an available MCP skill"""
     name: str
@@ -54,6 +90,8 @@ class MCPSkillResult:
     skill_name: str
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    # Set when admission control rejected the call (seconds to back off)
+    retry_after: Optional[float] = None
 
 
 class MCPClient:
@@ -66,57 +104,128 @@ class MCPClient:
     - Managing skill calls
     """
     
-    def __init__(self, server_url: str = None):
-        self.server_url = server_url
-        self._skills_cache: List[MCPSkill] = []
+    def __init__(
+        self,
+        server_url: str = None,
+        config: MCPClientConfig = None,
+        result_cache: SkillResultCache = None,
+        transport: MCPTransport = None
+    ):
+        self.config = config or MCPClientConfig(server_url=server_url)
+        self.server_url = server_url or self.config.server_url
+        if transport is None:
+            transport = create_transport(
+                self.config.model_copy(update={"server_url": self.server_url})
+            )
+        self.transport = transport
         self._connected = False
+        self._set_skills(())
+        
+        if result_cache is None and self.config.cache_enabled:
+            result_cache = TTLSkillResultCache(
+                ttls=self.config.cache_ttls,
+                max_entries=self.config.cache_max_entries,
+                max_bytes=self.config.cache_max_bytes
+            )
+        self.result_cache: Optional[SkillResultCache] = result_cache
+        
+        # Single-flight: one shared execution per identical in-flight call
+        # Cache key -> (execution, the deadline it runs under)
+        self._in_flight: Dict[str, Tuple["asyncio.Future[MCPSkillResult]", Optional[float]]] = {}
+        self.executions = 0
+        self.batches = 0
+        self.coalesced_calls = 0
+        
+        # Resilience: per-skill breakers and latency (for hedging)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, LatencyHistogram] = {}
+        self.retries = 0
+        self.hedged_calls = 0
+        self.short_circuited_calls = 0
+        self.deadline_exceeded_calls = 0
+        
+        # Bounds concurrent executions; excess calls queue or are rejected
+        self.admission = AdmissionController(
+            max_concurrent=self.config.max_concurrent_calls,
+            max_queued=self.config.max_queued_calls,
+            skill_limits=self.config.skill_call_limits,
+            skill_queue_limit=self.config.skill_queue_limit,
+            batch_min_share=self.config.batch_min_share,
+            min_retry_after=self.config.admission_retry_after
+        )
     
     async def connect(self) -> bool:
         """Connect to MCP server"""
+        await self.transport.connect()
         self._connected = True
-        logger.info("MCP Client connected (simulated)")
+        logger.info(f"MCP Client connected ({self.transport.name})")
         await self._discover_skills()
         return self._connected
     
     async def disconnect(self):
         """Disconnect from MCP server"""
         self._connected = False
-        self._skills_cache = []
+        await self.transport.close()
+        self._set_skills(())
         logger.info("MCP Client disconnected")
     
     async def _discover_skills(self):
         """Discover available skills from server"""
-        # In a real implementation, this would call the server's list_skills endpoint
-        # For demo, we use the skills module directly
-        from mcp_server.skills import get_skill_definitions, get_all_skills
-        
-        definitions = get_skill_definitions()
-        self._skills_cache = [MCPSkill.from_definition(d) for d in definitions]
+        response = await self.transport.request("skills/list")
+        self._set_skills(MCPSkill.from_definition(d) for d in response["skills"])
         logger.info(f"Discovered {len(self._skills_cache)} skills")
     
-    def list_skills(self) -> List[MCPSkill]:
-        """List all available skills"""
-        return self._skills_cache.copy()
+    def _set_skills(self, skills):
+        """
+        Replace the discovered skill set and rebuild its lookup indexes.
+        
+        The indexes are immutable snapshots, so readers on the request hot
+        path get O(1) lookups and can hold on to a listing without copying.
+        """
+        self._skills_cache: Tuple[MCPSkill, ...] = tuple(skills)
+        self._skill_names: Tuple[str, ...] = tuple(s.name for s in self._skills_cache)
+        self._skills_by_name: Mapping[str, MCPSkill] = MappingProxyType(
+            {s.name: s for s in self._skills_cache}
+        )
+        by_category: Dict[str, List[MCPSkill]] = {}
+        for skill in self._skills_cache:
+            by_category.setdefault(skill.category, []).append(skill)
+        self._skills_by_category: Mapping[str, Tuple[MCPSkill, ...]] = MappingProxyType(
+            {category: tuple(skills) for category, skills in by_category.items()}
+        )
+        # Compile input validators once per discovery, not per call
+        self._validators: Dict[str, SkillInputValidator] = {
+            s.name: compile_validator(s.input_schema) for s in self._skills_cache
+        }
+        # Bumped whenever the discovered skill set changes
+        self.catalog_version = next(_catalog_versions)
+    
+    def list_skills(self) -> Tuple[MCPSkill, ...]:
+        """List all available skills (immutable snapshot)"""
+        return self._skills_cache
     
-    def list_skill_names(self) -> List[str]:
+    def list_skill_names(self) -> Tuple[str, ...]:
         """List names of all available skills"""
-        return [s.name for s in self._skills_cache]
+        return self._skill_names
     
     def get_skill(self, name: str) -> Optional[MCPSkill]:
         """Get a specific skill by name"""
-        for skill in self._skills_cache:
-            if skill.name == name:
-                return skill
-        return None
+        return self._skills_by_name.get(name)
     
-    def get_skills_by_category(self, category: MCPSkillCategory) -> List[MCPSkill]:
+    def get_skills_by_category(
+        self,
+        category: Union[MCPSkillCategory, str]
+    ) -> Tuple[MCPSkill, ...]:
         """Get skills filtered by category"""
-        return [s for s in self._skills_cache if s.category == category.value]
+        if isinstance(category, MCPSkillCategory):
+            category = category.value
+        return self._skills_by_category.get(category, ())
     
     async def call_skill(
         self,
         skill_name: str,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        priority: Priority = Priority.INTERACTIVE
     ) -> MCPSkillResult:
         """
         Execute a skill with the given parameters.
@@ -124,76 +233,644 @@ class MCPClient:
         Args:
             skill_name: Name of the skill to execute
             parameters: Input parameters for the skill
+            priority: Scheduling priority when the client is busy
             
         Returns:
             MCPSkillResult with execution result
         """
+        parameters, result = self._prepare_call(skill_name, parameters)
+        if result is not None:
+            return result
+        
+        if not self.config.coalesce_calls:
+            return await self._execute_skill(skill_name, parameters, priority=priority)
+        
+        # Identical calls already in flight share one execution. The
+        # execution runs as its own task and every waiter (including the
+        # one that started it) awaits it through a shield, so cancelling a
+        # waiter never cancels the shared work.
+        key = make_cache_key(skill_name, parameters)
+        task = self._joinable_in_flight(key)
+        if task is not None:
+            self.coalesced_calls += 1
+            logger.debug(f"Skill '{skill_name}' coalesced with in-flight call")
+            result = await self._await_shared(skill_name, task)
+            return replace(result, result=copy.deepcopy(result.result))
+        
+        task = asyncio.ensure_future(
+            self._execute_skill(skill_name, parameters, priority=priority)
+        )
+        self._track_in_flight(key, task)
+        return await asyncio.shield(task)
+    
+    def _joinable_in_flight(self, key: str) -> "Optional[asyncio.Future[MCPSkillResult]]":
+        """
+        The in-flight execution of ``key``, if this caller may share it.
+        
+        An execution inherits the deadline of the caller that started it,
+        so only callers whose own deadline is no later join it; a caller
+        with a longer budget starts a fresh execution instead of
+        inheriting an earlier deadline's failure.
+        """
+        entry = self._in_flight.get(key)
+        if entry is None:
+            return None
+        future, deadline = entry
+        mine = get_deadline()
+        if deadline is not None and (mine is None or mine > deadline):
+            return None
+        return future
+    
+    def _track_in_flight(self, key: str, future: "asyncio.Future[MCPSkillResult]") -> None:
+        entry = (future, get_deadline())
+        self._in_flight[key] = entry
+        
+        def untrack(_) -> None:
+            # A later execution with a longer deadline may have replaced this one
+            if self._in_flight.get(key) is entry:
+                del self._in_flight[key]
+        
+        future.add_done_callback(untrack)
+    
+    async def _await_shared(
+        self,
+        skill_name: str,
+        future: "asyncio.Future[MCPSkillResult]"
+    ) -> MCPSkillResult:
+        """Wait for another caller's execution, but no longer than our own deadline"""
         try:
-            from mcp_server.skills import get_skill
-            skill = get_skill(skill_name)
-            
-            if not skill:
-                return MCPSkillResult(
+            return await asyncio.wait_for(asyncio.shield(future), remaining())
+        except asyncio.TimeoutError:
+            return self._deadline_result(skill_name)
+    
+    def _prepare_call(
+        self,
+        skill_name: str,
+        parameters: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[MCPSkillResult]]:
+        """
+        Validate parameters and look the call up in the result cache.
+        
+        Returns the normalized parameters and, if the call needs no
+        execution (invalid input or a cache hit), its result.
+        """
+        # Reject bad input before it reaches the server; coercion also
+        # normalizes parameters so equivalent calls share cache entries
+        validator = self._validators.get(skill_name)
+        if validator is not None:
+            try:
+                parameters = validator(parameters)
+            except SkillValidationError as e:
+                return parameters, MCPSkillResult(
                     success=False,
                     skill_name=skill_name,
-                    error=f"Skill '{skill_name}' not found"
+                    error=f"Invalid parameters: {e}"
                 )
-            
-            # Execute the skill
-            result = await skill.execute(**parameters)
-            
-            logger.info(f"Skill '{skill_name}' executed successfully")
-            
-            return MCPSkillResult(
-                success=True,
-                skill_name=skill_name,
-                result=result
+        
+        if self.result_cache is not None:
+            cached = self.result_cache.get(skill_name, parameters)
+            if cached is not None:
+                logger.debug(f"Skill '{skill_name}' served from cache")
+                return parameters, MCPSkillResult(
+                    success=True,
+                    skill_name=skill_name,
+                    result=cached
+                )
+        
+        return parameters, None
+    
+    async def _execute_skill(
+        self,
+        skill_name: str,
+        parameters: Dict[str, Any],
+        attempts: Optional[int] = None,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> MCPSkillResult:
+        """
+        Run a skill on the MCP server and populate the result cache on success.
+        
+        The call travels over the client's transport; concurrent calls are
+        multiplexed over one persistent connection. Execution waits for an
+        admission slot at ``priority`` (see ``AdmissionController``). Each attempt is bounded
+        by the skill's timeout and, with ``config.hedge_requests``, hedged
+        once it outlives the skill's p95 latency. Timeouts, transport errors
+        and transient skill failures are retried (``attempts``, default
+        ``config.retry_attempts``) with jittered exponential backoff. Every
+        failed attempt counts towards the skill's circuit breaker, and an
+        open circuit fails the call without contacting the server.
+        
+        The request deadline (``utils.deadline``) bounds all of it: waiting
+        for a slot, every attempt and the retries. Once the budget is
+        spent the call fails straight away without touching the server,
+        and the skill's breaker is not charged for it.
+        """
+        if expired():
+            return self._deadline_result(skill_name)
+        try:
+            async with self.admission.slot(skill_name, priority, timeout=remaining()):
+                return await self._execute_admitted(skill_name, parameters, attempts)
+        except AdmissionRejected as e:
+            logger.warning(str(e))
+            return self._rejected_result(e)
+        except asyncio.TimeoutError:
+            # Still queued for a slot when the deadline passed
+            return self._deadline_result(skill_name)
+    
+    async def _execute_admitted(
+        self,
+        skill_name: str,
+        parameters: Dict[str, Any],
+        attempts: Optional[int]
+    ) -> MCPSkillResult:
+        self.executions += 1
+        retrying = AsyncRetrying(
+            stop=stop_any(
+                stop_after_attempt(attempts or self.config.retry_attempts),
+                lambda _: expired()
+            ),
+            wait=wait_random_exponential(
+                multiplier=self.config.retry_backoff,
+                max=self.config.retry_backoff_max
+            ),
+            retry=(
+                retry_if_exception_type(_RETRYABLE_ERRORS)
+                & retry_if_not_exception_type(DeadlineExceeded)
+            ),
+            before_sleep=self._before_retry,
+            reraise=True
+        )
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    response = await self._attempt_skill(skill_name, parameters)
+        except CircuitOpenError as e:
+            self.short_circuited_calls += 1
+            return MCPSkillResult(success=False, skill_name=skill_name, error=str(e))
+        except DeadlineExceeded:
+            return self._deadline_result(skill_name)
+        except RetryableSkillFailure as e:
+            response = e.response
+        except Exception as e:
+            error = self._error_message(skill_name, e)
+            logger.error(f"Error executing skill '{skill_name}': {error}")
+            return MCPSkillResult(success=False, skill_name=skill_name, error=error)
+        return self._handle_response(skill_name, parameters, response)
+    
+    async def _attempt_skill(
+        self,
+        skill_name: str,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """One (possibly hedged) attempt, reported to the skill's circuit breaker"""
+        breaker = self._circuit_breaker(skill_name)
+        if not breaker.allow():
+            raise CircuitOpenError(skill_name, breaker.retry_after())
+        try:
+            response, hedged = await hedged_call(
+                lambda: self._send_skill_call(skill_name, parameters),
+                timeout=bound_timeout(self._skill_timeout(skill_name)),
+                hedge_after=self._hedge_delay(skill_name)
+            )
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except asyncio.TimeoutError:
+            if expired(tolerance=0.01):
+                # Cut short by the request's budget, not the skill's health
+                breaker.release_probe()
+                raise DeadlineExceeded(f"skill '{skill_name}'") from None
+            breaker.record_failure()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        if hedged:
+            self.hedged_calls += 1
+        if is_retryable_response(response):
+            breaker.record_failure()
+            raise RetryableSkillFailure(response)
+        if response.get("success"):
+            breaker.record_success()
+        else:
+            # Bad input or a spent deadline says nothing about the skill's health
+            breaker.release_probe()
+        return response
+    
+    async def _send_skill_call(
+        self,
+        skill_name: str,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        response = await self.transport.request(
+            "skills/call", self._call_params(skill_name, parameters)
+        )
+        latency = self._latencies.get(skill_name)
+        if latency is None:
+            latency = self._latencies[skill_name] = LatencyHistogram()
+        latency.record((time.perf_counter() - started) * 1000)
+        return response
+    
+    def _before_retry(self, retry_state: RetryCallState) -> None:
+        self.retries += 1
+        logger.warning(
+            f"Skill call attempt {retry_state.attempt_number} failed "
+            f"({retry_state.outcome.exception()!r}), retrying"
+        )
+    
+    def _circuit_breaker(self, skill_name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(skill_name)
+        if breaker is None:
+            breaker = self._breakers[skill_name] = CircuitBreaker(
+                failure_threshold=self.config.circuit_failure_threshold,
+                reset_timeout=self.config.circuit_reset_timeout
             )
+        return breaker
+    
+    def _skill_timeout(self, skill_name: str) -> float:
+        return self.config.skill_timeouts.get(skill_name, self.config.timeout)
+    
+    @staticmethod
+    def _call_params(skill_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """``skills/call`` params; the remaining budget lets the server give up too"""
+        params = {"name": skill_name, "arguments": parameters}
+        budget = remaining()
+        if budget is not None:
+            params["timeout"] = max(0.0, budget)
+        return params
+    
+    def _hedge_delay(self, skill_name: str) -> Optional[float]:
+        """Seconds to wait before hedging, once enough latencies are known"""
+        if not self.config.hedge_requests:
+            return None
+        latency = self._latencies.get(skill_name)
+        if latency is None or latency.total < self.config.hedge_min_samples:
+            return None
+        return latency.percentile(self.config.hedge_percentile) / 1000
+    
+    def _error_message(self, skill_name: str, error: BaseException) -> str:
+        if isinstance(error, asyncio.TimeoutError):
+            return f"Skill '{skill_name}' timed out after {self._skill_timeout(skill_name)}s"
+        return str(error)
+    
+    async def _execute_skills_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        deliver: Callable[[int, MCPSkillResult], None],
+        priority: Priority = Priority.INTERACTIVE
+    ) -> None:
+        """
+        Run several skills with as few batch frames to the MCP server as
+        admission control allows, handing each result to ``deliver`` with
+        its index as soon as it is known.
+        
+        Calls are admitted in order. Those admitted without waiting share
+        a frame; when a call has to wait for a slot, the frame built so
+        far is sent first, so a batch never waits on slots it holds
+        itself. Once admission rejects a call, the rest of the batch is
+        rejected too, except when the call was preempted by an
+        interactive call: only that call is rejected, and the rest wait
+        for room in the queue. Skills with an open circuit are skipped,
+        and calls that fail in a frame count towards their breaker and
+        are retried one by one.
+        """
+        frame: List[int] = []
+        frames: List[asyncio.Future] = []
+        preempted = False
+        
+        def flush():
+            if frame:
+                frames.append(asyncio.ensure_future(
+                    self._execute_frame(calls, list(frame), deliver, priority)
+                ))
+                frame.clear()
+        
+        try:
+            for index, (skill_name, _) in enumerate(calls):
+                if expired():
+                    for rest in range(index, len(calls)):
+                        deliver(rest, self._deadline_result(calls[rest][0]))
+                    break
+                breaker = self._circuit_breaker(skill_name)
+                if not breaker.allow():
+                    self.short_circuited_calls += 1
+                    deliver(index, MCPSkillResult(
+                        success=False,
+                        skill_name=skill_name,
+                        error=str(CircuitOpenError(skill_name, breaker.retry_after()))
+                    ))
+                    continue
+                if not self.admission.try_acquire(skill_name, priority):
+                    flush()
+                    try:
+                        if preempted:
+                            # Interactive calls just took the queue; queue behind them
+                            await self.admission.wait_for_queue_room(timeout=remaining())
+                            preempted = False
+                        await self.admission.acquire(skill_name, priority, timeout=remaining())
+                    except AdmissionRejected as e:
+                        breaker.release_probe()
+                        if e.preempted:
+                            logger.warning(f"{e} (batch call {index})")
+                            deliver(index, self._rejected_result(e, skill_name=skill_name))
+                            preempted = True
+                            continue
+                        logger.warning(f"{e} ({len(calls) - index} calls of batch)")
+                        for rest in range(index, len(calls)):
+                            deliver(rest, self._rejected_result(e, skill_name=calls[rest][0]))
+                        break
+                    except asyncio.TimeoutError:
+                        breaker.release_probe()
+                        for rest in range(index, len(calls)):
+                            deliver(rest, self._deadline_result(calls[rest][0]))
+                        break
+                frame.append(index)
+            flush()
+        finally:
+            if frames:
+                await asyncio.gather(*frames)
+    
+    async def _execute_frame(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        indexes: List[int],
+        deliver: Callable[[int, MCPSkillResult], None],
+        priority: Priority
+    ) -> None:
+        """Send admitted calls as one batch frame, delivering results as they arrive"""
+        self.batches += 1
+        self.executions += len(indexes)
+        started = time.monotonic()
+        released = set()
+        retries: List[asyncio.Future] = []
+        
+        def on_response(position: int, response: Any) -> None:
+            index = indexes[position]
+            skill_name, parameters = calls[index]
+            released.add(position)
+            self.admission.release(skill_name, time.monotonic() - started, priority)
             
+            breaker = self._circuit_breaker(skill_name)
+            if isinstance(response, asyncio.TimeoutError) and expired(tolerance=0.01):
+                breaker.release_probe()
+                deliver(index, self._deadline_result(skill_name))
+            elif isinstance(response, BaseException) or is_retryable_response(response):
+                breaker.record_failure()
+                if self.config.retry_attempts > 1:
+                    self.retries += 1
+                    retries.append(asyncio.ensure_future(
+                        self._retry_frame_call(index, calls[index], deliver, priority)
+                    ))
+                elif isinstance(response, BaseException):
+                    deliver(index, MCPSkillResult(
+                        success=False,
+                        skill_name=skill_name,
+                        error=self._error_message(skill_name, response)
+                    ))
+                else:
+                    deliver(index, self._handle_response(skill_name, parameters, response))
+            else:
+                if response.get("success"):
+                    breaker.record_success()
+                else:
+                    breaker.release_probe()
+                deliver(index, self._handle_response(skill_name, parameters, response))
+        
+        try:
+            await self.transport.request_batch(
+                [
+                    ("skills/call", self._call_params(*calls[i]))
+                    for i in indexes
+                ],
+                timeouts=[bound_timeout(self._skill_timeout(calls[i][0])) for i in indexes],
+                on_response=on_response
+            )
         except Exception as e:
-            logger.error(f"Error executing skill '{skill_name}': {e}")
+            # The frame never went out; fail whatever has not been answered
+            for position in range(len(indexes)):
+                if position not in released:
+                    on_response(position, e)
+        finally:
+            for position in range(len(indexes)):
+                if position not in released:
+                    self.admission.release(
+                        calls[indexes[position]][0], time.monotonic() - started, priority
+                    )
+        
+        if retries:
+            await asyncio.gather(*retries)
+    
+    async def _retry_frame_call(
+        self,
+        index: int,
+        call: Tuple[str, Dict[str, Any]],
+        deliver: Callable[[int, MCPSkillResult], None],
+        priority: Priority
+    ) -> None:
+        skill_name, parameters = call
+        deliver(index, await self._execute_skill(
+            skill_name,
+            parameters,
+            attempts=self.config.retry_attempts - 1,
+            priority=priority
+        ))
+    
+    def _deadline_result(self, skill_name: str) -> MCPSkillResult:
+        self.deadline_exceeded_calls += 1
+        return MCPSkillResult(
+            success=False,
+            skill_name=skill_name,
+            error=str(DeadlineExceeded(f"skill '{skill_name}'"))
+        )
+    
+    def _rejected_result(
+        self,
+        error: AdmissionRejected,
+        skill_name: Optional[str] = None
+    ) -> MCPSkillResult:
+        return MCPSkillResult(
+            success=False,
+            skill_name=skill_name or error.skill_name,
+            error=str(error),
+            retry_after=error.retry_after
+        )
+    
+    def _handle_response(
+        self,
+        skill_name: str,
+        parameters: Dict[str, Any],
+        response: Dict[str, Any]
+    ) -> MCPSkillResult:
+        """Turn a ``skills/call`` response into a result, caching successes"""
+        if not response.get("success"):
             return MCPSkillResult(
                 success=False,
                 skill_name=skill_name,
-                error=str(e)
+                error=response.get("error")
             )
+        
+        # In-process skills answer with frozen catalog views; callers get
+        # the plain dicts and lists every other transport decodes
+        result = unfreeze(response.get("result"))
+        logger.info(f"Skill '{skill_name}' executed successfully")
+        
+        if self.result_cache is not None and result is not None:
+            self.result_cache.set(skill_name, parameters, result)
+        
+        return MCPSkillResult(
+            success=True,
+            skill_name=skill_name,
+            result=result
+        )
     
     async def call_skills_parallel(
         self,
-        calls: List[Dict[str, Any]]
+        calls: List[Dict[str, Any]],
+        priority: Priority = Priority.INTERACTIVE
     ) -> List[MCPSkillResult]:
         """
         Execute multiple skills in parallel.
         
+        Calls not answered by validation or the result cache travel to the
+        server together as one JSON-RPC batch frame; the server runs them
+        concurrently and each result is delivered as soon as it arrives.
+        
         Args:
             calls: List of {"skill": skill_name, "parameters": params} dictionaries
+            priority: Scheduling priority; bulk jobs should pass ``Priority.BATCH``
             
         Returns:
-            List of MCPSkillResult objects
+            List of MCPSkillResult objects, in the same order as ``calls``
         """
-        tasks = []
-        for call in calls:
+        results: List[Optional[MCPSkillResult]] = [None] * len(calls)
+        ready, waiters = self._start_parallel(calls, priority)
+        for index, result in ready:
+            results[index] = result
+        for index, future, shared in waiters:
+            results[index] = await self._await_parallel(calls[index], future, shared)
+        return results
+    
+    async def iter_skills_parallel(
+        self,
+        calls: List[Dict[str, Any]],
+        priority: Priority = Priority.INTERACTIVE
+    ) -> AsyncIterator[Tuple[int, MCPSkillResult]]:
+        """
+        Execute multiple skills in parallel, yielding results as they complete.
+        
+        Runs exactly like ``call_skills_parallel`` but yields
+        ``(index, result)`` pairs in completion order instead of returning
+        one list, so callers can stream results without waiting for the
+        slowest call. Closing the iterator early stops waiting but does
+        not cancel executions shared with other callers.
+        """
+        ready, waiters = self._start_parallel(calls, priority)
+        for index, result in ready:
+            yield index, result
+        
+        pending = {
+            asyncio.ensure_future(self._await_parallel(calls[index], future, shared)): index
+            for index, future, shared in waiters
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield pending.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _start_parallel(
+        self,
+        calls: List[Dict[str, Any]],
+        priority: Priority
+    ) -> Tuple[
+        List[Tuple[int, MCPSkillResult]],
+        List[Tuple[int, "asyncio.Future[MCPSkillResult]", bool]]
+    ]:
+        """
+        Validate, cache-check and coalesce ``calls``, and start one batch
+        execution for the rest.
+        
+        Returns the calls answered without execution as ``(index, result)``
+        and the others as ``(index, future, shared)``; shared futures
+        belong to another caller's identical in-flight call.
+        """
+        ready: List[Tuple[int, MCPSkillResult]] = []
+        waiters: List[Tuple[int, "asyncio.Future[MCPSkillResult]", bool]] = []
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        batch_futures: List["asyncio.Future[MCPSkillResult]"] = []
+        loop = asyncio.get_running_loop()
+        
+        for index, call in enumerate(calls):
             skill_name = call.get("skill") or call.get("name")
-            parameters = call.get("parameters") or {}
-            tasks.append(self.call_skill(skill_name, parameters))
+            parameters, result = self._prepare_call(skill_name, call.get("parameters") or {})
+            if result is not None:
+                ready.append((index, result))
+                continue
+            
+            if self.config.coalesce_calls:
+                key = make_cache_key(skill_name, parameters)
+                future = self._joinable_in_flight(key)
+                if future is not None:
+                    # Duplicate of an in-flight call, possibly in this batch
+                    self.coalesced_calls += 1
+                    waiters.append((index, future, True))
+                    continue
+                future = loop.create_future()
+                self._track_in_flight(key, future)
+            else:
+                future = loop.create_future()
+            batch.append((skill_name, parameters))
+            batch_futures.append(future)
+            waiters.append((index, future, False))
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if batch:
+            # Runs as its own task so cancelling this caller never strands
+            # coalesced waiters from other callers
+            asyncio.ensure_future(self._resolve_batch(batch, batch_futures, priority))
         
-        # Convert exceptions to results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                call = calls[i]
-                skill_name = call.get("skill") or call.get("name")
-                processed_results.append(MCPSkillResult(
-                    success=False,
-                    skill_name=skill_name,
-                    error=str(result)
-                ))
+        return ready, waiters
+    
+    async def _await_parallel(
+        self,
+        call: Dict[str, Any],
+        future: "asyncio.Future[MCPSkillResult]",
+        shared: bool
+    ) -> MCPSkillResult:
+        skill_name = call.get("skill") or call.get("name")
+        try:
+            if shared:
+                result = await self._await_shared(skill_name, future)
             else:
-                processed_results.append(result)
+                result = await asyncio.shield(future)
+        except Exception as e:
+            return MCPSkillResult(
+                success=False,
+                skill_name=skill_name,
+                error=str(e)
+            )
+        if shared:
+            result = replace(result, result=copy.deepcopy(result.result))
+        return result
+    
+    async def _resolve_batch(
+        self,
+        batch: List[Tuple[str, Dict[str, Any]]],
+        futures: List["asyncio.Future[MCPSkillResult]"],
+        priority: Priority
+    ) -> None:
+        def deliver(index: int, result: MCPSkillResult) -> None:
+            if not futures[index].done():
+                futures[index].set_result(result)
         
-        return processed_results
+        try:
+            await self._execute_skills_batch(batch, deliver, priority)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
     
     async def call_skills_sequential(
         self,
@@ -229,16 +906,46 @@ class MCPClient:
         
         return results
     
+    async def get_server_metrics(self, skill_name: Optional[str] = None) -> Dict[str, Any]:
+        """Get per-skill call aggregates recorded by the MCP server"""
+        params = {"skill_name": skill_name} if skill_name else {}
+        return await self.transport.request("server/metrics", params)
+    
+    async def get_call_history(
+        self,
+        limit: int = 50,
+        skill_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get the MCP server's most recent skill calls, newest first"""
+        params: Dict[str, Any] = {"limit": limit}
+        if skill_name:
+            params["skill_name"] = skill_name
+        return await self.transport.request("server/history", params)
+    
     def is_connected(self) -> bool:
         """Check if client is connected to server"""
-        return self._connected
+        return self._connected and self.transport.connected
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get usage statistics"""
         return {
-            "connected": self._connected,
+            "connected": self.is_connected(),
+            "transport": self.transport.name,
             "skills_count": len(self._skills_cache),
-            "skills": self.list_skill_names()
+            "skills": list(self._skill_names),
+            "executions": self.executions,
+            "batches": self.batches,
+            "coalesced_calls": self.coalesced_calls,
+            "retries": self.retries,
+            "hedged_calls": self.hedged_calls,
+            "short_circuited_calls": self.short_circuited_calls,
+            "deadline_exceeded_calls": self.deadline_exceeded_calls,
+            "admission": self.admission.get_statistics(),
+            "circuit_breakers": {
+                name: breaker.to_dict() for name, breaker in self._breakers.items()
+            },
+            "in_flight": len(self._in_flight),
+            "cache": self.result_cache.get_statistics() if self.result_cache else None
         }
 
 
@@ -254,10 +961,13 @@ def get_mcp_client() -> MCPClient:
     return _mcp_client
 
 
-async def init_mcp_client(server_url: str = None) -> MCPClient:
+async def init_mcp_client(
+    server_url: str = None,
+    config: MCPClientConfig = None
+) -> MCPClient:
     """Initialize and connect the global MCP client"""
     global _mcp_client
-    _mcp_client = MCPClient(server_url)
+    _mcp_client = MCPClient(server_url, config=config)
     await _mcp_client.connect()
     return _mcp_client
 
@@ -0,0 +1,528 @@
+"""
+MCP Client transports
+
+How ``MCPClient`` reaches the MCP server:
+
+- ``InProcessTransport``: calls the process-global ``MCPServer`` directly
+  (no serialization); the default for embedded use and tests.
+- ``StdioTransport``: starts ``python -m mcp_server --transport stdio`` as
+  a child process and speaks newline-delimited JSON-RPC over its pipes. If
+  the child exits, the next request starts a new one (with backoff).
+- ``SSETransport``: connects to a standalone server started with
+  ``python -m mcp_server --transport sse``.
+
+The out-of-process transports keep one persistent connection and
+multiplex every concurrent request over it: each request gets an id and a
+future, a single reader task resolves futures as responses arrive (in any
+order), and nothing is serialized behind a slow call. ``request_batch``
+sends many requests in a single JSON-RPC batch frame. A request whose
+response has not arrived within the transport's ``timeout`` fails with
+``asyncio.TimeoutError``.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import sys
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from mcp_server.config import MCPClientConfig
+from mcp_server.protocol import (
+    PROTOCOL_VERSION,
+    JSONRPCError,
+    MCPDispatcher,
+    decode_message,
+    encode_message,
+    make_request
+)
+
+logger = logging.getLogger(__name__)
+
+# (method, params) pairs for MCPTransport.request_batch
+BatchRequests = Sequence[Tuple[str, Optional[Dict[str, Any]]]]
+# Called with (position, result or exception) as each batch response arrives
+ResponseCallback = Callable[[int, Any], None]
+
+# Directory holding the mcp_server package, put on the child's PYTHONPATH
+_SRC_DIR = Path(__file__).resolve().parents[1]
+# Upper bound on one framed message (a line on stdio)
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+# Delay before retrying a failed server restart; doubles per failure up to the cap
+RESTART_BACKOFF = 0.1
+MAX_RESTART_BACKOFF = 5.0
+
+
+class MCPTransportError(ConnectionError):
+    """The connection to the MCP server could not be used"""
+
+
+def _with_timeouts(awaitables: List[Any], timeouts: Optional[Sequence[float]]) -> List[Any]:
+    if timeouts is None:
+        return awaitables
+    return [asyncio.wait_for(a, t) for a, t in zip(awaitables, timeouts)]
+
+
+async def _gather_responses(
+    awaitables: List[Any],
+    on_response: Optional[ResponseCallback]
+) -> List[Any]:
+    """``gather(return_exceptions=True)`` that reports each outcome as it lands"""
+    if on_response is None:
+        return await asyncio.gather(*awaitables, return_exceptions=True)
+
+    async def report(position: int, awaitable: Any) -> Any:
+        try:
+            outcome = await awaitable
+        except Exception as e:
+            outcome = e
+        on_response(position, outcome)
+        return outcome
+
+    return await asyncio.gather(*(report(i, a) for i, a in enumerate(awaitables)))
+
+
+class MCPTransport(ABC):
+    """A connection to an MCP server that carries JSON-RPC requests"""
+
+    name: str = ""
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Open the connection and perform the protocol handshake"""
+
+    @abstractmethod
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a request and wait for its result.
+
+        Raises ``JSONRPCError`` for error responses and
+        ``MCPTransportError`` if the connection is unusable.
+        """
+
+    async def request_batch(
+        self,
+        requests: BatchRequests,
+        timeouts: Optional[Sequence[float]] = None,
+        on_response: Optional[ResponseCallback] = None
+    ) -> List[Any]:
+        """
+        Send several requests and wait for all of them.
+
+        Returns one entry per request, in order: its result, or the
+        exception it failed with (``asyncio.TimeoutError`` once the
+        request's entry in ``timeouts`` has elapsed). ``on_response`` is
+        called with each entry's position and outcome as soon as it is
+        known, for callers that act on results before the batch is done.
+        """
+        calls = [self.request(method, params) for method, params in requests]
+        return await _gather_responses(_with_timeouts(calls, timeouts), on_response)
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the connection; pending requests fail"""
+
+    @property
+    @abstractmethod
+    def connected(self) -> bool:
+        """Whether requests can currently be sent"""
+
+
+class InProcessTransport(MCPTransport):
+    """Dispatches requests to an ``MCPServer`` in this process"""
+
+    name = "inprocess"
+
+    def __init__(self, server=None):
+        # None: resolve the global server on each call, so it can be replaced
+        self._server = server
+        self._dispatcher: Optional[MCPDispatcher] = None
+        self._connected = False
+
+    async def connect(self) -> None:
+        self._connected = True
+
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        server = self._server
+        if server is None:
+            from mcp_server.server import get_mcp_server
+            server = get_mcp_server()
+        if self._dispatcher is None or self._dispatcher.server is not server:
+            self._dispatcher = MCPDispatcher(server)
+        return await self._dispatcher.call(method, params)
+
+    async def close(self) -> None:
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+
+class MultiplexedTransport(MCPTransport):
+    """
+    Base for transports that pipeline requests over one connection.
+
+    Subclasses open the connection, send encoded messages and feed every
+    decoded incoming message to ``_on_message``.
+    """
+
+    def __init__(self, timeout: float = 30.0):
+        self.timeout = timeout
+        self.server_info: Dict[str, Any] = {}
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def _send(self, message: Any) -> None:
+        """Write one message (or batch frame) to the connection"""
+
+    async def _ensure_connected(self) -> None:
+        """Called before each send; fails if the connection is unusable"""
+        if not self.connected:
+            raise MCPTransportError(f"{self.name} transport is not connected")
+
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        await self._ensure_connected()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send(make_request(request_id, method, params))
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def request_batch(
+        self,
+        requests: BatchRequests,
+        timeouts: Optional[Sequence[float]] = None,
+        on_response: Optional[ResponseCallback] = None
+    ) -> List[Any]:
+        """Send all requests as one JSON-RPC batch frame"""
+        if not requests:
+            return []
+        await self._ensure_connected()
+        if timeouts is None:
+            timeouts = [self.timeout] * len(requests)
+        loop = asyncio.get_running_loop()
+        ids, futures, messages = [], [], []
+        for method, params in requests:
+            request_id = next(self._ids)
+            future = loop.create_future()
+            self._pending[request_id] = future
+            ids.append(request_id)
+            futures.append(future)
+            messages.append(make_request(request_id, method, params))
+        try:
+            await self._send(messages)
+            # Responses arrive individually, in completion order
+            return await _gather_responses(_with_timeouts(futures, timeouts), on_response)
+        finally:
+            for request_id in ids:
+                self._pending.pop(request_id, None)
+
+    @property
+    def pending_requests(self) -> int:
+        return len(self._pending)
+
+    def _on_message(self, message: Any) -> None:
+        """Resolve the future waiting on a response"""
+        if not isinstance(message, dict):
+            logger.warning(f"Ignoring malformed MCP message: {message!r}")
+            return
+        future = self._pending.get(message.get("id"))
+        if future is None:
+            if "error" in message:
+                logger.warning(f"MCP server error: {message['error']}")
+            else:
+                # Expected for requests abandoned after a timeout or a won hedge
+                logger.debug(f"Ignoring MCP response for unknown id {message.get('id')!r}")
+            return
+        if future.done():
+            return
+        if "error" in message:
+            future.set_exception(JSONRPCError.from_dict(message["error"]))
+        else:
+            future.set_result(message.get("result"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _handshake(self) -> None:
+        self.server_info = await self.request("initialize", {"protocolVersion": PROTOCOL_VERSION})
+
+    async def _stop_reader(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader_task = None
+
+
+def default_server_command() -> List[str]:
+    return [sys.executable, "-m", "mcp_server", "--transport", "stdio"]
+
+
+class StdioTransport(MultiplexedTransport):
+    """
+    Runs the MCP server as a child process and talks JSON-RPC over its pipes.
+
+    Requests in flight when the child exits fail with ``MCPTransportError``
+    (which ``MCPClient`` retries); the next request after that starts a new
+    child. Restarts that fail are retried no sooner than ``RESTART_BACKOFF``
+    seconds later, doubling up to ``MAX_RESTART_BACKOFF``, until ``close``.
+    """
+
+    name = "stdio"
+
+    def __init__(
+        self,
+        command: Optional[Sequence[str]] = None,
+        timeout: float = 30.0,
+        env: Optional[Dict[str, str]] = None
+    ):
+        super().__init__(timeout)
+        self.command = list(command or default_server_command())
+        self.env = env
+        self._process: Optional[asyncio.subprocess.Process] = None
+        # Set by connect, cleared by close: whether a dead child is restarted
+        self._started = False
+        self._restart_lock = asyncio.Lock()
+        self._restart_delay = RESTART_BACKOFF
+        self._next_restart = 0.0
+        self.restarts = 0
+
+    async def connect(self) -> None:
+        await self._spawn()
+        self._started = True
+
+    async def _spawn(self) -> None:
+        env = dict(os.environ if self.env is None else self.env)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(_SRC_DIR), env.get("PYTHONPATH")) if p
+        )
+        self._process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=env,
+            limit=MAX_MESSAGE_BYTES
+        )
+        self._reader_task = asyncio.create_task(self._read_loop(self._process))
+        try:
+            await self._handshake()
+        except BaseException:
+            await self._stop_process()
+            raise
+        logger.info(f"MCP server process started (pid {self._process.pid})")
+
+    async def _ensure_connected(self) -> None:
+        if self.connected:
+            return
+        if not self._started:
+            raise MCPTransportError("stdio transport is not connected")
+        async with self._restart_lock:
+            # Another request may have restarted the server while we waited
+            if self.connected:
+                return
+            loop = asyncio.get_running_loop()
+            if loop.time() < self._next_restart:
+                raise MCPTransportError("MCP server process exited; restart is backing off")
+            returncode = self._process.returncode if self._process is not None else None
+            logger.warning(f"MCP server process exited (code {returncode}), restarting it")
+            await self._stop_process()
+            try:
+                await self._spawn()
+            except Exception as e:
+                self._next_restart = loop.time() + self._restart_delay
+                self._restart_delay = min(self._restart_delay * 2, MAX_RESTART_BACKOFF)
+                raise MCPTransportError(f"Could not restart the MCP server process: {e}") from e
+            self._restart_delay = RESTART_BACKOFF
+            self.restarts += 1
+
+    async def _send(self, message: Any) -> None:
+        stdin = self._process.stdin
+        try:
+            stdin.write(encode_message(message))
+            await stdin.drain()
+        except (ConnectionError, BrokenPipeError) as e:
+            raise MCPTransportError(f"MCP server process is gone: {e}") from e
+
+    async def _read_loop(self, process: asyncio.subprocess.Process) -> None:
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    self._on_message(decode_message(line))
+                except JSONRPCError as e:
+                    logger.warning(f"Undecodable MCP message: {e}")
+        finally:
+            self._fail_pending(MCPTransportError("MCP server process exited"))
+
+    async def close(self) -> None:
+        self._started = False
+        await self._stop_process()
+
+    async def _stop_process(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        # Closing stdin lets the server finish in-flight calls and exit
+        if process.stdin is not None and not process.stdin.is_closing():
+            process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            logger.warning(f"MCP server process {process.pid} did not exit, killing it")
+            process.kill()
+            await process.wait()
+        await self._stop_reader()
+        self._fail_pending(MCPTransportError("MCP transport closed"))
+
+    @property
+    def connected(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+
+class SSETransport(MultiplexedTransport):
+    """
+    Talks to a standalone MCP server over HTTP + Server-Sent Events.
+
+    Responses for every request arrive on one long-lived event stream;
+    requests are POSTed over a keep-alive connection pool.
+    """
+
+    name = "sse"
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        super().__init__(timeout)
+        self.url = url.rstrip("/")
+        self._http = None
+        self._endpoint: Optional[asyncio.Future] = None
+
+    async def connect(self) -> None:
+        import httpx
+
+        self._http = httpx.AsyncClient(base_url=self.url, timeout=self.timeout)
+        self._endpoint = asyncio.get_running_loop().create_future()
+        self._reader_task = asyncio.create_task(self._read_loop())
+        try:
+            await asyncio.wait_for(asyncio.shield(self._endpoint), self.timeout)
+            await self._handshake()
+        except BaseException:
+            await self.close()
+            raise
+        logger.info(f"MCP SSE session opened at {self.url}")
+
+    async def _send(self, message: Any) -> None:
+        import httpx
+
+        try:
+            response = await self._http.post(
+                self._endpoint.result(),
+                content=encode_message(message),
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise MCPTransportError(f"MCP server rejected message: {e}") from e
+
+    async def _read_loop(self) -> None:
+        import httpx
+
+        error: Exception = MCPTransportError("MCP event stream closed")
+        try:
+            async with self._http.stream(
+                "GET", "/sse",
+                headers={"Accept": "text/event-stream"},
+                timeout=httpx.Timeout(self.timeout, read=None)
+            ) as response:
+                response.raise_for_status()
+                event, data = "message", []
+                async for line in response.aiter_lines():
+                    if not line:
+                        if data:
+                            self._on_event(event, "\n".join(data))
+                        event, data = "message", []
+                    elif line.startswith(":"):
+                        continue
+                    else:
+                        field, _, value = line.partition(":")
+                        value = value[1:] if value.startswith(" ") else value
+                        if field == "event":
+                            event = value
+                        elif field == "data":
+                            data.append(value)
+        except httpx.HTTPError as e:
+            error = MCPTransportError(f"MCP event stream failed: {e}")
+        finally:
+            if not self._endpoint.done():
+                self._endpoint.set_exception(error)
+            self._fail_pending(error)
+
+    def _on_event(self, event: str, data: str) -> None:
+        if event == "endpoint":
+            if not self._endpoint.done():
+                self._endpoint.set_result(data)
+        elif event == "message":
+            try:
+                self._on_message(decode_message(data))
+            except JSONRPCError as e:
+                logger.warning(f"Undecodable MCP message: {e}")
+
+    async def close(self) -> None:
+        await self._stop_reader()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._fail_pending(MCPTransportError("MCP transport closed"))
+
+    @property
+    def connected(self) -> bool:
+        return (
+            self._http is not None
+            and self._endpoint is not None
+            and self._endpoint.done()
+            and self._endpoint.exception() is None
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
+
+
+def _transport_timeout(config: MCPClientConfig) -> float:
+    """Response timeout that does not cut short a longer per-skill timeout"""
+    return max([config.timeout, *config.skill_timeouts.values()])
+
+
+def create_transport(config: MCPClientConfig) -> MCPTransport:
+    """Build the transport selected by ``config.transport``"""
+    if config.transport == "inprocess":
+        return InProcessTransport()
+    if config.transport == "stdio":
+        return StdioTransport(config.server_command, timeout=_transport_timeout(config))
+    if config.transport == "sse":
+        if not config.server_url:
+            raise ValueError("The sse transport requires server_url")
+        return SSETransport(config.server_url, timeout=_transport_timeout(config))
+    raise ValueError(f"Unsupported MCP transport: {config.transport!r}")
+
+
+__all__ = [
+    "MCPTransport",
+    "MCPTransportError",
+    "InProcessTransport",
+    "MultiplexedTransport",
+    "StdioTransport",
+    "SSETransport",
+    "create_transport",
+]
@@ -6,6 +6,7 @@
 from typing import Any, Dict, List
 from utils.logger import app_logger
 from utils.claude import claude_client
+from utils.deadline import DeadlineExceeded
 from .base import BaseAgent
 
 
@@ -14,6 +15,8 @@ class RecommendationAgent(BaseAgent):
 
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         app_logger.info(f"[{self.name}] Starting recommendation generation")
+        if self.out_of_time(state):
+            return state
 
         collected_info = state.get("collected_info", {})
         search_results = state.get("search_results", [])
@@ -37,14 +40,7 @@ class RecommendationAgent(BaseAgent):
     ) -> List[Dict[str, Any]]:
         if not claude_client.is_ready():
             app_logger.warning("Claude client not ready, using mock recommendations")
-            return [
-                {
-                    "itinerary_id": "mock_001",
-                    "title": "3日文化美食之旅",
-                    "days": 3,
-                    "highlights": ["故宫", "天坛", "烤鸭"]
-                }
-            ]
+            return self._mock_recommendations()
 
         prompt = f"""
 根据以下信息生成旅行推荐方案：
@@ -65,7 +61,7 @@ class RecommendationAgent(BaseAgent):
 """
 
         try:
-            response = await claude_client.llm.ainvoke(prompt)
+            response = await claude_client.ainvoke(prompt, stage=self.name)
             # TODO: 解析 LLM 响应为结构化推荐
             return [
                 {
@@ -76,6 +72,21 @@ class RecommendationAgent(BaseAgent):
                     "estimated_cost": collected_info.get("budget", "未知")
                 }
             ]
+        except DeadlineExceeded as e:
+            # 预算不足以等待 LLM：降级为默认方案
+            app_logger.warning(f"{e}; using mock recommendations")
+            return self._mock_recommendations()
         except Exception as e:
             app_logger.error(f"Failed to generate recommendations: {e}")
             raise
+
+    @staticmethod
+    def _mock_recommendations() -> List[Dict[str, Any]]:
+        return [
+            {
+                "itinerary_id": "mock_001",
+                "title": "3日文化美食之旅",
+                "days": 3,
+                "highlights": ["故宫", "天坛", "烤鸭"]
+            }
+        ]
@@ -15,6 +15,8 @@ class SearchAgent(BaseAgent):
 
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         app_logger.info(f"[{self.name}] Starting search")
+        if self.out_of_time(state):
+            return state
 
         collected_info = state.get("collected_info", {})
         destination = collected_info.get("destination")
@@ -4,9 +4,13 @@ Skill-based Agent for Travel Planning
 This agent uses MCP skills to gather information and create travel plans.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .base import BaseAgent
 from .mcp_client import MCPClient, MCPSkillResult, get_mcp_client
+from utils.deadline import bound_timeout
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,8 +28,26 @@ class SkillBasedAgent(BaseAgent):
     
     name = "skill_based_agent"
     
-    def __init__(self, mcp_client: MCPClient = None):
+    # Overall budget for the information-gathering fan-out (seconds)
+    GATHER_TIMEOUT = 10.0
+    
+    # Per-skill budgets, keyed by the skill_results entry they fill
+    SKILL_TIMEOUTS = {
+        "destination_info": 3.0,
+        "pricing": 5.0,
+        "reviews": 3.0,
+        "weather": 3.0,
+    }
+    
+    def __init__(
+        self,
+        mcp_client: MCPClient = None,
+        gather_timeout: Optional[float] = None,
+        skill_timeouts: Optional[Dict[str, float]] = None
+    ):
         self.mcp_client = mcp_client or get_mcp_client()
+        self.gather_timeout = self.GATHER_TIMEOUT if gather_timeout is None else gather_timeout
+        self.skill_timeouts = {**self.SKILL_TIMEOUTS, **(skill_timeouts or {})}
     
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -46,14 +68,15 @@ class SkillBasedAgent(BaseAgent):
         parsed_request = self._parse_request(user_message, metadata)
         
         # Gather information using skills
-        skill_results = await self._gather_information(parsed_request)
+        skill_results, timed_out = await self._gather_information(parsed_request)
         
         # Create travel plan using gathered information
-        final_plan = await self._create_plan(parsed_request, skill_results)
+        final_plan = await self._create_plan(parsed_request, skill_results, timed_out)
         
         return {
             **state,
             "skill_results": skill_results,
+            "timed_out_skills": timed_out,
             "final_plan": final_plan,
             "agent_used": self.name
         }
@@ -105,61 +128,101 @@ class SkillBasedAgent(BaseAgent):
     async def _gather_information(
         self,
         request: Dict[str, Any]
-    ) -> Dict[str, MCPSkillResult]:
-        """Gather destination information using MCP skills"""
-        results = {}
+    ) -> Tuple[Dict[str, MCPSkillResult], List[str]]:
+        """
+        Gather destination information using MCP skills.
+        
+        All lookups run concurrently. Each one is bounded by its entry in
+        ``skill_timeouts`` and the whole fan-out by ``gather_timeout``,
+        capped by what is left of the request's deadline; lookups that
+        miss their deadline are left out of the results.
+        
+        Returns:
+            Tuple of (partial skill results, keys of skills that timed out)
+        """
         destination = request.get("destination", "")
         
         if not destination:
             logger.warning("No destination specified")
-            return results
+            return {}, []
         
-        # 1. Search destination info
-        logger.info(f"Fetching destination info for {destination}")
-        results["destination_info"] = await self.mcp_client.call_skill(
-            "search_destination",
-            {"destination": destination, "include_tips": True}
-        )
+        calls = {
+            "destination_info": (
+                "search_destination",
+                {"destination": destination, "include_tips": True}
+            ),
+            "pricing": (
+                "query_prices",
+                {
+                    "destination": destination,
+                    "check_in": request.get("start_date"),
+                    "check_out": request.get("end_date"),
+                    "guests": 2,
+                    "rooms": 1
+                }
+            ),
+            "reviews": (
+                "get_destination_reviews",
+                {"destination": destination, "limit": 5, "include_sentiment": True}
+            ),
+            "weather": (
+                "get_weather",
+                {
+                    "destination": destination,
+                    "start_date": request.get("start_date"),
+                    "end_date": request.get("end_date")
+                }
+            ),
+        }
         
-        # 2. Get pricing
-        logger.info(f"Fetching pricing for {destination}")
-        results["pricing"] = await self.mcp_client.call_skill(
-            "query_prices",
-            {
-                "destination": destination,
-                "check_in": request.get("start_date"),
-                "check_out": request.get("end_date"),
-                "guests": 2,
-                "rooms": 1
-            }
-        )
+        logger.info(f"Fetching {list(calls)} for {destination}")
+        gather_timeout = bound_timeout(self.gather_timeout)
+        tasks = {
+            key: asyncio.create_task(
+                asyncio.wait_for(
+                    self.mcp_client.call_skill(skill_name, parameters),
+                    timeout=min(self.skill_timeouts.get(key, gather_timeout), gather_timeout)
+                )
+            )
+            for key, (skill_name, parameters) in calls.items()
+        }
         
-        # 3. Get reviews
-        logger.info(f"Fetching reviews for {destination}")
-        results["reviews"] = await self.mcp_client.call_skill(
-            "get_destination_reviews",
-            {"destination": destination, "limit": 5, "include_sentiment": True}
-        )
+        _, pending = await asyncio.wait(tasks.values(), timeout=gather_timeout)
+        for task in pending:
+            task.cancel()
         
-        # 4. Get weather
-        logger.info(f"Fetching weather for {destination}")
-        results["weather"] = await self.mcp_client.call_skill(
-            "get_weather",
-            {
-                "destination": destination,
-                "start_date": request.get("start_date"),
-                "end_date": request.get("end_date")
-            }
-        )
+        results: Dict[str, MCPSkillResult] = {}
+        timed_out: List[str] = []
+        for key, task in tasks.items():
+            if task in pending or isinstance(task.exception(), asyncio.TimeoutError):
+                timed_out.append(key)
+            elif task.exception() is not None:
+                results[key] = MCPSkillResult(
+                    success=False,
+                    skill_name=calls[key][0],
+                    error=str(task.exception())
+                )
+            else:
+                results[key] = task.result()
         
-        return results
+        if timed_out:
+            logger.warning(f"Skills timed out for {destination}: {timed_out}")
+        
+        return results, timed_out
     
     async def _create_plan(
         self,
         request: Dict[str, Any],
-        skill_results: Dict[str, MCPSkillResult]
+        skill_results: Dict[str, MCPSkillResult],
+        timed_out: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        """Create comprehensive travel plan using skill outputs"""
+        """
+        Create comprehensive travel plan using skill outputs.
+        
+        Skills listed in ``timed_out`` are reported on the plan as missing
+        information instead of failing the whole plan.
+        """
+        timed_out = timed_out or []
         
         destination = request.get("destination", "Unknown")
         
@@ -198,9 +261,9 @@ class SkillBasedAgent(BaseAgent):
         )
         
         if plan_result.success:
-            return plan_result.result
+            plan = plan_result.result
         else:
-            return {
+            plan = {
                 "destination": destination,
                 "title": f"Travel Plan for {destination}",
                 "overview": "Plan creation encountered an issue.",
@@ -212,10 +275,19 @@ class SkillBasedAgent(BaseAgent):
                     "weather": weather
                 }
             }
+        
+        if timed_out:
+            plan = {
+                **plan,
+                "degraded": True,
+                "missing_information": list(timed_out)
+            }
+        
+        return plan
     
     async def list_available_skills(self) -> List[str]:
         """List all skills available to this agent"""
-        return self.mcp_client.list_skill_names()
+        return list(self.mcp_client.list_skill_names())
     
     async def get_skill_info(self, skill_name: str) -> Optional[Dict]:
         """Get information about a specific skill"""
@@ -234,6 +306,11 @@ class SkillBasedAgent(BaseAgent):
 class MCPSkillsPlanner:
     """
     Helper class for planning skill execution sequences.
+
+    Each template step may declare ``depends_on``: a list of step ids
+    (the ``id`` key, or the skill name when no id is given) that must
+    finish before the step starts. Steps without dependencies run
+    concurrently in the first layer of the execution DAG.
     """
     
     # Predefined skill execution templates
@@ -249,7 +326,7 @@ class MCPSkillsPlanner:
                 "destination": "$destination",
                 "duration_days": "$duration_days",
                 "budget": "$budget"
-            }}
+            }, "depends_on": ["search_destination", "query_prices"]}
         ],
         "comprehensive": [
             {"skill": "search_destination", "parameters": {"destination": "$destination", "include_tips": True}},
@@ -269,7 +346,12 @@ class MCPSkillsPlanner:
                 "duration_days": "$duration_days",
                 "budget": "$budget",
                 "travel_dates": {"start": "$start_date", "end": "$end_date"}
-            }}
+            }, "depends_on": [
+                "search_destination",
+                "query_prices",
+                "get_destination_reviews",
+                "get_weather"
+            ]}
         ],
         "quick_check": [
             {"skill": "search_destination", "parameters": {"destination": "$destination"}},
@@ -292,14 +374,181 @@ class MCPSkillsPlanner:
                     params[key] = parameters.get(param_name, value)
                 else:
                     params[key] = value
-            filled.append({
+            filled_step = {
                 "skill": step["skill"],
                 "parameters": params
-            })
+            }
+            if "id" in step:
+                filled_step["id"] = step["id"]
+            if step.get("depends_on"):
+                filled_step["depends_on"] = list(step["depends_on"])
+            filled.append(filled_step)
         return filled
+    
+    @staticmethod
+    def build_layers(calls: List[Dict]) -> List[List[Dict]]:
+        """
+        Group calls into dependency layers (Kahn's algorithm).
+        
+        Every call in a layer depends only on calls in earlier layers,
+        so a layer can be executed concurrently.
+        
+        Raises:
+            ValueError: On duplicate step ids, unknown dependencies or cycles
+        """
+        steps: Dict[str, Dict] = {}
+        for call in calls:
+            step_id = _step_id(call)
+            if step_id in steps:
+                raise ValueError(f"Duplicate step id '{step_id}' in template")
+            steps[step_id] = call
+        
+        remaining: Dict[str, set] = {}
+        for step_id, call in steps.items():
+            deps = set(call.get("depends_on") or [])
+            unknown = deps - steps.keys()
+            if unknown:
+                raise ValueError(
+                    f"Step '{step_id}' depends on unknown steps: {sorted(unknown)}"
+                )
+            remaining[step_id] = deps
+        
+        layers = []
+        done: set = set()
+        while remaining:
+            ready = [s for s, deps in remaining.items() if deps <= done]
+            if not ready:
+                raise ValueError(
+                    f"Dependency cycle between steps: {sorted(remaining)}"
+                )
+            layers.append([steps[s] for s in ready])
+            done.update(ready)
+            for s in ready:
+                del remaining[s]
+        return layers
+
+
+def _step_id(call: Dict) -> str:
+    """Identifier of a template step: explicit ``id`` or the skill name"""
+    return call.get("id") or call.get("skill") or call.get("name")
+
+
+@dataclass
+class SkillDAGResult:
+    """Outcome of a dependency-aware template execution"""
+    results: Dict[str, MCPSkillResult]
+    layers: List[List[str]]
+    durations_ms: Dict[str, float]
+    critical_path: List[str]
+    critical_path_ms: float
+    total_time_ms: float
+
+
+# Called with (step id, result, elapsed ms) as each DAG step finishes
+StepCallback = Callable[[str, MCPSkillResult, float], None]
+
+
+class SkillDAGExecutor:
+    """
+    Executes filled template steps as a DAG.
+    
+    Steps are grouped into layers by ``MCPSkillsPlanner.build_layers`` and
+    each layer is fanned out concurrently, so the wall-clock time of a
+    template is bounded by its longest dependency chain instead of the
+    sum of all skill latencies.
+    """
+    
+    def __init__(self, mcp_client: MCPClient = None):
+        self.mcp_client = mcp_client or get_mcp_client()
+    
+    async def run(
+        self,
+        calls: List[Dict],
+        on_step: Optional[StepCallback] = None
+    ) -> SkillDAGResult:
+        """
+        Execute calls layer by layer.
+        
+        Args:
+            calls: Filled template steps (see ``MCPSkillsPlanner.fill_parameters``)
+            on_step: Called as soon as each step finishes, for progressive
+                output; steps of a layer report in completion order
+            
+        Returns:
+            SkillDAGResult keyed by step id, with the measured critical path
+        """
+        layers = MCPSkillsPlanner.build_layers(calls)
+        results: Dict[str, MCPSkillResult] = {}
+        durations_ms: Dict[str, float] = {}
+        start_time = time.perf_counter()
+        
+        for layer in layers:
+            outcomes = await asyncio.gather(
+                *(self._timed_call(call, on_step) for call in layer)
+            )
+            for call, (result, elapsed_ms) in zip(layer, outcomes):
+                step_id = _step_id(call)
+                results[step_id] = result
+                durations_ms[step_id] = elapsed_ms
+        
+        total_time_ms = (time.perf_counter() - start_time) * 1000
+        critical_path, critical_path_ms = self._critical_path(layers, durations_ms)
+        
+        return SkillDAGResult(
+            results=results,
+            layers=[[_step_id(call) for call in layer] for layer in layers],
+            durations_ms=durations_ms,
+            critical_path=critical_path,
+            critical_path_ms=critical_path_ms,
+            total_time_ms=total_time_ms
+        )
+    
+    async def _timed_call(self, call: Dict, on_step: Optional[StepCallback] = None):
+        skill_name = call.get("skill") or call.get("name")
+        started = time.perf_counter()
+        result = await self.mcp_client.call_skill(
+            skill_name, call.get("parameters") or {}
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if on_step is not None:
+            on_step(_step_id(call), result, elapsed_ms)
+        return result, elapsed_ms
+    
+    @staticmethod
+    def _critical_path(
+        layers: List[List[Dict]],
+        durations_ms: Dict[str, float]
+    ):
+        """Longest duration-weighted chain through the DAG"""
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        
+        # Layers are already in topological order
+        for layer in layers:
+            for call in layer:
+                step_id = _step_id(call)
+                best_dep, best_finish = None, 0.0
+                for dep in call.get("depends_on") or []:
+                    if finish[dep] > best_finish:
+                        best_dep, best_finish = dep, finish[dep]
+                finish[step_id] = best_finish + durations_ms[step_id]
+                previous[step_id] = best_dep
+        
+        if not finish:
+            return [], 0.0
+        
+        tail = max(finish, key=finish.get)
+        path = []
+        node: Optional[str] = tail
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return list(reversed(path)), finish[tail]
 
 
 __all__ = [
     "SkillBasedAgent",
     "MCPSkillsPlanner",
+    "SkillDAGExecutor",
+    "SkillDAGResult",
 ]
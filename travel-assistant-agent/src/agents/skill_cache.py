@@ -0,0 +1,168 @@
+"""
+Skill Result Cache
+
+Caches successful skill results for the MCP client, keyed on the skill
+name and a canonical hash of its parameters. Freshness is configured per
+skill, so slowly-changing data (destination info) can be reused for hours
+while volatile data (prices) expires within minutes.
+"""
+
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+# Default freshness policy (seconds). Skills not listed are never cached.
+DEFAULT_SKILL_TTLS: Dict[str, float] = {
+    "search_destination": 6 * 60 * 60,
+    "get_destination_reviews": 60 * 60,
+    "get_weather": 30 * 60,
+    "query_prices": 5 * 60,
+    "bulk_quote_prices": 5 * 60,
+}
+
+
+def make_cache_key(skill_name: str, parameters: Dict[str, Any]) -> str:
+    """Canonical key for a skill call, independent of parameter ordering"""
+    canonical = json.dumps(
+        parameters or {},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{skill_name}:{digest}"
+
+
+class SkillResultCache(ABC):
+    """Interface for pluggable skill result caches"""
+
+    @abstractmethod
+    def get(self, skill_name: str, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached result, or None on a miss"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, skill_name: str, parameters: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Store a successful skill result"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all cached results"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_statistics(self) -> Dict[str, Any]:
+        """Cache counters for monitoring"""
+        raise NotImplementedError
+
+
+@dataclass
+class _CacheEntry:
+    payload: bytes
+    expires_at: float
+
+
+class TTLSkillResultCache(SkillResultCache):
+    """
+    In-process TTL cache with LRU eviction.
+
+    Results are stored as serialized JSON, which gives an exact byte size
+    for the ``max_bytes`` bound and hands every caller its own copy, so a
+    caller mutating a result cannot corrupt the cache.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttls = {**DEFAULT_SKILL_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, skill_name: str, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self.ttls.get(skill_name, 0) <= 0:
+            return None
+
+        key = make_cache_key(skill_name, parameters)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return json.loads(entry.payload)
+
+    def set(self, skill_name: str, parameters: Dict[str, Any], result: Dict[str, Any]) -> None:
+        ttl = self.ttls.get(skill_name, 0)
+        if ttl <= 0:
+            return
+
+        payload = json.dumps(result, ensure_ascii=False, default=str).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return
+
+        key = make_cache_key(skill_name, parameters)
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _CacheEntry(payload=payload, expires_at=self._clock() + ttl)
+        self._bytes += len(payload)
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.payload)
+
+
+__all__ = [
+    "DEFAULT_SKILL_TTLS",
+    "SkillResultCache",
+    "TTLSkillResultCache",
+    "make_cache_key",
+]
@@ -0,0 +1,195 @@
+"""
+Skill call resilience
+
+Building blocks ``MCPClient`` uses to keep a slow or failing skill from
+tying up the agent: a per-skill circuit breaker, the rule for which
+failures are worth retrying, and hedged execution (a second attempt once
+an attempt has outlived the skill's usual latency).
+"""
+
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from mcp_server.protocol import SKILL_INTERNAL_ERROR
+
+# Failed-result ``error_type``s another attempt may fix; anything else
+# (unknown skill, invalid input, spent deadline) fails the same way again
+TRANSIENT_ERROR_TYPES = frozenset({SKILL_INTERNAL_ERROR})
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a skill whose circuit is open"""
+
+    def __init__(self, skill_name: str, retry_after: float):
+        self.skill_name = skill_name
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit open for skill '{skill_name}'; retry in {retry_after:.1f}s"
+        )
+
+
+class RetryableSkillFailure(Exception):
+    """A failed skill response that another attempt may fix"""
+
+    def __init__(self, response: Dict[str, Any]):
+        self.response = response
+        super().__init__(response.get("error") or "Skill call failed")
+
+
+def is_retryable_response(response: Dict[str, Any]) -> bool:
+    """
+    Whether a failed ``skills/call`` response is worth retrying.
+
+    Only failures the server marks as transient qualify (an unexpected
+    exception inside the skill). Unknown skills and invalid input fail
+    the same way every time, a call abandoned at the caller's deadline
+    has no budget left, and an unclassified failure is not retried.
+    These are also the only failed responses that count against the
+    skill's circuit breaker.
+    """
+    return (
+        not response.get("success")
+        and response.get("error_type") in TRANSIENT_ERROR_TYPES
+    )
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one skill.
+
+    After ``failure_threshold`` failures in a row the circuit opens and
+    calls are rejected without touching the server. Once
+    ``reset_timeout`` seconds have passed, a single probe call is let
+    through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may proceed; in half-open state only one probe may"""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit will admit a probe"""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def record_success(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot whose call was abandoned"""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state is not CircuitState.OPEN:
+                self.times_opened += 1
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "times_opened": self.times_opened,
+            "retry_after": self.retry_after(),
+        }
+
+
+async def hedged_call(
+    make_call: Callable[[], Awaitable[Any]],
+    timeout: float,
+    hedge_after: Optional[float] = None
+) -> Tuple[Any, bool]:
+    """
+    Run ``make_call`` with a timeout, hedging once after ``hedge_after``.
+
+    If the first attempt has not finished after ``hedge_after`` seconds a
+    second one is started; the first to succeed wins and the other is
+    cancelled. Returns ``(result, hedged)``. Raises ``asyncio.TimeoutError``
+    if nothing succeeds within ``timeout``, or the last attempt's error.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    attempts = {asyncio.ensure_future(make_call())}
+    hedged = False
+    error: Optional[BaseException] = None
+
+    try:
+        if hedge_after is not None and hedge_after < timeout:
+            done, _ = await asyncio.wait(attempts, timeout=hedge_after)
+            if not done:
+                attempts.add(asyncio.ensure_future(make_call()))
+                hedged = True
+
+        while attempts:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, attempts = await asyncio.wait(
+                attempts, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for attempt in done:
+                if attempt.exception() is None:
+                    return attempt.result(), hedged
+                error = attempt.exception()
+
+        if error is not None and not attempts:
+            raise error
+        raise asyncio.TimeoutError()
+    finally:
+        for attempt in attempts:
+            attempt.cancel()
+
+
+__all__ = [
+    "CircuitState",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryableSkillFailure",
+    "is_retryable_response",
+    "hedged_call",
+]
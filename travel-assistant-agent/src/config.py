@@ -2,7 +2,7 @@
 配置管理模块
 使用 Pydantic Settings 管理环境变量配置
 """
-from typing import List
+from typing import Dict, List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -22,6 +22,13 @@ class Settings(BaseSettings):
     app_host: str = Field(default="0.0.0.0", alias="APP_HOST")
     app_port: int = Field(default=8000, alias="APP_PORT")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    # Request time budget (seconds): taken from the X-Request-Timeout
+    # header, capped at the maximum, or the default when absent
+    request_timeout_default: float = Field(default=30.0, alias="REQUEST_TIMEOUT_DEFAULT")
+    request_timeout_max: float = Field(default=120.0, alias="REQUEST_TIMEOUT_MAX")
+    # Streaming responses replace that budget with their own once the
+    # stream starts, since they are expected to run longer
+    request_timeout_stream: float = Field(default=300.0, alias="REQUEST_TIMEOUT_STREAM")
 
     # Claude API
     anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
@@ -31,6 +38,8 @@ class Settings(BaseSettings):
     )
     claude_max_tokens: int = Field(default=4096, alias="CLAUDE_MAX_TOKENS")
     claude_temperature: float = Field(default=0.7, alias="CLAUDE_TEMPERATURE")
+    # LLM calls are skipped (callers degrade) with less budget left than this
+    claude_min_budget: float = Field(default=2.0, alias="CLAUDE_MIN_BUDGET")
 
     # PostgreSQL
     database_url: str = Field(
@@ -61,7 +70,23 @@ class Settings(BaseSettings):
         default="http://localhost:8765",
         alias="MCP_SERVER_URL"
     )
+    # stdio: skills run in a child server process; sse: connect to
+    # MCP_SERVER_URL; inprocess: run skills inside the API process
     mcp_transport: str = Field(default="stdio", alias="MCP_TRANSPORT")
+    # Admission control: concurrent skill executions and how many calls
+    # may wait for a slot before the API answers 429
+    mcp_max_concurrent_skills: int = Field(default=64, alias="MCP_MAX_CONCURRENT_SKILLS")
+    mcp_max_queued_skills: int = Field(default=256, alias="MCP_MAX_QUEUED_SKILLS")
+    mcp_skill_concurrency_limits: Dict[str, int] = Field(
+        default_factory=dict,
+        alias="MCP_SKILL_CONCURRENCY_LIMITS"
+    )
+    mcp_skill_queue_limit: Optional[int] = Field(default=None, alias="MCP_SKILL_QUEUE_LIMIT")
+    # Minimum share of skill slots for batch-priority work (/mcp/batch-call)
+    mcp_batch_min_share: float = Field(default=0.1, alias="MCP_BATCH_MIN_SHARE")
+    mcp_max_batch_calls: int = Field(default=500, alias="MCP_MAX_BATCH_CALLS")
+    # Destinations x date pairs accepted by /mcp/bulk-quotes
+    mcp_max_bulk_quotes: int = Field(default=5000, alias="MCP_MAX_BULK_QUOTES")
 
     @property
     def is_production(self) -> bool:
@@ -3,24 +3,32 @@ FastAPI 主应用入口
 提供 Agent 服务的 HTTP API 接口
 """
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
+import json
+import math
 import uuid
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from config import settings
 from models.schemas import PlanningRequest, PlanningResponse, HealthResponse
-from workflows import PlanningWorkflow
 from utils.logger import app_logger
 from utils.db import db_manager
 from utils.claude import claude_client
 from utils.api_client import backend_client
+from utils.deadline import DeadlineExceeded, deadline_scope
+from utils.etag import etag_json_response, make_etag
+from utils.streaming import StreamEvent, event_stream_response
 from agents import (
     get_mcp_client,
     init_mcp_client,
+    Priority,
     SkillBasedAgent,
-    MCPSkillsPlanner
+    MCPSkillsPlanner,
+    SkillDAGExecutor
 )
+from mcp_server import MCPClientConfig, get_mcp_server
 
 
 # ============== MCP-related Models ==============
@@ -59,6 +67,9 @@ class SkillCallResponse(BaseModel):
 class BatchSkillCallRequest(BaseModel):
     """Request to call multiple skills"""
     calls: List[SkillCallRequest]
+    # Bulk jobs yield to interactive calls; pass "interactive" for
+    # batches a user is waiting on
+    priority: Priority = Priority.BATCH
 
 
 class BatchSkillCallResponse(BaseModel):
@@ -69,6 +80,28 @@ class BatchSkillCallResponse(BaseModel):
     failed_calls: int
 
 
+class QuoteDatePair(BaseModel):
+    """Check-in/check-out dates for a bulk quote"""
+    check_in: Optional[str] = Field(default=None, description="Check-in date (YYYY-MM-DD)")
+    check_out: Optional[str] = Field(default=None, description="Check-out date (YYYY-MM-DD)")
+
+
+class BulkQuoteRequest(BaseModel):
+    """Request to quote many destinations and date pairs at once"""
+    destinations: List[str] = Field(..., min_length=1, description="Destinations to quote")
+    date_pairs: List[QuoteDatePair] = Field(
+        default_factory=list,
+        description="Date pairs quoted for every destination (default: one open-dated stay)"
+    )
+    guests: int = Field(default=2, ge=1, description="Number of guests")
+    rooms: int = Field(default=1, ge=1, description="Minimum number of rooms")
+    flight_class: str = Field(default="economy", description="Flight class: economy, business, first")
+    room_type: str = Field(default="standard", description="Room type: standard, deluxe, family, suite")
+    hotels_per_quote: int = Field(default=3, ge=0, description="Ranked hotels listed per quote")
+    sort_by: str = Field(default="total_price", description="Hotel order: total_price, price_per_night, rating, value")
+    priority: Priority = Priority.BATCH
+
+
 class DemoPlanningRequest(BaseModel):
     """Request for demo planning with skills"""
     destination: str = Field(..., description="Travel destination")
@@ -89,6 +122,9 @@ class DemoPlanningResponse(BaseModel):
     skills_used: List[str]
     skill_results: Dict[str, Any]
     travel_plan: Dict[str, Any]
+    critical_path: List[str] = Field(default_factory=list)
+    critical_path_ms: Optional[float] = None
+    execution_time_ms: Optional[float] = None
 
 
 @asynccontextmanager
@@ -98,10 +134,25 @@ async def lifespan(app: FastAPI):
     db_manager.init()
     claude_client.init()
     
+    # Skills run in this process unless MCP_TRANSPORT selects an
+    # out-of-process server (stdio child process or standalone SSE server)
+    in_process = settings.mcp_transport == "inprocess"
+    if in_process:
+        # Warms up the skill process pool
+        await get_mcp_server().start()
+    
     # Initialize MCP Client
     try:
-        await init_mcp_client()
-        app_logger.info("MCP Client initialized")
+        await init_mcp_client(config=MCPClientConfig(
+            server_url=settings.mcp_server_url,
+            transport=settings.mcp_transport,
+            max_concurrent_calls=settings.mcp_max_concurrent_skills,
+            max_queued_calls=settings.mcp_max_queued_skills,
+            skill_call_limits=settings.mcp_skill_concurrency_limits,
+            skill_queue_limit=settings.mcp_skill_queue_limit,
+            batch_min_share=settings.mcp_batch_min_share
+        ))
+        app_logger.info(f"MCP Client initialized ({settings.mcp_transport})")
     except Exception as e:
         app_logger.warning(f"MCP Client initialization failed: {e}")
     
@@ -116,6 +167,8 @@ async def lifespan(app: FastAPI):
     mcp_client = get_mcp_client()
     if mcp_client.is_connected():
         await mcp_client.disconnect()
+    if in_process:
+        await get_mcp_server().stop()
     
     app_logger.info("Service stopped")
 
@@ -136,6 +189,26 @@ app.add_middleware(
 )
 
 
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+
+
+def _request_budget(header: Optional[str]) -> float:
+    """客户端愿意等待的秒数：取自请求头（不超过上限），缺省或无效时用默认值"""
+    try:
+        budget = float(header) if header else settings.request_timeout_default
+    except ValueError:
+        budget = settings.request_timeout_default
+    return max(0.0, min(budget, settings.request_timeout_max))
+
+
+@app.middleware("http")
+async def request_deadline(request: Request, call_next):
+    # Every stage below (workflow, agents, LLM, skills) reads this deadline;
+    # streaming response bodies run under REQUEST_TIMEOUT_STREAM instead
+    with deadline_scope(_request_budget(request.headers.get(REQUEST_TIMEOUT_HEADER))):
+        return await call_next(request)
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     db_ok = db_manager.health_check()
@@ -175,6 +248,9 @@ async def start_planning(request: PlanningRequest):
     app_logger.info(f"[{request_id}] Received planning request: {request.user_message}")
     
     try:
+        # Imported on first use: LangGraph dominates the service's import time
+        from workflows import PlanningWorkflow
+        
         workflow = PlanningWorkflow()
         result = await workflow.run(request.user_message, request.metadata)
         
@@ -183,6 +259,9 @@ async def start_planning(request: PlanningRequest):
             status="completed",
             result=result
         )
+    except DeadlineExceeded as e:
+        app_logger.warning(f"[{request_id}] {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         app_logger.error(f"[{request_id}] Planning failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -200,33 +279,60 @@ async def get_status(request_id: str):
 
 # ============== MCP Endpoints ==============
 
+class _SkillCatalog:
+    """Serialized /mcp/skills payload, rebuilt only when the client's skills change"""
+    version: Optional[int] = None
+    body: bytes = b""
+    etag: str = ""
+
+
+_skill_catalog = _SkillCatalog()
+
+
+def _get_skill_catalog(mcp_client) -> _SkillCatalog:
+    if _skill_catalog.version != mcp_client.catalog_version:
+        skills = mcp_client.list_skills()
+        payload = MCPSkillsListResponse(
+            skills=[
+                MCPSkillInfo(
+                    name=s.name,
+                    description=s.description,
+                    category=s.category,
+                    version=s.version,
+                    input_schema=s.input_schema,
+                    output_schema=s.output_schema
+                )
+                for s in skills
+            ],
+            total_count=len(skills)
+        )
+        _skill_catalog.body = payload.model_dump_json().encode("utf-8")
+        _skill_catalog.etag = make_etag(_skill_catalog.body)
+        _skill_catalog.version = mcp_client.catalog_version
+    return _skill_catalog
+
+
 @app.get("/mcp/skills", response_model=MCPSkillsListResponse)
-async def list_mcp_skills():
+async def list_mcp_skills(if_none_match: Optional[str] = Header(default=None)):
     """
     List all available MCP skills.
     
     Returns a list of all skills registered with the MCP server,
     including their names, descriptions, categories, and schemas.
-    """
-    mcp_client = get_mcp_client()
-    skills = mcp_client.list_skills()
-    
-    skill_infos = [
-        MCPSkillInfo(
-            name=s.name,
-            description=s.description,
-            category=s.category,
-            version=s.version,
-            input_schema=s.input_schema,
-            output_schema=s.output_schema
-        )
-        for s in skills
-    ]
     
-    return {
-        "skills": skill_infos,
-        "total_count": len(skill_infos)
-    }
+    The payload is serialized once per skill catalog version and served
+    with an ETag; a matching If-None-Match header yields 304.
+    """
+    catalog = _get_skill_catalog(get_mcp_client())
+    return etag_json_response(catalog.body, catalog.etag, if_none_match)
+
+
+def _too_busy(detail: str, retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
 
 
 @app.post("/mcp/call-skill", response_model=SkillCallResponse)
@@ -243,6 +349,8 @@ async def call_mcp_skill(request: SkillCallRequest):
     
     mcp_client = get_mcp_client()
     result = await mcp_client.call_skill(request.skill_name, request.parameters)
+    if result.retry_after is not None:
+        raise _too_busy(result.error, result.retry_after)
     
     execution_time_ms = (time.time() - start_time) * 1000
     
@@ -256,14 +364,39 @@ async def call_mcp_skill(request: SkillCallRequest):
 
 
 @app.post("/mcp/batch-call", response_model=BatchSkillCallResponse)
-async def call_mcp_skills_batch(request: BatchSkillCallRequest):
+async def call_mcp_skills_batch(
+    request: BatchSkillCallRequest,
+    response: Response,
+    stream: Optional[Literal["ndjson", "sse"]] = Query(default=None)
+):
     """
     Call multiple MCP skills in parallel.
     
     Executes all specified skill calls in parallel and returns the results
     for each. This is more efficient than calling skills sequentially when
     skills don't depend on each other's outputs.
+    
+    Calls run at batch priority unless the request says otherwise, so
+    bulk jobs do not hold up interactive planning requests.
+    
+    Batches larger than MCP_MAX_BATCH_CALLS are refused with 413. If the
+    client is too busy to run any of the calls the response is 429; if
+    only some were rejected they fail individually and the response
+    carries a Retry-After header.
+    
+    With ``?stream=ndjson`` or ``?stream=sse`` each result is sent as soon
+    as its call completes, in completion order, tagged with the ``index``
+    of the call in the request. The last record is a ``summary`` with the
+    counts. Streams always start with 200, so rejected calls only show up
+    as failed results carrying ``retry_after``.
     """
+    if len(request.calls) > settings.mcp_max_batch_calls:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch has {len(request.calls)} calls; "
+                   f"at most {settings.mcp_max_batch_calls} are allowed"
+        )
+    
     mcp_client = get_mcp_client()
     
     calls = [
@@ -271,7 +404,20 @@ async def call_mcp_skills_batch(request: BatchSkillCallRequest):
         for call in request.calls
     ]
     
-    results = await mcp_client.call_skills_parallel(calls)
+    if stream is not None:
+        return event_stream_response(
+            _stream_batch_results(mcp_client, calls, request.priority),
+            stream,
+            budget=settings.request_timeout_stream
+        )
+    
+    results = await mcp_client.call_skills_parallel(calls, priority=request.priority)
+    
+    rejected = [r.retry_after for r in results if r.retry_after is not None]
+    if rejected:
+        if len(rejected) == len(results):
+            raise _too_busy("Too many skill calls in progress", max(rejected))
+        response.headers["Retry-After"] = str(max(1, math.ceil(max(rejected))))
     
     successful = sum(1 for r in results if r.success)
     failed = len(results) - successful
@@ -292,8 +438,81 @@ async def call_mcp_skills_batch(request: BatchSkillCallRequest):
     )
 
 
+async def _stream_batch_results(
+    mcp_client,
+    calls: List[Dict[str, Any]],
+    priority: Priority
+) -> AsyncIterator[StreamEvent]:
+    import time
+    start_time = time.time()
+    successful = 0
+    
+    async for index, result in mcp_client.iter_skills_parallel(calls, priority=priority):
+        successful += result.success
+        record = SkillCallResponse(
+            success=result.success,
+            skill_name=result.skill_name,
+            result=result.result,
+            error=result.error,
+            execution_time_ms=(time.time() - start_time) * 1000
+        ).model_dump()
+        record["index"] = index
+        if result.retry_after is not None:
+            record["retry_after"] = result.retry_after
+        yield "result", record
+    
+    yield "summary", {
+        "summary": {
+            "total_calls": len(calls),
+            "successful_calls": successful,
+            "failed_calls": len(calls) - successful,
+            "execution_time_ms": (time.time() - start_time) * 1000
+        }
+    }
+
+
+@app.post("/mcp/bulk-quotes", response_model=SkillCallResponse)
+async def bulk_quotes(request: BulkQuoteRequest):
+    """
+    Quote hotels and flights for many destinations and date pairs.
+    
+    Every destination is quoted for every date pair in a single
+    ``bulk_quote_prices`` skill call, which prices the whole grid with
+    vectorized array operations. Each quote lists the top hotels, every
+    carrier and the cheapest hotel + flight total; ``cheapest`` is the
+    best quote overall.
+    
+    Grids larger than MCP_MAX_BULK_QUOTES quotes are refused with 413.
+    """
+    import time
+    start_time = time.time()
+    
+    quotes = len(request.destinations) * max(1, len(request.date_pairs))
+    if quotes > settings.mcp_max_bulk_quotes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Request asks for {quotes} quotes; "
+                   f"at most {settings.mcp_max_bulk_quotes} are allowed"
+        )
+    
+    parameters = request.model_dump(exclude={"priority"}, exclude_none=True)
+    
+    mcp_client = get_mcp_client()
+    result = await mcp_client.call_skill("bulk_quote_prices", parameters, priority=request.priority)
+    if result.retry_after is not None:
+        raise _too_busy(result.error, result.retry_after)
+    
+    return SkillCallResponse(
+        success=result.success,
+        skill_name=result.skill_name,
+        result=result.result,
+        error=result.error,
+        execution_time_ms=(time.time() - start_time) * 1000
+    )
+
+
 @app.get("/mcp/status")
-async def get_mcp_status():
+async def get_mcp_status(if_none_match: Optional[str] = Header(default=None)):
     """
     Get MCP client status and statistics.
     
@@ -301,15 +520,92 @@ async def get_mcp_status():
     - Connection status
     - Number of available skills
     - List of skill names
+    - Result cache counters (hits, misses, size)
+    
+    Served with an ETag; a matching If-None-Match header yields 304.
     """
     mcp_client = get_mcp_client()
     stats = mcp_client.get_statistics()
     
-    return {
+    status = {
         "mcp_enabled": True,
         "connected": stats["connected"],
         "skills_count": stats["skills_count"],
-        "skills": stats["skills"]
+        "skills": stats["skills"],
+        "catalog_etag": _get_skill_catalog(mcp_client).etag,
+        "cache": stats["cache"]
+    }
+    body = json.dumps(status, separators=(",", ":")).encode("utf-8")
+    return etag_json_response(body, make_etag(body), if_none_match)
+
+
+@app.get("/mcp/metrics")
+async def get_mcp_metrics(skill_name: Optional[str] = None):
+    """
+    Get per-skill call aggregates from the MCP server.
+    
+    For each skill: call count, error rate and latency percentiles
+    (p50/p90/p95/p99) from a constant-memory streaming histogram.
+    """
+    return await get_mcp_client().get_server_metrics(skill_name)
+
+
+@app.get("/mcp/history")
+async def get_mcp_history(
+    limit: int = Query(default=50, ge=1, le=1000),
+    skill_name: Optional[str] = None
+):
+    """
+    Get the most recent MCP skill calls, newest first.
+    
+    Reads from the server's bounded ring buffer; only the requested
+    records are copied.
+    """
+    return await get_mcp_client().get_call_history(limit, skill_name)
+
+
+def _demo_skill_calls(request: DemoPlanningRequest) -> List[Dict[str, Any]]:
+    """Fill the requested skill template with the request's parameters"""
+    params = {
+        "destination": request.destination,
+        "duration_days": request.duration_days,
+        "budget": request.budget,
+        "start_date": request.start_date,
+        "end_date": request.end_date,
+        "interests": request.interests,
+        "accommodation_type": request.accommodation_type,
+        "pace": request.pace
+    }
+    
+    # Get the skill template
+    template_name = request.use_template
+    template = MCPSkillsPlanner.TEMPLATES.get(template_name, MCPSkillsPlanner.TEMPLATES["comprehensive"])
+    
+    calls = MCPSkillsPlanner.fill_parameters(template, params)
+    # The template's plan step produces the response's travel plan, so it
+    # gets the full request rather than the template's subset
+    for call in calls:
+        if call["skill"] == "create_travel_plan":
+            call["parameters"] = _demo_plan_parameters(request)
+    return calls
+
+
+def _demo_plan_step(calls: List[Dict[str, Any]]) -> Optional[str]:
+    """Step id of the template's ``create_travel_plan`` step, if it has one"""
+    return next(
+        (c.get("id", c["skill"]) for c in calls if c["skill"] == "create_travel_plan"), None
+    )
+
+
+def _demo_plan_parameters(request: DemoPlanningRequest) -> Dict[str, Any]:
+    return {
+        "destination": request.destination,
+        "duration_days": request.duration_days,
+        "budget": request.budget,
+        "travel_dates": {"start": request.start_date, "end": request.end_date},
+        "interests": request.interests,
+        "accommodation_type": request.accommodation_type,
+        "pace": request.pace
     }
 
 
@@ -338,57 +634,36 @@ async def demo_planning_with_skills(request: DemoPlanningRequest):
     try:
         mcp_client = get_mcp_client()
         
-        # Prepare parameters
-        params = {
-            "destination": request.destination,
-            "duration_days": request.duration_days,
-            "budget": request.budget,
-            "start_date": request.start_date,
-            "end_date": request.end_date,
-            "interests": request.interests,
-            "accommodation_type": request.accommodation_type,
-            "pace": request.pace
-        }
-        
-        # Get the skill template
-        template_name = request.use_template
-        template = getattr(MCPSkillsPlanner.TEMPLATES, template_name, MCPSkillsPlanner.TEMPLATES["comprehensive"])
+        calls = _demo_skill_calls(request)
         
-        # Fill template with parameters
-        calls = MCPSkillsPlanner.fill_parameters(template, params)
-        
-        # Execute skills
+        # Execute skills as a dependency DAG, one concurrent layer at a time
         app_logger.info(f"[{request_id}] Executing {len(calls)} skills")
-        skill_results = {}
+        dag_result = await SkillDAGExecutor(mcp_client).run(calls)
+        app_logger.info(
+            f"[{request_id}] Skill layers: {dag_result.layers}, "
+            f"critical path: {' -> '.join(dag_result.critical_path)} "
+            f"({dag_result.critical_path_ms:.1f}ms)"
+        )
         
-        for call in calls:
-            skill_name = call["skill"]
-            parameters = call["parameters"]
-            
-            app_logger.info(f"[{request_id}] Calling skill: {skill_name}")
-            
-            result = await mcp_client.call_skill(skill_name, parameters)
-            
-            skill_results[skill_name] = {
+        skill_results = {
+            step_id: {
                 "success": result.success,
                 "error": result.error,
                 "data": result.result
             }
+            for step_id, result in dag_result.results.items()
+        }
         
-        # Create the final plan
-        app_logger.info(f"[{request_id}] Creating final travel plan")
-        plan_result = await mcp_client.call_skill(
-            "create_travel_plan",
-            {
-                "destination": request.destination,
-                "duration_days": request.duration_days,
-                "budget": request.budget,
-                "travel_dates": {"start": request.start_date, "end": request.end_date},
-                "interests": request.interests,
-                "accommodation_type": request.accommodation_type,
-                "pace": request.pace
-            }
-        )
+        # Templates that end in a plan step already produced the travel
+        # plan; the others (e.g. quick_check) still need one
+        plan_step = _demo_plan_step(calls)
+        if plan_step is not None:
+            plan_result = dag_result.results[plan_step]
+        else:
+            app_logger.info(f"[{request_id}] Creating final travel plan")
+            plan_result = await mcp_client.call_skill(
+                "create_travel_plan", _demo_plan_parameters(request)
+            )
         
         execution_time_ms = (time.time() - start_time) * 1000
         
@@ -397,7 +672,10 @@ async def demo_planning_with_skills(request: DemoPlanningRequest):
             destination=request.destination,
             skills_used=[c["skill"] for c in calls],
             skill_results=skill_results,
-            travel_plan=plan_result.result if plan_result.success else {"error": plan_result.error}
+            travel_plan=plan_result.result if plan_result.success else {"error": plan_result.error},
+            critical_path=dag_result.critical_path,
+            critical_path_ms=dag_result.critical_path_ms,
+            execution_time_ms=execution_time_ms
         )
         
     except Exception as e:
@@ -405,6 +683,98 @@ async def demo_planning_with_skills(request: DemoPlanningRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/agent/demo-planning-with-skills/stream")
+async def demo_planning_with_skills_stream(request: DemoPlanningRequest):
+    """
+    Progressive (SSE) variant of ``/agent/demo-planning-with-skills``.
+    
+    Events, in order of availability:
+    - ``start``: request id and the template's skills
+    - ``skill``: one per template step, as soon as that step finishes
+    - ``plan``: the travel plan from ``create_travel_plan``
+    - ``done``: DAG layers, critical path and total execution time
+    
+    ``create_travel_plan`` only needs the request itself, so the
+    template's plan step is taken out of the DAG and run once, alongside
+    the template skills instead of after them; fast skills
+    such as destination info and weather reach the client while prices
+    and the plan are still being computed. Failures after the stream has
+    started are reported as an ``error`` event.
+    """
+    request_id = str(uuid.uuid4())
+    calls = _demo_skill_calls(request)
+    plan_step = _demo_plan_step(calls)
+    calls = [c for c in calls if c.get("id", c["skill"]) != plan_step]
+    app_logger.info(f"[{request_id}] Starting streaming demo planning for {request.destination}")
+    return event_stream_response(
+        _stream_demo_planning(request, request_id, calls),
+        "sse",
+        budget=settings.request_timeout_stream
+    )
+
+
+async def _stream_demo_planning(
+    request: DemoPlanningRequest,
+    request_id: str,
+    calls: List[Dict[str, Any]]
+) -> AsyncIterator[StreamEvent]:
+    import time
+    start_time = time.time()
+    mcp_client = get_mcp_client()
+    events: "asyncio.Queue[StreamEvent]" = asyncio.Queue()
+    
+    def on_step(step_id: str, result, elapsed_ms: float) -> None:
+        events.put_nowait(("skill", {
+            "step_id": step_id,
+            "skill": result.skill_name,
+            "success": result.success,
+            "error": result.error,
+            "data": result.result,
+            "elapsed_ms": elapsed_ms
+        }))
+    
+    async def plan() -> None:
+        plan_result = await mcp_client.call_skill(
+            "create_travel_plan", _demo_plan_parameters(request)
+        )
+        events.put_nowait(("plan", {
+            "travel_plan": plan_result.result if plan_result.success else {"error": plan_result.error}
+        }))
+    
+    yield "start", {
+        "request_id": request_id,
+        "destination": request.destination,
+        "skills_used": [c["skill"] for c in calls]
+    }
+    
+    dag_task = asyncio.ensure_future(SkillDAGExecutor(mcp_client).run(calls, on_step=on_step))
+    plan_task = asyncio.ensure_future(plan())
+    # Stop reading the queue once both producers are done and it is drained
+    producers = asyncio.gather(dag_task, plan_task)
+    try:
+        while not (producers.done() and events.empty()):
+            getter = asyncio.ensure_future(events.get())
+            await asyncio.wait({getter, producers}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+        
+        dag_result = producers.result()[0]
+        yield "done", {
+            "layers": dag_result.layers,
+            "critical_path": dag_result.critical_path,
+            "critical_path_ms": dag_result.critical_path_ms,
+            "execution_time_ms": (time.time() - start_time) * 1000
+        }
+    except Exception as e:
+        app_logger.error(f"[{request_id}] Streaming demo planning failed: {e}")
+        yield "error", {"request_id": request_id, "detail": str(e)}
+    finally:
+        dag_task.cancel()
+        plan_task.cancel()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -6,29 +6,56 @@ for the Travel Assistant Agent.
 """
 
 from .config import MCPServerConfig, MCPClientConfig, SkillDefinition
+from .validation import SkillInputValidator, SkillValidationError, compile_validator
+from .protocol import JSONRPCError, MCPDispatcher
 from .server import MCPServer, get_mcp_server, init_mcp_server
 from .skills import (
     BaseSkill,
-    SearchDestinationSkill,
-    QueryPricesSkill,
-    GetDestinationReviewsSkill,
-    GetWeatherSkill,
-    CreateTravelPlanSkill,
+    ExecutionMode,
+    SkillRegistry,
     get_all_skills,
     get_skill,
     get_skill_names,
     get_skill_definitions,
+    get_skill_validator,
     SKILL_REGISTRY
 )
 
 __version__ = "1.0.0"
 
+_LAZY_SKILL_CLASSES = {
+    "SearchDestinationSkill",
+    "QueryPricesSkill",
+    "BulkQuotePricesSkill",
+    "GetDestinationReviewsSkill",
+    "GetWeatherSkill",
+    "CreateTravelPlanSkill",
+}
+
+
+def __getattr__(name: str):
+    # Skill classes are re-exported lazily so importing the package stays cheap
+    if name in _LAZY_SKILL_CLASSES:
+        from . import skills
+        return getattr(skills, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Config
     "MCPServerConfig",
     "MCPClientConfig",
     "SkillDefinition",
     
+    # Validation
+    "SkillInputValidator",
+    "SkillValidationError",
+    "compile_validator",
+    
+    # Protocol
+    "JSONRPCError",
+    "MCPDispatcher",
+    
     # Server
     "MCPServer",
     "get_mcp_server",
@@ -36,14 +63,18 @@ __all__ = [
     
     # Skills
     "BaseSkill",
+    "ExecutionMode",
     "SearchDestinationSkill",
     "QueryPricesSkill",
+    "BulkQuotePricesSkill",
     "GetDestinationReviewsSkill",
     "GetWeatherSkill",
     "CreateTravelPlanSkill",
+    "SkillRegistry",
     "get_all_skills",
     "get_skill",
     "get_skill_names",
     "get_skill_definitions",
+    "get_skill_validator",
     "SKILL_REGISTRY",
 ]
@@ -0,0 +1,62 @@
+"""
+Run the MCP Server as a standalone process.
+
+    python -m mcp_server --transport stdio
+    python -m mcp_server --transport sse --host 0.0.0.0 --port 8765
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+from .config import MCPServerConfig
+from .transport import run_server
+
+
+def main(argv=None) -> None:
+    defaults = MCPServerConfig()
+    parser = argparse.ArgumentParser(
+        prog="python -m mcp_server",
+        description="Serve travel assistant skills over JSON-RPC"
+    )
+    parser.add_argument("--transport", choices=["stdio", "sse"], default=defaults.transport)
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    parser.add_argument("--process-pool-workers", type=int, default=None)
+    parser.add_argument(
+        "--no-process-pool", action="store_true",
+        help="run process-mode skills on threads instead"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
+    config = MCPServerConfig(
+        transport=args.transport,
+        host=args.host,
+        port=args.port,
+        process_pool_enabled=not args.no_process_pool,
+        process_pool_workers=args.process_pool_workers
+    )
+
+    stdout = None
+    if args.transport == "stdio":
+        # stdout carries the protocol: keep a private handle on it and send
+        # anything else written to fd 1 (stray prints, libraries) to stderr
+        stdout = os.fdopen(os.dup(sys.stdout.fileno()), "wb", buffering=0)
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    try:
+        asyncio.run(run_server(config, stdout=stdout))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
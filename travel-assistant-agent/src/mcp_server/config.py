@@ -2,7 +2,7 @@
 MCP Server configuration module
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -13,14 +13,64 @@ class MCPServerConfig(BaseModel):
     transport: str = "stdio"  # stdio or sse
     enabled: bool = True
     skills: List[str] = Field(default_factory=list)
+    # Max calls of one batch executing at the same time
+    batch_concurrency: int = Field(default=16, ge=1)
+    # Max concurrent batch executions of any single skill (server-wide)
+    skill_concurrency: int = Field(default=8, ge=1)
+    # Per-skill overrides for skill_concurrency
+    skill_concurrency_limits: Dict[str, int] = Field(default_factory=dict)
+    # Capacity of the recent-calls ring buffer
+    history_size: int = Field(default=1000, ge=1)
+    # Keep full call parameters in history records (otherwise only their names)
+    history_record_parameters: bool = False
+    # Skill execution pools (see BaseSkill.execution_mode)
+    process_pool_enabled: bool = True  # when False, process-mode skills use threads
+    process_pool_workers: Optional[int] = Field(default=None, ge=1)  # default: CPU count
+    thread_pool_workers: Optional[int] = Field(default=None, ge=1)
+    process_start_method: str = "spawn"
 
 
 class MCPClientConfig(BaseModel):
     """MCP Client Configuration for Agent"""
     server_url: Optional[str] = None
-    transport: str = "stdio"
+    # inprocess (call the global MCPServer), stdio (child process) or sse
+    transport: str = "inprocess"
+    # Command starting the stdio server (default: python -m mcp_server --transport stdio)
+    server_command: Optional[List[str]] = None
+    # Default per-attempt skill timeout in seconds, and per-skill overrides
     timeout: int = 30
-    retry_attempts: int = 3
+    skill_timeouts: Dict[str, float] = Field(default_factory=dict)
+    # Attempts per skill call (including the first); retries back off
+    # exponentially with full jitter, capped at retry_backoff_max seconds
+    retry_attempts: int = Field(default=3, ge=1)
+    retry_backoff: float = Field(default=0.1, ge=0)
+    retry_backoff_max: float = Field(default=2.0, ge=0)
+    # Open a skill's circuit after this many consecutive failures
+    circuit_failure_threshold: int = Field(default=5, ge=1)
+    circuit_reset_timeout: float = Field(default=30.0, gt=0)
+    # Hedged requests: start a second attempt once an attempt outlives the
+    # skill's observed p95 latency (needs hedge_min_samples observations)
+    hedge_requests: bool = False
+    hedge_percentile: float = Field(default=95.0, gt=0, lt=100)
+    hedge_min_samples: int = Field(default=20, ge=1)
+    # Admission control (see agents.admission): concurrent skill executions,
+    # globally and per skill, and how many calls may wait for a slot
+    max_concurrent_calls: int = Field(default=64, ge=1)
+    max_queued_calls: int = Field(default=256, ge=0)
+    skill_call_limits: Dict[str, int] = Field(default_factory=dict)
+    skill_queue_limit: Optional[int] = Field(default=None, ge=0)
+    # Share of max_concurrent_calls reserved for waiting batch-priority calls
+    batch_min_share: float = Field(default=0.1, ge=0, le=1)
+    # Floor for the Retry-After hint given to rejected calls (seconds)
+    admission_retry_after: float = Field(default=1.0, gt=0)
+    # Result cache (see agents.skill_cache)
+    cache_enabled: bool = True
+    cache_max_entries: int = Field(default=1024, ge=1)
+    cache_max_bytes: int = Field(default=16 * 1024 * 1024, ge=1)
+    # Per-skill freshness overrides in seconds; 0 disables caching for a skill
+    cache_ttls: Dict[str, float] = Field(default_factory=dict)
+    # Share one execution between identical concurrent calls
+    coalesce_calls: bool = True
 
 
 class SkillDefinition(BaseModel):
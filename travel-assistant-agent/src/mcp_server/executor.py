@@ -0,0 +1,148 @@
+"""
+Skill execution backends
+
+Dispatches ``BaseSkill.execute`` according to the skill's execution mode:
+inline on the event loop, in a worker thread, or in a worker process. The
+pools are created on first use and owned by the ``MCPServer``, which warms
+them up on start and shuts them down on stop.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Optional
+
+from .config import MCPServerConfig
+from .skills import get_skill
+from .skills.base_skill import BaseSkill, ExecutionMode
+
+logger = logging.getLogger(__name__)
+
+_thread_local = threading.local()
+
+
+def _run_coroutine(coro) -> Any:
+    """Run a coroutine to completion on this thread's private event loop"""
+    loop = getattr(_thread_local, "loop", None)
+    if loop is None:
+        loop = _thread_local.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+
+def _execute_in_thread(skill: BaseSkill, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    return _run_coroutine(skill.execute(**parameters))
+
+
+def _init_worker(skill_names: Iterable[str]) -> None:
+    """Process pool initializer: import skills before the first real call"""
+    for name in skill_names:
+        get_skill(name)
+
+
+def _ping() -> bool:
+    return True
+
+
+def _execute_in_process(skill_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    skill = get_skill(skill_name)
+    if skill is None:
+        raise LookupError(f"Skill '{skill_name}' not found in worker process")
+    return _run_coroutine(skill.execute(**parameters))
+
+
+class SkillExecutor:
+    """Runs skills inline, on a thread pool or on a process pool"""
+
+    def __init__(self, config: MCPServerConfig = None):
+        self.config = config or MCPServerConfig()
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._preload: tuple = ()
+
+    async def run(
+        self,
+        skill: BaseSkill,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute a skill in the pool its execution mode asks for"""
+        mode = ExecutionMode(skill.execution_mode)
+
+        if mode is ExecutionMode.PROCESS and self.config.process_pool_enabled:
+            return await self._run_in_process(skill.name, parameters)
+        if mode is not ExecutionMode.INLINE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_thread_pool(), _execute_in_thread, skill, parameters
+            )
+        return await skill.execute(**parameters)
+
+    async def warm_up(self, process_skills: Iterable[str] = ()) -> None:
+        """
+        Start every process pool worker ahead of traffic.
+
+        Workers import ``process_skills`` in their initializer, so the
+        first real call does not pay for interpreter start-up and imports.
+        """
+        self._preload = tuple(process_skills)
+        if not self._preload or not self.config.process_pool_enabled:
+            return
+        pool = self._get_process_pool()
+        loop = asyncio.get_running_loop()
+        workers = self._process_workers()
+        await asyncio.gather(
+            *(loop.run_in_executor(pool, _ping) for _ in range(workers))
+        )
+        logger.info(f"Process pool warmed up with {workers} workers")
+
+    def shutdown(self) -> None:
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    async def _run_in_process(self, skill_name: str, parameters: Dict[str, Any]):
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool()
+        try:
+            return await loop.run_in_executor(
+                pool, _execute_in_process, skill_name, parameters
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool next time
+            logger.error("Skill process pool broken, recreating on next call")
+            if self._process_pool is pool:
+                self._process_pool = None
+            raise
+
+    def _get_thread_pool(self) -> Executor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.config.thread_pool_workers,
+                thread_name_prefix="mcp-skill"
+            )
+        return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._process_workers(),
+                # spawn: never fork a process that runs an event loop and threads
+                mp_context=multiprocessing.get_context(self.config.process_start_method),
+                initializer=_init_worker,
+                initargs=(self._preload,)
+            )
+        return self._process_pool
+
+    def _process_workers(self) -> int:
+        return self.config.process_pool_workers or os.cpu_count() or 1
+
+
+__all__ = [
+    "SkillExecutor",
+]
@@ -0,0 +1,121 @@
+"""
+MCP Server call metrics
+
+Bounded-memory bookkeeping for skill calls: a fixed-capacity ring buffer
+of recent calls and per-skill streaming aggregates (count, errors and a
+log-bucketed latency histogram for percentiles).
+"""
+
+import math
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """
+    Streaming latency histogram with geometric buckets.
+
+    Bucket ``i`` covers ``(MIN_MS * GROWTH**(i-1), MIN_MS * GROWTH**i]``, so
+    percentiles are accurate to within one bucket (~10% relative error)
+    while memory stays constant no matter how many samples are recorded.
+    """
+
+    MIN_MS = 0.01
+    GROWTH = 1.2
+    BUCKETS = 96  # covers up to ~400 seconds; slower samples land in the last bucket
+
+    def __init__(self):
+        self.counts: List[int] = [0] * self.BUCKETS
+        self.total = 0
+
+    def record(self, value_ms: float) -> None:
+        if value_ms <= self.MIN_MS:
+            index = 0
+        else:
+            index = math.ceil(math.log(value_ms / self.MIN_MS, self.GROWTH))
+        self.counts[min(index, self.BUCKETS - 1)] += 1
+        self.total += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``pct`` percentile"""
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(self.total * pct / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.MIN_MS * self.GROWTH ** index
+        return self.MIN_MS * self.GROWTH ** (self.BUCKETS - 1)
+
+
+class SkillCallStats:
+    """Constant-memory aggregates for one skill"""
+
+    def __init__(self):
+        self.count = 0
+        self.error_count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+        self.latency = LatencyHistogram()
+
+    def record(self, elapsed_ms: float, success: bool) -> None:
+        self.count += 1
+        if not success:
+            self.error_count += 1
+        self.total_ms += elapsed_ms
+        self.min_ms = elapsed_ms if self.min_ms is None else min(self.min_ms, elapsed_ms)
+        self.max_ms = elapsed_ms if self.max_ms is None else max(self.max_ms, elapsed_ms)
+        self.latency.record(elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "error_count": self.error_count,
+            "error_rate": self.error_count / self.count if self.count else 0.0,
+            "avg_ms": self.total_ms / self.count if self.count else None,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.latency.percentile(50),
+            "p90_ms": self.latency.percentile(90),
+            "p95_ms": self.latency.percentile(95),
+            "p99_ms": self.latency.percentile(99),
+        }
+
+
+class CallHistory:
+    """Fixed-capacity ring buffer of recent call records"""
+
+    def __init__(self, capacity: int = 1000):
+        self._records: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self.total_recorded = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._records.maxlen
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self._records.append(record)
+        self.total_recorded += 1
+
+    def recent(self, limit: int = 50, skill_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Newest-first records, walking only as far back as needed"""
+        records = reversed(self._records)
+        if skill_name:
+            records = (r for r in records if r["skill_name"] == skill_name)
+        return list(islice(records, limit))
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+__all__ = [
+    "LatencyHistogram",
+    "SkillCallStats",
+    "CallHistory",
+]
@@ -0,0 +1,273 @@
+"""
+MCP JSON-RPC protocol
+
+JSON-RPC 2.0 message framing and the method dispatcher shared by every
+transport. Messages are framed as one compact JSON document per line
+(stdio) or per SSE ``message`` event.
+
+Methods (params -> result):
+
+- ``initialize``: ``{}`` -> server info and capabilities
+- ``ping``: ``{}`` -> ``{}``
+- ``skills/list``: ``{}`` -> ``{"skills": [definition, ...]}``
+- ``skills/call``: ``{"name", "arguments", "timeout"?}`` -> ``MCPServer.call_skill``
+  response; ``timeout`` is the caller's remaining budget in seconds
+- ``server/metrics``: ``{"skill_name"?}`` -> per-skill call aggregates
+- ``server/history``: ``{"limit"?, "skill_name"?}`` -> recent calls, newest first
+
+A skill that fails (unknown skill, invalid parameters, exception) still
+produces a *result* with ``success: false`` and an ``error_type``; JSON-RPC
+errors are reserved for protocol-level problems. Only ``internal`` failures
+(an unexpected exception inside the skill) may succeed when tried again.
+
+Batch frames (a JSON array of requests) are executed concurrently and,
+unlike plain JSON-RPC batches, answered with one response frame per
+request in completion order; clients correlate responses by id.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+JSONRPC_VERSION = "2.0"
+PROTOCOL_VERSION = "2024-11-05"
+
+# Standard JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# ``error_type`` of a failed skills/call result
+SKILL_NOT_FOUND = "not_found"
+INVALID_ARGUMENTS = "invalid_params"      # schema violations and ValueErrors raised by the skill
+DEADLINE_EXCEEDED = "deadline_exceeded"
+SKILL_INTERNAL_ERROR = "internal"
+
+
+class JSONRPCError(Exception):
+    """A JSON-RPC error response (raised by handlers, re-raised by clients)"""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        self.code = code
+        self.message = message
+        self.data = data
+        super().__init__(f"[{code}] {message}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        error = {"code": self.code, "message": self.message}
+        if self.data is not None:
+            error["data"] = self.data
+        return error
+
+    @classmethod
+    def from_dict(cls, error: Dict[str, Any]) -> "JSONRPCError":
+        return cls(
+            error.get("code", INTERNAL_ERROR),
+            error.get("message", "Unknown error"),
+            error.get("data")
+        )
+
+
+def make_request(request_id: Optional[int], method: str, params: Any = None) -> Dict[str, Any]:
+    """Build a request; ``request_id=None`` builds a notification"""
+    message = {"jsonrpc": JSONRPC_VERSION, "method": method}
+    if params is not None:
+        message["params"] = params
+    if request_id is not None:
+        message["id"] = request_id
+    return message
+
+
+def make_response(request_id: Any, result: Any) -> Dict[str, Any]:
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
+
+
+def make_error(request_id: Any, error: JSONRPCError) -> Dict[str, Any]:
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error.to_dict()}
+
+
+def encode_message(message: Any) -> bytes:
+    """Serialize a message as one newline-terminated line"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def decode_message(data: Union[bytes, str]) -> Any:
+    try:
+        return json.loads(data)
+    except ValueError as e:
+        raise JSONRPCError(PARSE_ERROR, f"Parse error: {e}")
+
+
+class MCPDispatcher:
+    """
+    Routes JSON-RPC requests to an ``MCPServer``.
+
+    ``handle`` never raises: every request yields a response message and
+    every notification yields ``None``, so transports can run each
+    incoming message as an independent task and write responses back in
+    whatever order they complete.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self._methods = {
+            "initialize": self._initialize,
+            "ping": self._ping,
+            "skills/list": self._list_skills,
+            "skills/call": self._call_skill,
+            "server/metrics": self._metrics,
+            "server/history": self._history,
+        }
+        # Batch entries share the server's batch concurrency limits
+        self._batch_methods = {**self._methods, "skills/call": self._call_skill_limited}
+
+    async def handle(self, message: Any, in_batch: bool = False) -> Optional[Dict[str, Any]]:
+        """Handle one decoded message and return the response to send, if any"""
+        request_id = message.get("id") if isinstance(message, dict) else None
+        try:
+            if (
+                not isinstance(message, dict)
+                or message.get("jsonrpc") != JSONRPC_VERSION
+                or not isinstance(message.get("method"), str)
+            ):
+                raise JSONRPCError(INVALID_REQUEST, "Invalid Request")
+            methods = self._batch_methods if in_batch else self._methods
+            result = await self._invoke(methods, message["method"], message.get("params"))
+        except JSONRPCError as e:
+            return make_error(request_id, e)
+        except Exception as e:
+            logger.exception(f"Error handling {message.get('method')!r}")
+            return make_error(request_id, JSONRPCError(INTERNAL_ERROR, str(e)))
+
+        if "id" not in message:
+            return None
+        return make_response(request_id, result)
+
+    async def handle_batch(
+        self,
+        messages: List[Any],
+        send: Callable[[Dict[str, Any]], Awaitable[None]]
+    ) -> None:
+        """
+        Handle a batch frame, sending each response as soon as it is ready.
+
+        A fixed pool of ``config.batch_concurrency`` workers drains the
+        batch, and skill calls hold their skill's semaphore, exactly as
+        in ``MCPServer.call_skills_batch``.
+        """
+        if not messages:
+            await send(make_error(None, JSONRPCError(INVALID_REQUEST, "Empty batch")))
+            return
+
+        pending = iter(messages)
+
+        async def worker():
+            for message in pending:
+                response = await self.handle(message, in_batch=True)
+                if response is not None:
+                    await send(response)
+
+        limit = min(self.server.config.batch_concurrency, len(messages))
+        await asyncio.gather(*(worker() for _ in range(limit)))
+
+    async def call(self, method: str, params: Any = None) -> Any:
+        """Invoke a method directly, raising ``JSONRPCError`` on failure"""
+        return await self._invoke(self._methods, method, params)
+
+    async def _invoke(self, methods: Dict[str, Callable], method: str, params: Any) -> Any:
+        handler = methods.get(method)
+        if handler is None:
+            raise JSONRPCError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        if params is None:
+            params = {}
+        if not isinstance(params, dict):
+            raise JSONRPCError(INVALID_PARAMS, "params must be an object")
+        return await handler(params)
+
+    async def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        from . import __version__
+        return {
+            "protocolVersion": PROTOCOL_VERSION,
+            "serverInfo": {"name": "travel-assistant-skills", "version": __version__},
+            "capabilities": {"skills": {}}
+        }
+
+    async def _ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    async def _list_skills(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"skills": self.server.list_skills()}
+
+    async def _call_skill(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._bounded_call(self.server.call_skill, params)
+
+    async def _call_skill_limited(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._bounded_call(self.server.call_skill_limited, params)
+
+    async def _bounded_call(
+        self,
+        call_skill: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run a skill call, abandoning it once the caller's budget is spent"""
+        name = params.get("name")
+        if not isinstance(name, str):
+            raise JSONRPCError(INVALID_PARAMS, "'name' must be a string")
+        timeout = params.get("timeout")
+        if timeout is not None and not isinstance(timeout, (int, float)):
+            raise JSONRPCError(INVALID_PARAMS, "'timeout' must be a number")
+        call = call_skill(name, params.get("arguments") or {})
+        if timeout is None:
+            return await call
+        try:
+            return await asyncio.wait_for(call, max(0.0, timeout))
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "skill_name": name,
+                "error": f"Skill '{name}' abandoned: caller's deadline of {timeout:.3f}s passed",
+                "error_type": DEADLINE_EXCEEDED,
+                "deadline_exceeded": True
+            }
+
+    async def _metrics(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        history = self.server.call_history
+        return {
+            "skills": self.server.get_skill_metrics(params.get("skill_name")),
+            "history": {
+                "size": len(history),
+                "capacity": history.capacity,
+                "total_recorded": history.total_recorded
+            }
+        }
+
+    async def _history(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        calls = self.server.get_call_history(
+            params.get("limit", 50), params.get("skill_name")
+        )
+        return {"calls": calls, "count": len(calls)}
+
+
+__all__ = [
+    "JSONRPCError",
+    "MCPDispatcher",
+    "make_request",
+    "make_response",
+    "make_error",
+    "encode_message",
+    "decode_message",
+    "PARSE_ERROR",
+    "INVALID_REQUEST",
+    "METHOD_NOT_FOUND",
+    "INVALID_PARAMS",
+    "INTERNAL_ERROR",
+    "SKILL_NOT_FOUND",
+    "INVALID_ARGUMENTS",
+    "DEADLINE_EXCEEDED",
+    "SKILL_INTERNAL_ERROR",
+]
@@ -7,12 +7,24 @@ that wraps travel assistant skills for agent integration.
 
 import asyncio
 import json
+import time
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 import logging
 
 from .config import MCPServerConfig, SkillDefinition
-from .skills import get_skill, get_skill_definitions, get_skill_names
+from .executor import SkillExecutor
+from .metrics import CallHistory, SkillCallStats
+from .protocol import INVALID_ARGUMENTS, SKILL_INTERNAL_ERROR, SKILL_NOT_FOUND
+from .skills import (
+    SKILL_REGISTRY,
+    ExecutionMode,
+    get_skill,
+    get_skill_definitions,
+    get_skill_names,
+    get_skill_validator
+)
+from .validation import SkillValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +40,25 @@ class MCPServer:
     def __init__(self, config: MCPServerConfig = None):
         self.config = config or MCPServerConfig()
         self.running = False
-        self.call_history: List[Dict] = []
+        self.call_history = CallHistory(self.config.history_size)
+        self.skill_stats: Dict[str, SkillCallStats] = {}
+        self._skill_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.executor = SkillExecutor(self.config)
         
     async def start(self):
-        """Start the MCP server"""
+        """Start the MCP server and warm up the skill process pool"""
+        process_skills = [
+            name for name in SKILL_REGISTRY
+            if SKILL_REGISTRY.execution_mode(name) is ExecutionMode.PROCESS
+        ]
+        await self.executor.warm_up(process_skills)
         self.running = True
         logger.info(f"MCP Server started on {self.config.host}:{self.config.port}")
     
     async def stop(self):
         """Stop the MCP server"""
         self.running = False
+        self.executor.shutdown()
         logger.info("MCP Server stopped")
     
     def list_skills(self) -> List[Dict]:
@@ -69,6 +90,7 @@ class MCPServer:
             Skill execution result
         """
         start_time = datetime.now()
+        started = time.perf_counter()
         
         try:
             skill = get_skill(skill_name)
@@ -76,34 +98,30 @@ class MCPServer:
                 return {
                     "success": False,
                     "error": f"Skill '{skill_name}' not found",
+                    "error_type": SKILL_NOT_FOUND,
                     "available_skills": get_skill_names()
                 }
             
-            # Validate required parameters
-            input_schema = skill.input_schema
-            required = input_schema.get("required", [])
-            missing = [p for p in required if p not in parameters]
-            
-            if missing:
+            # Validate, coerce and apply defaults with the precompiled validator
+            validator = get_skill_validator(skill_name)
+            try:
+                parameters = validator(parameters)
+            except SkillValidationError as e:
+                error = f"Invalid parameters: {e}"
+                self._record_call(skill_name, parameters, start_time, started, error)
                 return {
                     "success": False,
-                    "error": f"Missing required parameters: {missing}",
+                    "error": error,
+                    "error_type": INVALID_ARGUMENTS,
                     "skill_name": skill_name,
-                    "required_params": required
+                    "validation_errors": e.errors,
+                    "required_params": validator.required
                 }
             
-            # Execute skill
-            result = await skill.execute(**parameters)
+            # Execute skill inline, on a thread or in a worker process
+            result = await self.executor.run(skill, parameters)
             
-            # Record call
-            call_record = {
-                "timestamp": start_time.isoformat(),
-                "skill_name": skill_name,
-                "parameters": parameters,
-                "success": True,
-                "execution_time_ms": (datetime.now() - start_time).total_seconds() * 1000
-            }
-            self.call_history.append(call_record)
+            self._record_call(skill_name, parameters, start_time, started)
             
             return {
                 "success": True,
@@ -111,51 +129,139 @@ class MCPServer:
                 "result": result
             }
             
-        except Exception as e:
-            logger.error(f"Error executing skill {skill_name}: {e}")
-            call_record = {
-                "timestamp": start_time.isoformat(),
-                "skill_name": skill_name,
-                "parameters": parameters,
+        except ValueError as e:
+            # The skill rejected its input: the same call fails the same way again
+            logger.warning(f"Skill {skill_name} rejected its parameters: {e}")
+            self._record_call(skill_name, parameters, start_time, started, str(e))
+            
+            return {
                 "success": False,
+                "skill_name": skill_name,
                 "error": str(e),
-                "execution_time_ms": (datetime.now() - start_time).total_seconds() * 1000
+                "error_type": INVALID_ARGUMENTS
             }
-            self.call_history.append(call_record)
+        except asyncio.CancelledError:
+            # Abandoned by the caller's deadline (or shutdown): still count it
+            self._record_call(skill_name, parameters, start_time, started, "cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Error executing skill {skill_name}: {e}")
+            self._record_call(skill_name, parameters, start_time, started, str(e))
             
             return {
                 "success": False,
                 "skill_name": skill_name,
-                "error": str(e)
+                "error": str(e),
+                "error_type": SKILL_INTERNAL_ERROR
             }
     
-    async def call_skills_batch(self, calls: List[Dict]) -> List[Dict]:
+    def _record_call(
+        self,
+        skill_name: str,
+        parameters: Dict[str, Any],
+        start_time: datetime,
+        started: float,
+        error: Optional[str] = None
+    ):
+        """Add a call to the ring buffer and the skill's aggregates"""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        call_record = {
+            "timestamp": start_time.isoformat(),
+            "skill_name": skill_name,
+            "success": error is None,
+            "execution_time_ms": elapsed_ms
+        }
+        if self.config.history_record_parameters:
+            call_record["parameters"] = parameters
+        else:
+            call_record["parameter_names"] = sorted(parameters)
+        if error is not None:
+            call_record["error"] = error
+        self.call_history.append(call_record)
+        
+        stats = self.skill_stats.get(skill_name)
+        if stats is None:
+            stats = self.skill_stats[skill_name] = SkillCallStats()
+        stats.record(elapsed_ms, success=error is None)
+    
+    async def call_skills_batch(
+        self,
+        calls: List[Dict],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict]:
         """
-        Execute multiple skills in batch.
+        Execute multiple skills in batch with bounded concurrency.
+        
+        A fixed pool of workers pulls calls off the batch, so at most
+        ``max_concurrency`` calls (default: ``config.batch_concurrency``)
+        are in flight and only that many coroutines exist regardless of
+        batch size. Each call additionally holds its skill's server-wide
+        semaphore (see ``config.skill_concurrency``).
         
         Args:
             calls: List of {"skill": skill_name, "parameters": params} dictionaries
+            max_concurrency: Optional override of the batch concurrency limit
             
         Returns:
-            List of execution results
+            List of execution results, in the same order as ``calls``
         """
-        results = []
-        for call in calls:
-            skill_name = call.get("skill") or call.get("name")
-            parameters = call.get("parameters") or call.get("input", {})
-            
-            result = await self.call_skill(skill_name, parameters)
-            results.append(result)
+        results: List[Optional[Dict]] = [None] * len(calls)
+        if not calls:
+            return []
         
+        limit = max_concurrency or self.config.batch_concurrency
+        pending = iter(enumerate(calls))
+        
+        async def worker():
+            for index, call in pending:
+                skill_name = call.get("skill") or call.get("name")
+                parameters = call.get("parameters") or call.get("input", {})
+                
+                results[index] = await self.call_skill_limited(skill_name, parameters)
+        
+        await asyncio.gather(*(worker() for _ in range(min(limit, len(calls)))))
         return results
     
-    def get_call_history(self) -> List[Dict]:
-        """Get history of all skill calls"""
-        return self.call_history
+    async def call_skill_limited(
+        self,
+        skill_name: str,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute a skill while holding its server-wide batch semaphore"""
+        async with self._skill_semaphore(skill_name):
+            return await self.call_skill(skill_name, parameters)
+    
+    def _skill_semaphore(self, skill_name: str) -> asyncio.Semaphore:
+        """Get (or lazily create) the concurrency semaphore for a skill"""
+        semaphore = self._skill_semaphores.get(skill_name)
+        if semaphore is None:
+            limit = self.config.skill_concurrency_limits.get(
+                skill_name, self.config.skill_concurrency
+            )
+            semaphore = asyncio.Semaphore(limit)
+            self._skill_semaphores[skill_name] = semaphore
+        return semaphore
+    
+    def get_call_history(
+        self,
+        limit: int = 50,
+        skill_name: Optional[str] = None
+    ) -> List[Dict]:
+        """Get the most recent skill calls, newest first"""
+        return self.call_history.recent(limit, skill_name)
+    
+    def get_skill_metrics(self, skill_name: Optional[str] = None) -> Dict[str, Dict]:
+        """Get per-skill call aggregates (count, error rate, latency percentiles)"""
+        if skill_name:
+            stats = self.skill_stats.get(skill_name)
+            return {skill_name: stats.to_dict()} if stats else {}
+        return {name: stats.to_dict() for name, stats in self.skill_stats.items()}
     
     def clear_history(self):
-        """Clear the call history"""
-        self.call_history = []
+        """Clear the call history and per-skill aggregates"""
+        self.call_history.clear()
+        self.skill_stats = {}
 
 
 # Singleton instance for easy access
@@ -1,63 +1,85 @@
 """Skills module for MCP Server
 
 This module exports all available skills for the MCP protocol.
+
+Skills are registered lazily (see ``registry.py``): importing this package
+reads the skill manifest but does not import any skill implementation.
 """
 
-from typing import Dict, List
-from .base_skill import BaseSkill
-from .destination import SearchDestinationSkill
-from .pricing import QueryPricesSkill
-from .reviews import GetDestinationReviewsSkill
-from .weather import GetWeatherSkill
-from .planning import CreateTravelPlanSkill
-
-
-# Registry of all available skills
-SKILL_REGISTRY: Dict[str, BaseSkill] = {
-    "search_destination": SearchDestinationSkill(),
-    "query_prices": QueryPricesSkill(),
-    "get_destination_reviews": GetDestinationReviewsSkill(),
-    "get_weather": GetWeatherSkill(),
-    "create_travel_plan": CreateTravelPlanSkill(),
+import importlib
+from typing import Dict, List, Optional
+from ..validation import SkillInputValidator
+from .base_skill import BaseSkill, ExecutionMode
+from .registry import SkillRegistry, SkillSpec
+
+
+# Registry of all available skills, loaded on first use
+SKILL_REGISTRY: SkillRegistry = SkillRegistry.from_manifest()
+
+# Skill classes exported by name; their modules are imported on access
+_SKILL_CLASS_MODULES = {
+    "SearchDestinationSkill": ".destination",
+    "QueryPricesSkill": ".pricing",
+    "BulkQuotePricesSkill": ".pricing",
+    "GetDestinationReviewsSkill": ".reviews",
+    "GetWeatherSkill": ".weather",
+    "CreateTravelPlanSkill": ".planning",
 }
 
 
+def __getattr__(name: str):
+    module_name = _SKILL_CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
+
 def get_all_skills() -> List[BaseSkill]:
-    """Get list of all registered skills"""
+    """Get list of all registered skills (loads every skill)"""
     return list(SKILL_REGISTRY.values())
 
 
 def get_skill_names() -> List[str]:
     """Get list of all skill names"""
-    return list(SKILL_REGISTRY.keys())
+    return list(SKILL_REGISTRY)
 
 
-def get_skill(name: str) -> BaseSkill:
-    """Get a specific skill by name"""
+def get_skill(name: str) -> Optional[BaseSkill]:
+    """Get a specific skill by name, loading it on first use"""
     return SKILL_REGISTRY.get(name)
 
 
+def get_skill_validator(name: str) -> Optional[SkillInputValidator]:
+    """Get the precompiled input validator for a skill"""
+    return SKILL_REGISTRY.validator(name)
+
+
 def get_skills_by_category(category: str) -> List[BaseSkill]:
     """Get skills filtered by category"""
-    return [s for s in SKILL_REGISTRY.values() if s.category == category]
+    return [SKILL_REGISTRY[name] for name in SKILL_REGISTRY.names_in_category(category)]
 
 
 def get_skill_definitions() -> List[Dict]:
     """Get all skill definitions for MCP registration"""
-    return [skill.to_definition() for skill in SKILL_REGISTRY.values()]
+    return SKILL_REGISTRY.definitions()
 
 
 __all__ = [
     "BaseSkill",
+    "ExecutionMode",
     "SearchDestinationSkill",
     "QueryPricesSkill",
+    "BulkQuotePricesSkill",
     "GetDestinationReviewsSkill",
     "GetWeatherSkill",
     "CreateTravelPlanSkill",
     "SKILL_REGISTRY",
+    "SkillRegistry",
+    "SkillSpec",
     "get_all_skills",
     "get_skill_names",
     "get_skill",
+    "get_skill_validator",
     "get_skills_by_category",
     "get_skill_definitions",
 ]
@@ -0,0 +1,6 @@
+"""Regenerate the built-in skill manifest: ``python -m mcp_server.skills``"""
+
+from .registry import MANIFEST_PATH, write_manifest
+
+write_manifest()
+print(f"Wrote {MANIFEST_PATH}")
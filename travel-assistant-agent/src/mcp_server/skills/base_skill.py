@@ -1,10 +1,18 @@
 """Base Skill class for all MCP Skills"""
 
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import Any, Dict
 import json
 
 
+class ExecutionMode(str, Enum):
+    """Where the MCP server runs a skill's execute()"""
+    INLINE = "inline"    # On the event loop: cheap or I/O-bound skills
+    THREAD = "thread"    # Worker thread: blocking I/O or GIL-releasing (NumPy) work
+    PROCESS = "process"  # Worker process: CPU-bound pure-Python work
+
+
 class BaseSkill(ABC):
     """Base class for all Claude Skills"""
     
@@ -12,6 +20,8 @@ class BaseSkill(ABC):
     description: str = "Base skill class"
     category: str = "general"
     version: str = "1.0.0"
+    # Skills in PROCESS mode must take and return picklable values
+    execution_mode: ExecutionMode = ExecutionMode.INLINE
     
     @property
     def input_schema(self) -> Dict[str, Any]:
@@ -0,0 +1,207 @@
+"""Read-only catalog data shared by the skills
+
+The destination, weather, review and itinerary data the skills serve is
+read from ``catalog.json`` once per process and frozen: mappings become
+``FrozenDict`` and lists become tuples. Every skill call shares those
+objects instead of rebuilding its data as literals.
+
+Skills answer with copy-on-write views (``CatalogStore.view``). A view
+is a new top-level dict that holds only the response's own fields and
+otherwise points at the shared frozen values. Callers may freely
+replace top-level keys of a result, but any attempt to modify shared
+nested data raises ``TypeError`` instead of corrupting the catalog for
+later calls. Frozen values serialize to JSON and pickle (for the process
+pool) like the plain dicts and lists they replace.
+"""
+
+import json
+import threading
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+
+from .destination_index import DestinationIndex
+
+if TYPE_CHECKING:
+    from .climatology import ClimateStore
+    from .quote_engine import QuoteEngine
+
+CATALOG_PATH = Path(__file__).with_name("catalog.json")
+
+# Placeholder in default entries, filled with the requested destination
+DESTINATION_PLACEHOLDER = "{destination}"
+
+
+class FrozenDict(dict):
+    """A ``dict`` that refuses modification after construction"""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("catalog data is read-only; copy it before modifying")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenDict":
+        return self
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to ``FrozenDict`` and lists to tuples"""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """A fully mutable deep copy of frozen catalog data"""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def unfreeze(value: Any) -> Any:
+    """
+    ``value`` with every ``FrozenDict`` and tuple replaced by a plain dict
+    or list, the types a JSON decoder produces.
+
+    Unlike ``thaw`` this copies only what is frozen: plain containers that
+    hold no frozen data are returned as they are, so data that was never
+    frozen costs a walk but no allocation.
+    """
+    if isinstance(value, FrozenDict):
+        return {key: unfreeze(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [unfreeze(item) for item in value]
+    if isinstance(value, dict):
+        copied = None
+        for key, item in value.items():
+            plain = unfreeze(item)
+            if plain is not item:
+                if copied is None:
+                    copied = dict(value)
+                copied[key] = plain
+        return value if copied is None else copied
+    if isinstance(value, list):
+        copied = None
+        for i, item in enumerate(value):
+            plain = unfreeze(item)
+            if plain is not item:
+                if copied is None:
+                    copied = list(value)
+                copied[i] = plain
+        return value if copied is None else copied
+    return value
+
+
+class CatalogStore:
+    """
+    Frozen catalog sections keyed by lower-case destination name.
+
+    Sections: ``destinations``, ``weather``, ``reviews`` and
+    ``itineraries``; ``defaults`` holds the generic entry for each
+    skill (``destination``, ``weather``, ``reviews``, ``itinerary``).
+    ``aliases`` lists the other names each destination is found by;
+    ``pricing`` holds the hotel and flight inventory and ``climate`` the
+    monthly weather normals.
+    """
+
+    def __init__(self, data: Mapping[str, Any]):
+        self._data: FrozenDict = freeze(dict(data))
+        # Top-level fields of each default entry that name the destination
+        self._templated: Dict[str, Tuple[str, ...]] = {
+            name: tuple(
+                key for key, value in entry.items()
+                if isinstance(value, str) and DESTINATION_PLACEHOLDER in value
+            )
+            for name, entry in self._data["defaults"].items()
+        }
+
+    @classmethod
+    def from_file(cls, path: Path = CATALOG_PATH) -> "CatalogStore":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def section(self, name: str) -> Mapping[str, Any]:
+        return self._data[name]
+
+    @cached_property
+    def destination_index(self) -> DestinationIndex:
+        """Name/alias index over ``destinations``, built on first use"""
+        return DestinationIndex.from_catalog(
+            self._data["destinations"], self._data.get("aliases")
+        )
+
+    @cached_property
+    def quote_engine(self) -> "QuoteEngine":
+        """Array-backed pricing over ``pricing``, built on first use"""
+        # Imported here so skills that never quote do not load NumPy
+        from .quote_engine import QuoteEngine
+        return QuoteEngine(self._data["pricing"])
+
+    @cached_property
+    def climatology(self) -> "ClimateStore":
+        """Day-of-year normals over ``climate``, memory-mapped on first use"""
+        from .climatology import ClimateStore
+        return ClimateStore.load(self._data["climate"])
+
+    def lookup(self, section: str, destination: str) -> Optional[FrozenDict]:
+        """The entry for ``destination`` (case- and whitespace-insensitive)"""
+        return self._data[section].get(destination.lower().strip())
+
+    def search(self, destination: str) -> Optional[FrozenDict]:
+        """The ``destinations`` entry best matching a free-text name, if any"""
+        match = self.destination_index.best(destination)
+        return None if match is None else self._data["destinations"][match.key]
+
+    def default(self, name: str, destination: str) -> Dict[str, Any]:
+        """View of the generic entry ``name`` with the destination filled in"""
+        entry = self._data["defaults"][name]
+        return self.view(entry, **{
+            key: entry[key].replace(DESTINATION_PLACEHOLDER, destination)
+            for key in self._templated[name]
+        })
+
+    @staticmethod
+    def view(entry: Mapping[str, Any], **overrides: Any) -> Dict[str, Any]:
+        """Copy-on-write result: a new top-level dict sharing ``entry``'s values"""
+        result = dict(entry)
+        result.update(overrides)
+        return result
+
+
+_catalog: Optional[CatalogStore] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> CatalogStore:
+    """The process-wide catalog, loaded on first use"""
+    global _catalog
+    if _catalog is None:
+        # Thread-mode skills may race here on first use
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = CatalogStore.from_file()
+    return _catalog
+
+
+__all__ = [
+    "CatalogStore",
+    "FrozenDict",
+    "freeze",
+    "thaw",
+    "unfreeze",
+    "get_catalog",
+]
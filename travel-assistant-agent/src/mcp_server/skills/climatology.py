@@ -0,0 +1,203 @@
+"""Per-day climate normals for weather forecasts
+
+``ClimateStore`` expands the catalog's monthly ``climate`` normals into
+one array shaped (destinations, 366 days of the year, fields), with a
+last row for destinations the catalog does not know. The array is
+written once to a cache file named after a digest of its source data,
+in a directory only the current user can write, and memory-mapped from
+there, so every process serving skills shares
+the same pages and nothing is recomputed per call. A forecast for any
+date range, or for many destinations at once, is a fancy-indexed slice
+of that array.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Overrides where compiled stores are cached between processes and restarts
+CLIMATOLOGY_CACHE_DIR_ENV = "CLIMATOLOGY_CACHE_DIR"
+
+FIELDS = ("temperature_high", "temperature_low", "precipitation_chance")
+
+DAYS_IN_YEAR = 366
+
+# Precipitation chance below each bound (%) maps to the condition at the same position
+_CONDITION_BOUNDS = np.array([20, 30, 40, 55])
+_CONDITIONS = np.array(["Sunny", "Partly Cloudy", "Cloudy", "Light Rain", "Rain"])
+
+# Mid-month day of a leap year, where each monthly normal is pinned
+_MONTH_DAYS = np.array([31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+_MID_MONTH = np.cumsum(_MONTH_DAYS) - _MONTH_DAYS / 2
+
+
+def day_of_year(days: np.ndarray) -> np.ndarray:
+    """
+    Row of each ``datetime64[D]`` date in a 366-day table.
+
+    Dates are numbered as in a leap year, so March 1st is always row 60
+    and February 29th only occurs in leap years.
+    """
+    years = days.astype("datetime64[Y]")
+    index = (days - years.astype("datetime64[D]")).astype(np.int64)
+    year = years.astype(np.int64) + 1970
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    return index + (~leap & (index >= 59))
+
+
+def expand_normals(monthly: Mapping[str, Sequence[float]]) -> np.ndarray:
+    """Monthly normals interpolated to every day of the year, shaped (366, fields)"""
+    days = np.arange(DAYS_IN_YEAR) + 0.5
+    return np.stack([
+        np.interp(days, _MID_MONTH, np.asarray(monthly[field], dtype=np.float64),
+                  period=DAYS_IN_YEAR)
+        for field in FIELDS
+    ], axis=-1).astype(np.float32)
+
+
+def default_cache_dir() -> Path:
+    """
+    ``$CLIMATOLOGY_CACHE_DIR`` if set, otherwise the user's cache directory
+    (``$XDG_CACHE_HOME`` or ``~/.cache``) under ``travel-assistant-agent``.
+    """
+    configured = os.environ.get(CLIMATOLOGY_CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "travel-assistant-agent"
+
+
+def _private_dir(path: Path) -> Path:
+    """
+    Create ``path`` with mode 0700, or check that an existing one is ours.
+
+    Raises ``OSError`` for a directory another user owns or can write to,
+    since whoever can write there decides what gets memory-mapped.
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if hasattr(os, "getuid"):
+        st = path.stat()
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            raise PermissionError(f"{path} is not private to this user")
+    return path
+
+
+def _load_cached(path: Path, shape: tuple) -> Optional[np.ndarray]:
+    """The memory-mapped array at ``path``, or None if it is unreadable or the wrong shape"""
+    try:
+        normals = np.load(path, mmap_mode="r")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Climatology cache {path} is unreadable ({e}); rebuilding it")
+        return None
+    if normals.shape != shape or normals.dtype != np.float32:
+        logger.warning(
+            f"Climatology cache {path} holds {normals.dtype}{normals.shape}, "
+            f"expected float32{shape}; rebuilding it"
+        )
+        return None
+    return normals
+
+
+class ClimateStore:
+    """Day-of-year climate normals per destination, usually memory-mapped"""
+
+    def __init__(self, keys: Sequence[str], normals: np.ndarray):
+        self._rows = {key: i for i, key in enumerate(keys)}
+        self._default_row = len(keys)
+        # (destinations + default, 366, fields)
+        self.normals = normals
+
+    @classmethod
+    def load(
+        cls, climate: Mapping[str, Any], cache_dir: Optional[Path] = None
+    ) -> "ClimateStore":
+        """
+        The store for the catalog's ``climate`` section.
+
+        Reuses a cache file compiled from the same data if there is one
+        with the expected shape and dtype, otherwise (re)compiles it.
+        ``cache_dir`` defaults to ``default_cache_dir()``. Falls back to
+        an in-memory array when the cache directory cannot be written or
+        is not private to this user.
+        """
+        keys = list(climate["destinations"])
+        shape = (len(keys) + 1, DAYS_IN_YEAR, len(FIELDS))
+        source = json.dumps(climate, sort_keys=True).encode()
+        name = f"climatology-{hashlib.sha256(source).hexdigest()[:16]}.npy"
+
+        normals = None
+        tmp = None
+        try:
+            path = _private_dir(Path(cache_dir or default_cache_dir())) / name
+            if path.exists():
+                cached = _load_cached(path, shape)
+                if cached is not None:
+                    return cls(keys, cached)
+            normals = cls._compile(climate, keys)
+            # Write then rename so concurrent loaders never map a partial file
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".npy")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, normals)
+            os.replace(tmp, path)
+        except (OSError, RuntimeError) as e:
+            # RuntimeError: Path.home() without a resolvable home directory
+            if tmp is not None and os.path.exists(tmp):
+                os.unlink(tmp)
+            logger.warning(f"Climatology cache unavailable ({e}); keeping it in memory")
+            return cls(keys, cls._compile(climate, keys) if normals is None else normals)
+
+        return cls(keys, np.load(path, mmap_mode="r"))
+
+    @staticmethod
+    def _compile(climate: Mapping[str, Any], keys: Sequence[str]) -> np.ndarray:
+        return np.stack(
+            [expand_normals(climate["destinations"][key]) for key in keys]
+            + [expand_normals(climate["default"])]
+        )
+
+    def row(self, destination: str) -> int:
+        """Row of ``destination`` (case- and whitespace-insensitive)"""
+        return self._rows.get(destination.lower().strip(), self._default_row)
+
+    def normals_for(self, rows: Sequence[int], start: date, days: int) -> np.ndarray:
+        """Normals for ``days`` dates from ``start``, shaped (rows, days, fields)"""
+        dates = np.datetime64(start, "D") + np.arange(days)
+        return self.normals[np.asarray(rows, dtype=np.int64)[:, None], day_of_year(dates)[None, :]]
+
+    def forecast(self, destination: str, start: date, days: int) -> List[Dict[str, Any]]:
+        """Daily forecast rows for one destination"""
+        values = np.rint(self.normals_for([self.row(destination)], start, days)[0]).astype(np.int64)
+        high, low, rain = values[:, 0], values[:, 1], values[:, 2]
+        conditions = _CONDITIONS[np.searchsorted(_CONDITION_BOUNDS, rain, side="right")]
+        dates = np.datetime_as_string(np.datetime64(start, "D") + np.arange(days))
+        return [
+            {
+                "date": day,
+                "temperature_high": h,
+                "temperature_low": lo,
+                "condition": condition,
+                "precipitation_chance": r,
+            }
+            for day, h, lo, condition, r in zip(
+                dates.tolist(), high.tolist(), low.tolist(), conditions.tolist(), rain.tolist()
+            )
+        ]
+
+
+__all__ = [
+    "CLIMATOLOGY_CACHE_DIR_ENV",
+    "ClimateStore",
+    "FIELDS",
+    "day_of_year",
+    "default_cache_dir",
+    "expand_normals",
+]
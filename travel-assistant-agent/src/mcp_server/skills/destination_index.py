@@ -0,0 +1,249 @@
+"""Indexed destination name matching
+
+``DestinationIndex`` resolves a free-text destination query to catalog
+keys without scanning the catalog. Every destination is indexed under
+its key, its display name and its aliases (e.g. 东京, 巴黎, Tokio), all
+normalized the same way (NFKC, case-folded, accents and punctuation
+removed). Three structures serve a query:
+
+- a hash map for exact names and aliases
+- a sorted name array for prefix matches (``bisect``)
+- an inverted trigram index for fuzzy matches (typos, substrings)
+
+Matches are ranked by score, so a query no longer resolves to whichever
+entry a linear substring scan happens to meet first. Fuzzy matching
+only runs when the exact, span and prefix matches leave room in the
+result. Its candidates come from pairwise set intersections of the
+query's rarest posting lists (at most ``RARE_GRAMS`` of them), so every
+name missing no more than ``RARE_GRAMS - 2`` of the query's grams (any
+single typo) is found. Grams shared by a large part of the catalog
+(" springs", "saint ") never generate candidates, so common words cannot
+pull in thousands of weak matches; they still count when candidates are
+scored. The intersections and overlap counts run in C, and only the few
+names they leave are scored in Python.
+"""
+
+import bisect
+import math
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+GRAM_SIZE = 3
+
+# Default cut-off below which fuzzy matches are not returned; one typo
+# in a name of five letters or more still scores above it
+MIN_SCORE = 0.5
+
+# Scores of the non-fuzzy match kinds (fuzzy scores are below 1.0)
+EXACT_SCORE = 1.0
+SPAN_SCORE = 0.8
+PREFIX_SCORE = 0.5
+
+# Prefix matches examined per query, in name order
+MAX_PREFIX_SCAN = 64
+
+# Posting lists intersected pairwise to generate fuzzy candidates
+RARE_GRAMS = 6
+
+# Grams on more than this share of names (and more than STOP_GRAM_MIN
+# names) do not generate fuzzy candidates
+STOP_GRAM_SHARE = 0.01
+STOP_GRAM_MIN = 64
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize(name: str) -> str:
+    """Case-folded, accent-free form with punctuation collapsed to spaces"""
+    text = unicodedata.normalize("NFKD", unicodedata.normalize("NFKC", name))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _SEPARATORS.sub(" ", text.casefold()).strip()
+
+
+def grams(name: str) -> Set[str]:
+    """Trigrams of a normalized name, padded so short names (and CJK) still index"""
+    padded = f"^{name}$"
+    if len(padded) <= GRAM_SIZE:
+        return {padded}
+    return {padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)}
+
+
+@dataclass(frozen=True)
+class DestinationMatch:
+    """One ranked match: the catalog key and the indexed name that matched"""
+
+    key: str
+    name: str
+    score: float
+    kind: str  # "exact", "span", "prefix" or "fuzzy"
+
+
+class DestinationIndex:
+    """
+    Name index over a destination catalog.
+
+    ``names`` maps each catalog key to the names it should be found by
+    (display name and aliases); the key itself is always indexed.
+    """
+
+    def __init__(self, names: Mapping[str, Iterable[str]]):
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        self._owners = array("I")
+        self._gram_counts = array("H")
+        self._exact: Dict[str, List[int]] = {}
+        postings: Dict[str, List[int]] = {}
+
+        for key, aliases in names.items():
+            entry = len(self._keys)
+            self._keys.append(key)
+            seen = set()
+            for alias in (key, *aliases):
+                name = normalize(alias)
+                if not name or name in seen:
+                    continue
+                seen.add(name)
+                slot = len(self._names)
+                self._names.append(name)
+                self._owners.append(entry)
+                self._exact.setdefault(name, []).append(slot)
+                name_grams = grams(name)
+                self._gram_counts.append(min(len(name_grams), 0xFFFF))
+                for gram in name_grams:
+                    postings.setdefault(gram, []).append(slot)
+
+        self._postings: Dict[str, FrozenSet[int]] = {
+            gram: frozenset(slots) for gram, slots in postings.items()
+        }
+        order = sorted(range(len(self._names)), key=self._names.__getitem__)
+        self._sorted_names: List[str] = [self._names[slot] for slot in order]
+        self._sorted_slots = array("I", order)
+        self._stop_size = max(STOP_GRAM_MIN, int(STOP_GRAM_SHARE * len(self._names)))
+
+    @classmethod
+    def from_catalog(
+        cls,
+        destinations: Mapping[str, Mapping[str, object]],
+        aliases: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> "DestinationIndex":
+        """Index catalog entries by key, ``destination`` field and aliases"""
+        aliases = aliases or {}
+        return cls({
+            key: (str(entry.get("destination", key)), *aliases.get(key, ()))
+            for key, entry in destinations.items()
+        })
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def best(self, query: str, min_score: float = MIN_SCORE) -> Optional[DestinationMatch]:
+        """The top-ranked match for ``query``, or None"""
+        matches = self.search(query, limit=1, min_score=min_score)
+        return matches[0] if matches else None
+
+    def search(self, query: str, limit: int = 5, min_score: float = MIN_SCORE) -> List[DestinationMatch]:
+        """
+        Ranked matches for ``query``, best first, at most one per key.
+
+        Exact names and aliases score 1.0. A name spelled out as a word
+        span of the query ("tokyo japan") scores ``SPAN_SCORE`` plus its
+        share of the query; a name the query is a prefix of scores at
+        least ``PREFIX_SCORE``. If those leave fewer than ``limit``
+        matches, the rest are ranked by trigram similarity: shared grams
+        over the larger gram set, capped below 1.0.
+        """
+        text = normalize(query)
+        if not text:
+            return []
+
+        scores: Dict[int, Tuple[float, int, str]] = {}
+
+        def offer(slot: int, score: float, kind: str) -> None:
+            entry = self._owners[slot]
+            if score > scores.get(entry, (-1.0,))[0]:
+                scores[entry] = (score, slot, kind)
+
+        for slot in self._exact.get(text, ()):
+            offer(slot, EXACT_SCORE, "exact")
+        if len(scores) >= limit:
+            return self._ranked(scores, limit)
+
+        self._match_spans(text, offer)
+        self._match_prefix(text, offer)
+        if len(scores) < limit:
+            self._match_grams(text, min_score, offer)
+        return self._ranked(scores, limit, min_score)
+
+    def _match_spans(self, text: str, offer) -> None:
+        words = text.split(" ")
+        for size in range(len(words) - 1, 0, -1):
+            for start in range(len(words) - size + 1):
+                span = " ".join(words[start:start + size])
+                for slot in self._exact.get(span, ()):
+                    offer(slot, SPAN_SCORE + (1 - SPAN_SCORE) * len(span) / len(text), "span")
+
+    def _match_prefix(self, text: str, offer) -> None:
+        position = bisect.bisect_left(self._sorted_names, text)
+        end = min(position + MAX_PREFIX_SCAN, len(self._sorted_names))
+        while position < end and self._sorted_names[position].startswith(text):
+            name = self._sorted_names[position]
+            if name != text:
+                offer(
+                    self._sorted_slots[position],
+                    PREFIX_SCORE + (1 - PREFIX_SCORE) * 0.5 * len(text) / len(name),
+                    "prefix",
+                )
+            position += 1
+
+    def _match_grams(self, text: str, cutoff: float, offer) -> None:
+        query = grams(text)
+        size = len(query)
+        lists = sorted((self._postings.get(gram, frozenset()) for gram in query), key=len)
+        needed = max(1, math.ceil(cutoff * size - 1e-9))
+        if needed == 1:
+            candidates = frozenset().union(*lists)
+        else:
+            rare = [
+                slots for slots in lists[:min(size - needed + 2, RARE_GRAMS)]
+                if len(slots) <= self._stop_size
+            ]
+            candidates = set()
+            for i, first in enumerate(rare):
+                for second in rare[i + 1:]:
+                    candidates |= first & second
+
+        overlap = Counter()
+        for slots in lists:
+            overlap.update(candidates & slots)
+        for slot, shared in overlap.items():
+            score = shared / max(size, self._gram_counts[slot])
+            if score >= cutoff:
+                offer(slot, min(score, 0.99), "fuzzy")
+
+    def _ranked(
+        self,
+        scores: Mapping[int, Tuple[float, int, str]],
+        limit: int,
+        min_score: float = 0.0,
+    ) -> List[DestinationMatch]:
+        # Ties go to the shorter name, then to catalog order
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1][0], len(self._names[item[1][1]]), item[0]),
+        )
+        return [
+            DestinationMatch(self._keys[entry], self._names[slot], round(score, 4), kind)
+            for entry, (score, slot, kind) in ranked[:limit]
+            if score >= min_score
+        ]
+
+
+__all__ = [
+    "DestinationIndex",
+    "DestinationMatch",
+    "normalize",
+]
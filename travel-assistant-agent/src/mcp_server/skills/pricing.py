@@ -1,16 +1,69 @@
 """QueryPricesSkill - Query hotel and flight prices for destinations"""
 
+from datetime import date, timedelta
 from typing import Any, Dict, List
-from .base_skill import BaseSkill
+from .base_skill import BaseSkill, ExecutionMode
+from .catalog import get_catalog
+from .quote_engine import SORT_KEYS, STANDARD_ROOM
+
+# Longest check-in window one price calendar covers, and its default span
+MAX_CALENDAR_DAYS = 366
+DEFAULT_CALENDAR_DAYS = 30
+
+_HOTEL_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "rating": {"type": "number"},
+        "price_per_night": {"type": "number"},
+        "total_price": {"type": "number"},
+        "amenities": {"type": "array", "items": {"type": "string"}},
+        "location": {"type": "string"}
+    }
+}
+
+_FLIGHT_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "airline": {"type": "string"},
+        "price": {"type": "number"},
+        "duration": {"type": "string"},
+        "stops": {"type": "integer"},
+        "class": {"type": "string"}
+    }
+}
+
+_CALENDAR_WINDOW_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "check_in": {"type": "string"},
+        "check_out": {"type": "string"},
+        "hotel": {"type": "string"},
+        "hotel_total": {"type": "number"},
+        "airline": {"type": "string"},
+        "flight_total": {"type": "number"},
+        "total": {"type": "number"}
+    }
+}
+
+_DATES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "check_in": {"type": "string"},
+        "check_out": {"type": "string"},
+        "nights": {"type": "integer"}
+    }
+}
 
 
 class QueryPricesSkill(BaseSkill):
     """Skill for querying hotel and flight prices"""
     
     name = "query_prices"
-    description = "Get pricing information for hotels and flights to help travelers plan their budget"
+    description = "Get pricing information for hotels and flights to help travelers plan their budget, or a price calendar of the cheapest check-in dates"
     category = "pricing"
     version = "1.0.0"
+    execution_mode = ExecutionMode.THREAD
     
     @property
     def input_schema(self) -> Dict[str, Any]:
@@ -32,17 +85,62 @@ class QueryPricesSkill(BaseSkill):
                 "guests": {
                     "type": "integer",
                     "description": "Number of guests",
-                    "default": 2
+                    "default": 2,
+                    "minimum": 1
                 },
                 "rooms": {
                     "type": "integer",
                     "description": "Number of rooms needed",
-                    "default": 1
+                    "default": 1,
+                    "minimum": 1
                 },
                 "flight_class": {
                     "type": "string",
                     "description": "Flight class (economy, business, first)",
                     "default": "economy"
+                },
+                "max_options": {
+                    "type": "integer",
+                    "description": "Also return up to this many ranked hotel x room type options (0: none)",
+                    "default": 0
+                },
+                "sort_by": {
+                    "type": "string",
+                    "enum": list(SORT_KEYS),
+                    "description": "Ordering of options",
+                    "default": "total_price"
+                },
+                "room_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Only quote these room types (standard, deluxe, family, suite)"
+                },
+                "max_total_price": {
+                    "type": "number",
+                    "description": "Drop options costing more than this for the stay"
+                },
+                "min_rating": {
+                    "type": "number",
+                    "description": "Drop options from hotels rated below this"
+                },
+                "flexible_from": {
+                    "type": "string",
+                    "description": "Calendar mode: earliest check-in date (YYYY-MM-DD) to price"
+                },
+                "flexible_to": {
+                    "type": "string",
+                    "description": "Calendar mode: latest check-in date (YYYY-MM-DD), 30 days on by default"
+                },
+                "stay_nights": {
+                    "type": "integer",
+                    "description": "Calendar mode: nights per stay (defaults to the check_in/check_out stay)",
+                    "minimum": 1,
+                    "maximum": MAX_CALENDAR_DAYS
+                },
+                "cheapest_windows": {
+                    "type": "integer",
+                    "description": "Calendar mode: number of cheapest check-in dates to return",
+                    "default": 5
                 }
             },
             "required": ["destination"]
@@ -54,48 +152,38 @@ class QueryPricesSkill(BaseSkill):
             "type": "object",
             "properties": {
                 "destination": {"type": "string"},
-                "dates": {
+                "dates": _DATES_SCHEMA,
+                "hotels": {"type": "array", "items": _HOTEL_ITEM_SCHEMA},
+                "flights": {"type": "array", "items": _FLIGHT_ITEM_SCHEMA},
+                "total_budget_estimate": {
                     "type": "object",
                     "properties": {
-                        "check_in": {"type": "string"},
-                        "check_out": {"type": "string"},
-                        "nights": {"type": "integer"}
-                    }
-                },
-                "hotels": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "rating": {"type": "number"},
-                            "price_per_night": {"type": "number"},
-                            "total_price": {"type": "number"},
-                            "amenities": {"type": "array", "items": {"type": "string"}},
-                            "location": {"type": "string"}
-                        }
+                        "budget": {"type": "string"},
+                        "hotel_total": {"type": "number"},
+                        "flight_total": {"type": "number"},
+                        "daily_budget": {"type": "number"}
                     }
                 },
-                "flights": {
+                "options": {
                     "type": "array",
                     "items": {
                         "type": "object",
                         "properties": {
-                            "airline": {"type": "string"},
-                            "price": {"type": "number"},
-                            "duration": {"type": "string"},
-                            "stops": {"type": "integer"},
-                            "class": {"type": "string"}
+                            **_HOTEL_ITEM_SCHEMA["properties"],
+                            "room_type": {"type": "string"},
+                            "rooms": {"type": "integer"}
                         }
                     }
                 },
-                "total_budget_estimate": {
+                "options_count": {"type": "integer"},
+                "calendar": {
                     "type": "object",
                     "properties": {
-                        "budget": {"type": "string"},
-                        "hotel_total": {"type": "number"},
-                        "flight_total": {"type": "number"},
-                        "daily_budget": {"type": "number"}
+                        "nights": {"type": "integer"},
+                        "room_type": {"type": "string"},
+                        "rooms": {"type": "integer"},
+                        "windows": {"type": "array", "items": _CALENDAR_WINDOW_SCHEMA},
+                        "cheapest": {"type": "array", "items": _CALENDAR_WINDOW_SCHEMA}
                     }
                 }
             },
@@ -109,85 +197,32 @@ class QueryPricesSkill(BaseSkill):
         check_out: str = None,
         guests: int = 2,
         rooms: int = 1,
-        flight_class: str = "economy"
+        flight_class: str = "economy",
+        max_options: int = 0,
+        sort_by: str = "total_price",
+        room_types: List[str] = None,
+        max_total_price: float = None,
+        min_rating: float = None,
+        flexible_from: str = None,
+        flexible_to: str = None,
+        stay_nights: int = None,
+        cheapest_windows: int = 5
     ) -> Dict[str, Any]:
-        """Execute price query with mock data"""
-        
-        # Calculate nights if dates provided
-        nights = 5  # default
-        if check_in and check_out:
-            try:
-                from datetime import datetime
-                start = datetime.strptime(check_in, "%Y-%m-%d")
-                end = datetime.strptime(check_out, "%Y-%m-%d")
-                nights = max(1, (end - start).days)
-            except:
-                pass
-        
-        # Mock hotel data
-        hotels = [
-            {
-                "name": "Grand Plaza Hotel",
-                "rating": 4.5,
-                "price_per_night": 250,
-                "total_price": 250 * nights * rooms,
-                "amenities": ["WiFi", "Pool", "Gym", "Restaurant", "Room Service"],
-                "location": "City Center"
-            },
-            {
-                "name": "Seaside Resort",
-                "rating": 4.8,
-                "price_per_night": 400,
-                "total_price": 400 * nights * rooms,
-                "amenities": ["WiFi", "Beach Access", "Spa", "Multiple Restaurants", "Concierge"],
-                "location": "Beachfront"
-            },
-            {
-                "name": "Budget Inn Express",
-                "rating": 3.8,
-                "price_per_night": 90,
-                "total_price": 90 * nights * rooms,
-                "amenities": ["WiFi", "Breakfast", "Parking"],
-                "location": "Near Airport"
-            }
-        ]
-        
-        # Mock flight data based on destination
-        flight_multipliers = {
-            "tokyo": {"base": 800, "duration": "12-14 hours"},
-            "paris": {"base": 700, "duration": "8-10 hours"},
-            "bali": {"base": 1100, "duration": "18-22 hours"},
-        }
-        
-        dest_lower = destination.lower().strip()
-        flight_info = flight_multipliers.get(dest_lower, {"base": 1000, "duration": "10-12 hours"})
+        """Execute price query against the vectorized quote engine"""
+        engine = get_catalog().quote_engine
+        nights = engine.stay_nights(check_in, check_out)
+        route = engine.route(destination)
         
-        class_multipliers = {"economy": 1.0, "business": 3.0, "first": 5.0}
-        multiplier = class_multipliers.get(flight_class, 1.0)
-        
-        flights = [
-            {
-                "airline": "Major Airline",
-                "price": int(flight_info["base"] * multiplier * guests),
-                "duration": flight_info["duration"],
-                "stops": 0 if dest_lower in ["tokyo", "paris", "bali"] else 1,
-                "class": flight_class
-            },
-            {
-                "airline": "Budget Carrier",
-                "price": int(flight_info["base"] * 0.7 * multiplier * guests),
-                "duration": f"{int(flight_info['duration'].split('-')[0]) + 4}-{int(flight_info['duration'].split('-')[1].split()[0]) + 4} hours",
-                "stops": 1,
-                "class": flight_class
-            }
-        ]
+        hotels = engine.rate_card(nights, rooms)
+        fares = engine.flight_prices([route], guests, flight_class)[0]
+        flights = engine.flights(route, fares, flight_class)
         
         # Calculate budget estimate
         hotel_total = hotels[0]["total_price"]
         flight_total = flights[0]["price"]
         total_estimate = hotel_total + flight_total
         
-        return {
+        result = {
             "destination": destination,
             "dates": {
                 "check_in": check_in or "TBD",
@@ -203,3 +238,207 @@ class QueryPricesSkill(BaseSkill):
                 "daily_budget": total_estimate // nights if nights > 0 else total_estimate
             }
         }
+        
+        if max_options > 0:
+            result["options"], result["options_count"] = engine.hotel_options(
+                nights,
+                guests=guests,
+                rooms=rooms,
+                room_types=room_types,
+                sort_by=sort_by,
+                max_total_price=max_total_price,
+                min_rating=min_rating,
+                limit=max_options
+            )
+        
+        if flexible_from:
+            result["calendar"] = self._calendar(
+                engine,
+                destination,
+                flexible_from,
+                flexible_to,
+                stay_nights or nights,
+                guests=guests,
+                rooms=rooms,
+                flight_class=flight_class,
+                cheapest_windows=cheapest_windows
+            )
+        
+        return result
+    
+    def _calendar(
+        self,
+        engine,
+        destination: str,
+        flexible_from: str,
+        flexible_to: str,
+        nights: int,
+        guests: int,
+        rooms: int,
+        flight_class: str,
+        cheapest_windows: int
+    ) -> Dict[str, Any]:
+        """Price every check-in date from flexible_from to flexible_to"""
+        try:
+            first = date.fromisoformat(flexible_from)
+            last = (
+                date.fromisoformat(flexible_to) if flexible_to
+                else first + timedelta(days=DEFAULT_CALENDAR_DAYS - 1)
+            )
+        except ValueError as e:
+            raise ValueError(f"Calendar dates must be YYYY-MM-DD: {e}") from None
+        if (last - first).days >= MAX_CALENDAR_DAYS:
+            raise ValueError(
+                f"Calendar window {first} to {last} exceeds {MAX_CALENDAR_DAYS} check-in dates"
+            )
+        if not 1 <= nights <= MAX_CALENDAR_DAYS:
+            raise ValueError(f"Calendar stays must be 1 to {MAX_CALENDAR_DAYS} nights, got {nights}")
+        
+        return engine.price_calendar(
+            destination,
+            first.isoformat(),
+            last.isoformat(),
+            nights,
+            guests=guests,
+            rooms=rooms,
+            flight_class=flight_class,
+            cheapest=cheapest_windows
+        )
+
+
+class BulkQuotePricesSkill(BaseSkill):
+    """Skill for quoting many destinations and date pairs in one call"""
+    
+    name = "bulk_quote_prices"
+    description = "Quote hotels and flights for many destinations and date pairs in one call, with the cheapest total for each"
+    category = "pricing"
+    version = "1.0.0"
+    execution_mode = ExecutionMode.THREAD
+    
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "destinations": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Destinations to quote"
+                },
+                "date_pairs": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "check_in": {"type": "string"},
+                            "check_out": {"type": "string"}
+                        }
+                    },
+                    "description": "Check-in/check-out dates (YYYY-MM-DD) to quote for every destination"
+                },
+                "guests": {
+                    "type": "integer",
+                    "description": "Number of guests",
+                    "default": 2,
+                    "minimum": 1
+                },
+                "rooms": {
+                    "type": "integer",
+                    "description": "Minimum number of rooms (more are booked if the party does not fit)",
+                    "default": 1,
+                    "minimum": 1
+                },
+                "flight_class": {
+                    "type": "string",
+                    "description": "Flight class (economy, business, first)",
+                    "default": "economy"
+                },
+                "room_type": {
+                    "type": "string",
+                    "description": "Room type to quote (standard, deluxe, family, suite)",
+                    "default": STANDARD_ROOM
+                },
+                "hotels_per_quote": {
+                    "type": "integer",
+                    "description": "Ranked hotels listed in each quote",
+                    "default": 3,
+                    "minimum": 0
+                },
+                "sort_by": {
+                    "type": "string",
+                    "enum": list(SORT_KEYS),
+                    "description": "Ordering of hotels within a quote",
+                    "default": "total_price"
+                }
+            },
+            "required": ["destinations"]
+        }
+    
+    @property
+    def output_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "quotes": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "destination": {"type": "string"},
+                            "dates": _DATES_SCHEMA,
+                            "hotels": {"type": "array", "items": _HOTEL_ITEM_SCHEMA},
+                            "flights": {"type": "array", "items": _FLIGHT_ITEM_SCHEMA},
+                            "cheapest_total": {
+                                "type": "object",
+                                "properties": {
+                                    "hotel_total": {"type": "number"},
+                                    "flight_total": {"type": "number"},
+                                    "total": {"type": "number"},
+                                    "daily_budget": {"type": "number"}
+                                }
+                            }
+                        }
+                    }
+                },
+                "total_quotes": {"type": "integer"},
+                "cheapest": {"type": "object"}
+            },
+            "required": ["quotes"]
+        }
+    
+    async def execute(
+        self,
+        destinations: List[str],
+        date_pairs: List[Dict[str, str]] = None,
+        guests: int = 2,
+        rooms: int = 1,
+        flight_class: str = "economy",
+        room_type: str = STANDARD_ROOM,
+        hotels_per_quote: int = 3,
+        sort_by: str = "total_price"
+    ) -> Dict[str, Any]:
+        """Quote every destination x date pair in one vectorized pass"""
+        pairs = [
+            (pair.get("check_in"), pair.get("check_out")) for pair in date_pairs or [{}]
+        ]
+        quotes = get_catalog().quote_engine.bulk_quotes(
+            destinations,
+            pairs,
+            guests=guests,
+            rooms=rooms,
+            flight_class=flight_class,
+            room_type=room_type,
+            hotels_per_quote=hotels_per_quote,
+            sort_by=sort_by
+        )
+        
+        cheapest = min(quotes, key=lambda q: q["cheapest_total"]["total"], default=None)
+        return {
+            "quotes": quotes,
+            "total_quotes": len(quotes),
+            "cheapest": {
+                "destination": cheapest["destination"],
+                "dates": cheapest["dates"],
+                **cheapest["cheapest_total"]
+            } if cheapest else None
+        }
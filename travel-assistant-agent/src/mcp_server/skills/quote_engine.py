@@ -0,0 +1,417 @@
+"""Vectorized hotel and flight quotes
+
+``QuoteEngine`` holds the catalog's pricing inventory as NumPy arrays:
+nightly rates and ratings per hotel, rate multipliers and capacities per
+room type, base fares per route and fare multipliers per carrier. A quote
+is a broadcast over those axes (hotels x room types x stays, routes x
+carriers), so pricing thousands of options costs a few array operations
+instead of Python arithmetic per option. Flight durations and stop
+counts are derived once when the engine is built.
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Orderings accepted by hotel_options() and bulk_quotes()
+SORT_KEYS = ("total_price", "price_per_night", "rating", "value")
+
+STANDARD_ROOM = "standard"
+
+
+def money(value: float) -> Union[int, float]:
+    """A price as a JSON number: whole amounts stay integers"""
+    value = round(float(value), 2)
+    return int(value) if value.is_integer() else value
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class QuoteEngine:
+    """Array-backed pricing over the catalog's ``pricing`` section"""
+
+    def __init__(self, pricing: Mapping[str, Any]):
+        self.default_nights: int = pricing["default_nights"]
+
+        self.hotels: Tuple[Mapping[str, Any], ...] = tuple(pricing["hotels"])
+        self.hotel_rates = np.array([h["price_per_night"] for h in self.hotels], dtype=np.float64)
+        self.hotel_ratings = np.array([h["rating"] for h in self.hotels], dtype=np.float64)
+
+        room_types = pricing["room_types"]
+        self.room_types: Tuple[str, ...] = tuple(r["name"] for r in room_types)
+        self._room_index = {name: i for i, name in enumerate(self.room_types)}
+        self.room_multipliers = np.array([r["rate_multiplier"] for r in room_types], dtype=np.float64)
+        self.room_capacity = np.array([r["capacity"] for r in room_types], dtype=np.int64)
+
+        # One row per known route, plus a last row for every other destination
+        routes = pricing["routes"]
+        rows = [*routes.values(), pricing["default_route"]]
+        self._route_index = {key: i for i, key in enumerate(routes)}
+        self._default_route = len(routes)
+        self.base_fares = np.array([r["base_fare"] for r in rows], dtype=np.float64)
+
+        carriers = pricing["carriers"]
+        self.airlines: Tuple[str, ...] = tuple(c["airline"] for c in carriers)
+        self.fare_multipliers = np.array([c["fare_multiplier"] for c in carriers], dtype=np.float64)
+        hours = (
+            np.array([r["hours"] for r in rows], dtype=np.int64)[:, None, :]
+            + np.array([c["extra_hours"] for c in carriers], dtype=np.int64)[None, :, None]
+        )
+        self.durations: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(f"{low}-{high} hours" for low, high in row) for row in hours.tolist()
+        )
+        self.stops = np.maximum(
+            np.array([c["min_stops"] for c in carriers], dtype=np.int64)[None, :],
+            np.array([0 if r["direct"] else 1 for r in rows], dtype=np.int64)[:, None],
+        )
+        self.class_multipliers: Dict[str, float] = dict(pricing["class_multipliers"])
+
+        # Price calendar: a multiplier per route and month, and per weekday
+        seasons = pricing["seasons"]
+        self.season_multipliers = np.array(
+            [seasons.get(key, seasons["default"]) for key in routes] + [seasons["default"]],
+            dtype=np.float64,
+        )
+        weekdays = pricing["weekday_multipliers"]
+        self.night_weekday_multipliers = np.array(weekdays["hotel"], dtype=np.float64)
+        self.flight_weekday_multipliers = np.array(weekdays["flight"], dtype=np.float64)
+
+    # ------------------------------------------------------------------
+    # Inputs
+
+    def route(self, destination: str) -> int:
+        """Row of ``destination`` in the fare arrays"""
+        return self._route_index.get(destination.lower().strip(), self._default_route)
+
+    def room_type(self, name: str) -> int:
+        try:
+            return self._room_index[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown room type {name!r}; expected one of {', '.join(self.room_types)}"
+            ) from None
+
+    def stay_nights(self, check_in: Optional[str], check_out: Optional[str]) -> int:
+        """Nights between two ISO dates (at least 1), or the default stay"""
+        start, end = _parse_date(check_in), _parse_date(check_out)
+        if start is None or end is None:
+            return self.default_nights
+        return max(1, (end - start).days)
+
+    def stays(self, pairs: Sequence[Tuple[Optional[str], Optional[str]]]) -> np.ndarray:
+        """``stay_nights`` for many (check_in, check_out) pairs at once"""
+        try:
+            starts = np.array([p[0] for p in pairs], dtype="datetime64[D]")
+            ends = np.array([p[1] for p in pairs], dtype="datetime64[D]")
+        except (TypeError, ValueError):
+            # Some pair is missing or malformed: fall back pair by pair
+            return np.array([self.stay_nights(*p) for p in pairs], dtype=np.int64)
+        nights = (ends - starts).astype(np.int64)
+        return np.where(np.isnat(starts) | np.isnat(ends), self.default_nights, np.maximum(nights, 1))
+
+    # ------------------------------------------------------------------
+    # Price grids
+
+    def hotel_totals(self, nights: Sequence[int], rooms: Union[int, np.ndarray] = 1) -> np.ndarray:
+        """Stay totals shaped (hotels, room types, stays)"""
+        stays = np.asarray(nights, dtype=np.float64) * rooms
+        return (
+            self.hotel_rates[:, None, None]
+            * self.room_multipliers[None, :, None]
+            * stays[None, None, :]
+        )
+
+    def flight_prices(self, routes: Sequence[int], guests: int, flight_class: str) -> np.ndarray:
+        """Party fares shaped (routes, carriers), truncated to whole units"""
+        multiplier = self.class_multipliers.get(flight_class, 1.0)
+        fares = (
+            self.base_fares[np.asarray(routes, dtype=np.int64)][:, None]
+            * self.fare_multipliers[None, :]
+            * multiplier
+            * guests
+        )
+        return np.trunc(fares).astype(np.int64)
+
+    def rooms_needed(self, guests: int, rooms: int) -> np.ndarray:
+        """Rooms to book per room type so the whole party fits"""
+        return np.maximum(rooms, -(-guests // self.room_capacity))
+
+    # ------------------------------------------------------------------
+    # Ranked results
+
+    def _ranking(
+        self,
+        sort_by: str,
+        totals: np.ndarray,
+        nightly: np.ndarray,
+        ratings: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(primary, tie-break) keys, both ascending"""
+        if sort_by == "total_price":
+            return totals, -ratings
+        if sort_by == "price_per_night":
+            return nightly, -ratings
+        if sort_by == "rating":
+            return -ratings, totals
+        if sort_by == "value":
+            return -(ratings / nightly), -ratings
+        raise ValueError(f"Unknown sort key {sort_by!r}; expected one of {', '.join(SORT_KEYS)}")
+
+    def _top(self, primary: np.ndarray, secondary: np.ndarray, limit: int) -> np.ndarray:
+        """Indexes of the ``limit`` best entries, best first"""
+        limit = max(limit, 0)
+        if limit == 0:
+            return np.arange(0)
+        if limit < len(primary):
+            # Partition first so only the kept entries are fully sorted
+            keep = np.argpartition(primary, limit - 1)[:limit]
+        else:
+            keep = np.arange(len(primary))
+        return keep[np.lexsort((secondary[keep], primary[keep]))]
+
+    def _hotel_row(self, hotel: int, nightly: float, total: float, **extra: Any) -> Dict[str, Any]:
+        entry = self.hotels[hotel]
+        return {
+            "name": entry["name"],
+            "rating": entry["rating"],
+            "price_per_night": money(nightly),
+            "total_price": money(total),
+            "amenities": entry["amenities"],
+            "location": entry["location"],
+            **extra,
+        }
+
+    def rate_card(self, nights: int, rooms: int = 1) -> List[Dict[str, Any]]:
+        """Every hotel's standard room for the stay, in catalog order"""
+        room = self.room_type(STANDARD_ROOM)
+        totals = self.hotel_totals([nights], rooms)[:, room, 0]
+        nightly = self.hotel_rates * self.room_multipliers[room]
+        return [
+            self._hotel_row(hotel, nightly[hotel], totals[hotel])
+            for hotel in range(len(self.hotels))
+        ]
+
+    def flights(self, route: int, fares: np.ndarray, flight_class: str) -> List[Dict[str, Any]]:
+        """Flight rows for one route, in carrier order"""
+        return [
+            {
+                "airline": airline,
+                "price": int(fare),
+                "duration": self.durations[route][carrier],
+                "stops": int(self.stops[route, carrier]),
+                "class": flight_class,
+            }
+            for carrier, (airline, fare) in enumerate(zip(self.airlines, fares.tolist()))
+        ]
+
+    def hotel_options(
+        self,
+        nights: int,
+        guests: int = 2,
+        rooms: int = 1,
+        room_types: Optional[Sequence[str]] = None,
+        sort_by: str = "total_price",
+        max_total_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Every hotel x room type combination that fits the party, filtered
+        and ranked; returns the best ``limit`` rows and the match count.
+
+        Room types too small for ``guests`` in ``rooms`` rooms are left out.
+        """
+        totals = self.hotel_totals([nights], rooms)[:, :, 0]
+        nightly = self.hotel_rates[:, None] * self.room_multipliers[None, :]
+        ratings = np.broadcast_to(self.hotel_ratings[:, None], totals.shape)
+
+        mask = np.broadcast_to(self.room_capacity * rooms >= guests, totals.shape).copy()
+        if room_types:
+            allowed = np.zeros(len(self.room_types), dtype=bool)
+            allowed[[self.room_type(name) for name in room_types]] = True
+            mask &= allowed[None, :]
+        if max_total_price is not None:
+            mask &= totals <= max_total_price
+        if min_rating is not None:
+            mask &= ratings >= min_rating
+
+        matches = np.flatnonzero(mask)
+        primary, secondary = self._ranking(
+            sort_by, totals.ravel()[matches], nightly.ravel()[matches], ratings.ravel()[matches]
+        )
+        best = matches[self._top(primary, secondary, limit)] if limit > 0 else matches[:0]
+        hotels, types = np.unravel_index(best, totals.shape)
+        rows = [
+            self._hotel_row(
+                hotel, nightly[hotel, room], totals[hotel, room],
+                room_type=self.room_types[room], rooms=rooms,
+            )
+            for hotel, room in zip(hotels.tolist(), types.tolist())
+        ]
+        return rows, len(matches)
+
+    def bulk_quotes(
+        self,
+        destinations: Sequence[str],
+        date_pairs: Sequence[Tuple[Optional[str], Optional[str]]],
+        guests: int = 2,
+        rooms: int = 1,
+        flight_class: str = "economy",
+        room_type: str = STANDARD_ROOM,
+        hotels_per_quote: int = 3,
+        sort_by: str = "total_price",
+    ) -> List[Dict[str, Any]]:
+        """
+        Quote every destination x date pair in one pass.
+
+        Enough rooms of ``room_type`` are booked for the party. Each quote
+        lists the best ``hotels_per_quote`` hotels, every carrier, and the
+        cheapest hotel + flight total.
+        """
+        room = self.room_type(room_type)
+        booked = int(self.rooms_needed(guests, rooms)[room])
+        nights = self.stays(date_pairs)
+        routes = np.array([self.route(d) for d in destinations], dtype=np.int64)
+
+        totals = self.hotel_totals(nights, booked)[:, room, :]          # (hotels, stays)
+        nightly = self.hotel_rates * self.room_multipliers[room]
+        fares = self.flight_prices(routes, guests, flight_class)     # (routes, carriers)
+
+        # Within one room type every stay ranks hotels the same way
+        primary, secondary = self._ranking(sort_by, nightly, nightly, self.hotel_ratings)
+        order = self._top(primary, secondary, min(hotels_per_quote, len(nightly)))
+        cheapest_hotel = totals.min(axis=0)
+        cheapest_fare = fares.min(axis=1)
+
+        hotel_rows = [
+            [
+                self._hotel_row(hotel, nightly[hotel], totals[hotel, stay],
+                                room_type=room_type, rooms=booked)
+                for hotel in order.tolist()
+            ]
+            for stay in range(len(nights))
+        ]
+        flight_rows = [
+            self.flights(route, fares[i], flight_class) for i, route in enumerate(routes.tolist())
+        ]
+
+        quotes = []
+        for i, destination in enumerate(destinations):
+            for stay, (check_in, check_out) in enumerate(date_pairs):
+                hotel_total = money(cheapest_hotel[stay])
+                flight_total = int(cheapest_fare[i])
+                total = hotel_total + flight_total
+                quotes.append({
+                    "destination": destination,
+                    "dates": {
+                        "check_in": check_in or "TBD",
+                        "check_out": check_out or "TBD",
+                        "nights": int(nights[stay]),
+                    },
+                    "hotels": hotel_rows[stay],
+                    "flights": flight_rows[i],
+                    "cheapest_total": {
+                        "hotel_total": hotel_total,
+                        "flight_total": flight_total,
+                        "total": money(total),
+                        "daily_budget": money(total / nights[stay]),
+                    },
+                })
+        return quotes
+
+    def price_calendar(
+        self,
+        destination: str,
+        first_check_in: str,
+        last_check_in: str,
+        nights: int,
+        guests: int = 2,
+        rooms: int = 1,
+        flight_class: str = "economy",
+        room_type: str = STANDARD_ROOM,
+        cheapest: int = 5,
+    ) -> Dict[str, Any]:
+        """
+        Price a ``nights`` stay for every check-in date in a window.
+
+        Each night is priced by its month (``seasons``) and weekday; a fare
+        by the departure month and the mean of the departure and return
+        weekdays. Stay totals are prefix-sum differences over the nightly
+        multipliers, so the whole window is priced in one pass. Returns
+        every window in date order plus the ``cheapest`` ones.
+        """
+        start = np.datetime64(date.fromisoformat(first_check_in), "D")
+        end = np.datetime64(date.fromisoformat(last_check_in), "D")
+        if end < start:
+            raise ValueError(f"Last check-in {last_check_in} is before {first_check_in}")
+        windows = int((end - start).astype(np.int64)) + 1
+        nights = max(1, nights)
+        route = self.route(destination)
+        room = self.room_type(room_type)
+        booked = int(self.rooms_needed(guests, rooms)[room])
+
+        # Every date from the first check-in to the last check-out
+        days = start + np.arange(windows + nights)
+        months = days.astype("datetime64[M]").astype(np.int64) % 12
+        weekdays = (days.astype(np.int64) + 3) % 7          # 1970-01-01 was a Thursday
+        season = self.season_multipliers[route, months]
+
+        nightly = season[:-1] * self.night_weekday_multipliers[weekdays[:-1]]
+        running = np.concatenate(([0.0], np.cumsum(nightly)))
+        stay = running[nights:nights + windows] - running[:windows]            # (windows,)
+        hotel_totals = (
+            (self.hotel_rates * self.room_multipliers[room] * booked)[:, None] * stay[None, :]
+        )                                                                        # (hotels, windows)
+
+        departure = self.flight_weekday_multipliers[weekdays[:windows]]
+        arrival = self.flight_weekday_multipliers[weekdays[nights:nights + windows]]
+        fare_factor = season[:windows] * (departure + arrival) / 2
+        fares = np.trunc(
+            self.flight_prices([route], guests, flight_class)[0][:, None] * fare_factor[None, :]
+        )                                                                        # (carriers, windows)
+
+        best_hotel = hotel_totals.argmin(axis=0)
+        best_carrier = fares.argmin(axis=0)
+        hotel_total = hotel_totals[best_hotel, np.arange(windows)]
+        flight_total = fares[best_carrier, np.arange(windows)]
+        totals = np.round(hotel_total, 2) + flight_total
+
+        check_ins = np.datetime_as_string(days[:windows]).tolist()
+        check_outs = np.datetime_as_string(days[nights:nights + windows]).tolist()
+        rows = [
+            {
+                "check_in": check_in,
+                "check_out": check_out,
+                "hotel": self.hotels[hotel]["name"],
+                "hotel_total": money(hotel_price),
+                "airline": self.airlines[carrier],
+                "flight_total": int(fare),
+                "total": money(total),
+            }
+            for check_in, check_out, hotel, hotel_price, carrier, fare, total in zip(
+                check_ins, check_outs, best_hotel.tolist(), hotel_total.tolist(),
+                best_carrier.tolist(), flight_total.tolist(), totals.tolist(),
+            )
+        ]
+        # Ties go to the earlier check-in
+        order = self._top(totals, np.arange(windows), min(max(cheapest, 0), windows))
+        return {
+            "nights": nights,
+            "room_type": room_type,
+            "rooms": booked,
+            "windows": rows,
+            "cheapest": [rows[i] for i in order.tolist()],
+        }
+
+
+__all__ = [
+    "QuoteEngine",
+    "SORT_KEYS",
+    "money",
+]
@@ -0,0 +1,212 @@
+"""
+Lazy skill registry
+
+Skill metadata (MCP definitions and the ``module:Class`` that implements
+each skill) is read from ``manifest.json``, so listing skills, looking up
+categories and compiling input validators never imports skill code. A
+skill module is imported and its class instantiated only when the skill
+is first requested.
+
+Third-party packages can contribute skills through the
+``travel_assistant.skills`` entry point group; the entry point name is the
+skill name and its value the skill class::
+
+    [project.entry-points."travel_assistant.skills"]
+    visa_requirements = "my_package.skills:VisaRequirementsSkill"
+
+Regenerate the built-in manifest after changing a skill's metadata::
+
+    python -m mcp_server.skills
+"""
+
+import importlib
+import json
+import logging
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..validation import SkillInputValidator, compile_validator
+from .base_skill import BaseSkill, ExecutionMode
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+ENTRY_POINT_GROUP = "travel_assistant.skills"
+
+
+@dataclass
+class SkillSpec:
+    """Registry entry: where a skill lives and, if known, its definition"""
+    name: str
+    entry_point: str
+    definition: Optional[Dict[str, Any]] = None
+    execution_mode: Optional[ExecutionMode] = None
+
+
+def _load_class(entry_point: str):
+    """Import ``module:Class``; relative modules resolve inside this package"""
+    module_name, _, class_name = entry_point.partition(":")
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, class_name)
+
+
+class SkillRegistry(Mapping):
+    """
+    Read-only mapping of skill name to skill instance, loaded on demand.
+
+    Iteration, ``len`` and ``in`` only consult the specs; indexing (and
+    ``get``/``values``) imports and instantiates the skill on first use.
+    """
+
+    def __init__(self, specs: Optional[List[SkillSpec]] = None):
+        self._specs: Dict[str, SkillSpec] = {}
+        self._skills: Dict[str, BaseSkill] = {}
+        self._validators: Dict[str, SkillInputValidator] = {}
+        self._lock = threading.Lock()
+        for spec in specs or []:
+            self.add_spec(spec)
+
+    @classmethod
+    def from_manifest(
+        cls,
+        path: Path = MANIFEST_PATH,
+        include_entry_points: bool = True
+    ) -> "SkillRegistry":
+        """Build a registry from a manifest file plus installed entry points"""
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        registry = cls([
+            SkillSpec(
+                name=entry["definition"]["name"],
+                entry_point=entry["entry_point"],
+                definition=entry["definition"],
+                execution_mode=ExecutionMode(entry.get("execution_mode", "inline"))
+            )
+            for entry in manifest["skills"]
+        ])
+
+        if include_entry_points:
+            for ep in entry_points(group=ENTRY_POINT_GROUP):
+                if ep.name in registry._specs:
+                    logger.warning(
+                        f"Ignoring entry point skill '{ep.name}': name already registered"
+                    )
+                    continue
+                registry.add_spec(SkillSpec(name=ep.name, entry_point=ep.value))
+
+        return registry
+
+    def add_spec(self, spec: SkillSpec) -> None:
+        """Register a skill without importing it"""
+        self._specs[spec.name] = spec
+
+    def register(self, skill: BaseSkill) -> None:
+        """Register an already-instantiated skill"""
+        cls = type(skill)
+        self._specs[skill.name] = SkillSpec(
+            name=skill.name,
+            entry_point=f"{cls.__module__}:{cls.__qualname__}",
+            definition=skill.to_definition(),
+            execution_mode=ExecutionMode(skill.execution_mode)
+        )
+        self._skills[skill.name] = skill
+        self._validators.pop(skill.name, None)
+
+    # Mapping interface
+
+    def __getitem__(self, name: str) -> BaseSkill:
+        skill = self._skills.get(name)
+        if skill is not None:
+            return skill
+        spec = self._specs[name]
+        with self._lock:
+            skill = self._skills.get(name)
+            if skill is None:
+                skill = self._load(spec)
+                self._skills[name] = skill
+        return skill
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    # Metadata access (no imports for manifest skills)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._skills
+
+    def definition(self, name: str) -> Optional[Dict[str, Any]]:
+        spec = self._specs.get(name)
+        if spec is None:
+            return None
+        if spec.definition is None:
+            spec.definition = self[name].to_definition()
+        return spec.definition
+
+    def definitions(self) -> List[Dict[str, Any]]:
+        return [self.definition(name) for name in self._specs]
+
+    def names_in_category(self, category: str) -> List[str]:
+        return [
+            name for name in self._specs
+            if self.definition(name).get("category") == category
+        ]
+
+    def execution_mode(self, name: str) -> ExecutionMode:
+        spec = self._specs[name]
+        if spec.execution_mode is None:
+            spec.execution_mode = ExecutionMode(self[name].execution_mode)
+        return spec.execution_mode
+
+    def validator(self, name: str) -> Optional[SkillInputValidator]:
+        """Input validator compiled once per skill from its definition"""
+        validator = self._validators.get(name)
+        if validator is None and name in self._specs:
+            validator = compile_validator(self.definition(name).get("inputSchema"))
+            self._validators[name] = validator
+        return validator
+
+    def _load(self, spec: SkillSpec) -> BaseSkill:
+        skill_class = _load_class(spec.entry_point)
+        skill = skill_class()
+        if not isinstance(skill, BaseSkill):
+            raise TypeError(f"{spec.entry_point} is not a BaseSkill subclass")
+        if skill.name != spec.name:
+            raise ValueError(
+                f"{spec.entry_point} registered as '{spec.name}' but is named '{skill.name}'"
+            )
+        logger.info(f"Loaded skill '{spec.name}' from {spec.entry_point}")
+        return skill
+
+
+def build_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """Re-derive every manifest definition from the skill classes"""
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    skills = []
+    for entry in manifest["skills"]:
+        skill = _load_class(entry["entry_point"])()
+        skills.append({
+            "entry_point": entry["entry_point"],
+            "execution_mode": ExecutionMode(skill.execution_mode).value,
+            "definition": skill.to_definition()
+        })
+    return {"skills": skills}
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> None:
+    manifest = build_manifest(path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
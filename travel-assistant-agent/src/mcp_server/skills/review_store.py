@@ -0,0 +1,270 @@
+"""Paginated, pre-aggregated destination reviews
+
+``ReviewStore`` keeps each destination's reviews in a ``DestinationReviews``
+partition. A partition maintains, as reviews are ingested, the histograms
+its summary is read from: counts per star rating and per sentiment. So
+``overall_rating``, ``total_reviews`` and the breakdowns cost a few
+arithmetic operations on six-element arrays, however many reviews there
+are. The catalog's ``archived`` counts seed those histograms for reviews
+whose text is not kept.
+
+Pages are served from one sorted NumPy key array per ordering. Each key
+packs the sort fields and the review's id into one int64, so a page is a
+slice and a cursor is just the key of the last review returned: the next
+page starts at that key's ``searchsorted`` position. Reviews ingested
+between two requests therefore do not shift later pages or make them
+repeat reviews. New reviews are buffered and merged into the key arrays on the next
+read (sort the batch, then one ``np.insert``), so ingesting reviews one at
+a time does not re-sort millions.
+"""
+
+import base64
+import binascii
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .catalog import FrozenDict, get_catalog
+
+# Orderings a page can be requested in; both put the newest review first among equals
+SORT_ORDERS = ("recency", "rating")
+
+SENTIMENTS = ("positive", "neutral", "negative")
+_SENTIMENT_CODES = {sentiment: i for i, sentiment in enumerate(SENTIMENTS)}
+STARS = (5, 4, 3, 2, 1)
+
+# Key layout, high to low bits: rating (3) | day since 1900 (17) | review id (32)
+_DAY_ZERO = np.datetime64("1900-01-01", "D")
+_DAY_LIMIT = (1 << 17) - 1
+_ID_BITS = 32
+_ID_MASK = (1 << _ID_BITS) - 1
+_RATING_SHIFT = _ID_BITS + 17
+
+
+def _sentiment_of(rating: int) -> str:
+    """Sentiment assumed for a review ingested without one"""
+    return "positive" if rating >= 4 else "neutral" if rating == 3 else "negative"
+
+
+def encode_cursor(sort_by: str, key: int) -> str:
+    return base64.urlsafe_b64encode(f"{sort_by}:{key}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_by, key = raw.split(":")
+        return sort_by, int(key)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid review cursor {cursor!r}") from None
+
+
+@dataclass(frozen=True)
+class ReviewPage:
+    """One page of reviews; ``offset`` is the first review's position in the ordering"""
+
+    reviews: List[Mapping[str, Any]]
+    offset: int
+    next_cursor: Optional[str]
+
+
+class DestinationReviews:
+    """The reviews of one destination, with incrementally maintained histograms"""
+
+    def __init__(self, archived: Optional[Mapping[str, Mapping[str, int]]] = None):
+        self._lock = threading.Lock()
+        self._reviews: List[Mapping[str, Any]] = []
+        # Index = star rating (0 unused) / position in SENTIMENTS
+        self.rating_counts = np.zeros(6, dtype=np.int64)
+        self.sentiment_counts = np.zeros(len(SENTIMENTS), dtype=np.int64)
+        if archived:
+            for stars in STARS:
+                self.rating_counts[stars] = archived["ratings"].get(f"{stars}_star", 0)
+            for i, sentiment in enumerate(SENTIMENTS):
+                self.sentiment_counts[i] = archived["sentiments"].get(sentiment, 0)
+
+        # Negated keys, ascending: the first entry is the best review in each ordering
+        self._keys: Dict[str, np.ndarray] = {
+            sort_by: np.empty(0, dtype=np.int64) for sort_by in SORT_ORDERS
+        }
+        self._pending: List[Dict[str, np.ndarray]] = []
+
+    def __len__(self) -> int:
+        return len(self._reviews)
+
+    def ingest(self, reviews: Sequence[Mapping[str, Any]]) -> int:
+        """
+        Add flat review records (``rating`` 1-5 and ``date`` YYYY-MM-DD
+        required); returns how many were added.
+
+        Histograms are updated immediately; the sort keys are merged on
+        the next ``page``.
+        """
+        if not reviews:
+            return 0
+        ratings = np.array([review["rating"] for review in reviews], dtype=np.int64)
+        if ((ratings < 1) | (ratings > 5)).any():
+            raise ValueError("Review ratings must be between 1 and 5")
+        days = np.array([review["date"] for review in reviews], dtype="datetime64[D]")
+        day_index = np.clip((days - _DAY_ZERO).astype(np.int64), 0, _DAY_LIMIT)
+
+        batch: List[FrozenDict] = []
+        for review, rating in zip(reviews, ratings.tolist()):
+            if review.get("sentiment") not in _SENTIMENT_CODES:
+                review = FrozenDict(review, sentiment=_sentiment_of(rating))
+            elif not isinstance(review, FrozenDict):
+                review = FrozenDict(review)
+            batch.append(review)
+        sentiments = np.array([_SENTIMENT_CODES[review["sentiment"]] for review in batch])
+
+        with self._lock:
+            first = len(self._reviews)
+            if first + len(batch) > _ID_MASK:
+                raise ValueError("Too many reviews for one destination")
+            self._reviews.extend(batch)
+            self.rating_counts += np.bincount(ratings, minlength=6)
+            self.sentiment_counts += np.bincount(sentiments, minlength=len(SENTIMENTS))
+
+            recency = (day_index << _ID_BITS) | np.arange(first, first + len(batch))
+            self._pending.append({
+                "recency": -recency,
+                "rating": -((ratings << _RATING_SHIFT) | recency),
+            })
+        return len(batch)
+
+    def summary(self) -> Dict[str, Any]:
+        """``overall_rating``, ``total_reviews`` and percentage breakdowns"""
+        with self._lock:
+            ratings = self.rating_counts.copy()
+            sentiments = self.sentiment_counts.copy()
+        total = int(ratings.sum())
+        scale = 100 / total if total else 0
+        return {
+            "overall_rating": round(float(ratings @ np.arange(6)) / total, 1) if total else 0,
+            "total_reviews": total,
+            "sentiment_breakdown": {
+                sentiment: round(int(count) * scale)
+                for sentiment, count in zip(SENTIMENTS, sentiments.tolist())
+            },
+            "rating_breakdown": {
+                f"{stars}_star": round(int(ratings[stars]) * scale) for stars in STARS
+            },
+        }
+
+    def _settle(self) -> None:
+        """Merge buffered keys into the sorted arrays (caller holds the lock)"""
+        if not self._pending:
+            return
+        for sort_by in SORT_ORDERS:
+            new = np.sort(np.concatenate([batch[sort_by] for batch in self._pending]))
+            keys = self._keys[sort_by]
+            self._keys[sort_by] = np.insert(keys, np.searchsorted(keys, new), new)
+        self._pending.clear()
+
+    def page(
+        self,
+        sort_by: str = "recency",
+        offset: int = 0,
+        limit: int = 5,
+        cursor: Optional[str] = None,
+    ) -> ReviewPage:
+        """
+        Up to ``limit`` reviews in ``sort_by`` order.
+
+        Without a cursor the page starts ``offset`` reviews from the top;
+        with one, ``offset`` reviews after the last review of the page
+        that returned it.
+        """
+        if sort_by not in SORT_ORDERS:
+            raise ValueError(
+                f"Unknown review ordering {sort_by!r}; expected one of {', '.join(SORT_ORDERS)}"
+            )
+        with self._lock:
+            self._settle()
+            # Merges replace the arrays, so this snapshot stays consistent
+            keys = self._keys[sort_by]
+
+        start = 0
+        if cursor:
+            cursor_sort, after = decode_cursor(cursor)
+            if cursor_sort != sort_by:
+                raise ValueError(f"Cursor was issued for sort_by={cursor_sort!r}")
+            start = int(np.searchsorted(keys, after, side="right"))
+        start += max(offset, 0)
+        window = keys[start:start + max(limit, 0)]
+
+        ids = (-window) & _ID_MASK
+        next_cursor = None
+        if len(window) and start + len(window) < len(keys):
+            next_cursor = encode_cursor(sort_by, int(window[-1]))
+        return ReviewPage(
+            reviews=[self._reviews[i] for i in ids.tolist()],
+            offset=start,
+            next_cursor=next_cursor,
+        )
+
+
+class ReviewStore:
+    """Review partitions per destination, plus one for unknown destinations"""
+
+    def __init__(self, default: DestinationReviews):
+        self._lock = threading.Lock()
+        self._destinations: Dict[str, DestinationReviews] = {}
+        self.default = default
+
+    @classmethod
+    def from_catalog(
+        cls, reviews: Mapping[str, Mapping[str, Any]], default: Mapping[str, Any]
+    ) -> "ReviewStore":
+        """A store holding the catalog's ``reviews`` section"""
+
+        def partition(entry: Mapping[str, Any]) -> DestinationReviews:
+            destination = DestinationReviews(entry.get("archived"))
+            destination.ingest(entry["reviews"])
+            return destination
+
+        store = cls(partition(default))
+        for key, entry in reviews.items():
+            store._destinations[key] = partition(entry)
+        return store
+
+    def get(self, destination: str) -> Optional[DestinationReviews]:
+        """The partition for ``destination`` (case- and whitespace-insensitive)"""
+        return self._destinations.get(destination.lower().strip())
+
+    def ingest(self, destination: str, reviews: Sequence[Mapping[str, Any]]) -> int:
+        """Add reviews for ``destination``, creating its partition if needed"""
+        key = destination.lower().strip()
+        with self._lock:
+            partition = self._destinations.get(key)
+            if partition is None:
+                partition = self._destinations[key] = DestinationReviews()
+        return partition.ingest(reviews)
+
+
+_store: Optional[ReviewStore] = None
+_store_lock = threading.Lock()
+
+
+def get_review_store() -> ReviewStore:
+    """The process-wide review store, seeded from the catalog on first use"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                catalog = get_catalog()
+                _store = ReviewStore.from_catalog(
+                    catalog.section("reviews"), catalog.section("defaults")["reviews"]
+                )
+    return _store
+
+
+__all__ = [
+    "DestinationReviews",
+    "ReviewPage",
+    "ReviewStore",
+    "SORT_ORDERS",
+    "get_review_store",
+]
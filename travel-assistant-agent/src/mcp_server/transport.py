@@ -0,0 +1,218 @@
+"""
+MCP Server transports
+
+Serves an ``MCPServer`` out of process over JSON-RPC:
+
+- **stdio**: newline-delimited JSON-RPC on stdin/stdout; the client owns
+  the server process (see ``agents.mcp_transport.StdioTransport``).
+- **SSE**: ``GET /sse`` opens an event stream whose first ``endpoint``
+  event names the URL to ``POST`` JSON-RPC messages to; responses arrive
+  on the stream as ``message`` events.
+
+Both transports run every incoming request (or batch frame) as its own
+task, so one connection carries any number of concurrent requests and
+responses are written back as soon as each completes, correlated by id.
+
+Start a standalone server with ``python -m mcp_server --transport sse``.
+"""
+
+import asyncio
+import logging
+import sys
+import uuid
+from typing import Any, Dict, Optional, Set
+
+from .config import MCPServerConfig
+from .protocol import (
+    INVALID_REQUEST,
+    JSONRPCError,
+    MCPDispatcher,
+    decode_message,
+    encode_message,
+    make_error
+)
+from .server import MCPServer, init_mcp_server
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on one framed message (a line on stdio)
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+# Idle SSE streams send a comment this often so dead clients are noticed
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+async def serve_connection(
+    dispatcher: MCPDispatcher,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter
+) -> None:
+    """
+    Serve newline-delimited JSON-RPC on a stream pair until EOF.
+
+    Requests are dispatched concurrently; in-flight requests are allowed
+    to finish after EOF before returning.
+    """
+    tasks: Set[asyncio.Task] = set()
+
+    async def send(response: Dict[str, Any]) -> None:
+        writer.write(encode_message(response))
+        await writer.drain()
+
+    async def respond(message: Any) -> None:
+        if isinstance(message, list):
+            await dispatcher.handle_batch(message, send)
+            return
+        response = await dispatcher.handle(message)
+        if response is not None:
+            await send(response)
+
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            # Oversized frame: the reader has discarded it
+            writer.write(encode_message(make_error(
+                None, JSONRPCError(INVALID_REQUEST, "Message too large")
+            )))
+            continue
+        if not line:
+            break
+        if not line.strip():
+            continue
+        try:
+            message = decode_message(line)
+        except JSONRPCError as e:
+            writer.write(encode_message(make_error(None, e)))
+            continue
+        task = asyncio.create_task(respond(message))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def serve_stdio(server: MCPServer, stdin=None, stdout=None) -> None:
+    """Serve JSON-RPC on stdin/stdout (or the given binary pipes) until stdin closes"""
+    loop = asyncio.get_running_loop()
+
+    reader = asyncio.StreamReader(limit=MAX_MESSAGE_BYTES)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), stdin or sys.stdin
+    )
+    write_transport, write_protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, stdout or sys.stdout
+    )
+    writer = asyncio.StreamWriter(write_transport, write_protocol, reader, loop)
+
+    logger.info("MCP Server serving JSON-RPC on stdio")
+    try:
+        await serve_connection(MCPDispatcher(server), reader, writer)
+    finally:
+        writer.close()
+
+
+def create_sse_app(server: MCPServer):
+    """Build the ASGI app serving ``server`` over SSE"""
+    from fastapi import FastAPI, HTTPException, Request, Response
+    from fastapi.responses import StreamingResponse
+
+    dispatcher = MCPDispatcher(server)
+    sessions: Dict[str, "asyncio.Queue[Dict[str, Any]]"] = {}
+    tasks: Set[asyncio.Task] = set()
+
+    app = FastAPI(title="Travel Assistant MCP Server")
+
+    @app.get("/sse")
+    async def open_stream(request: Request):
+        session_id = uuid.uuid4().hex
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        sessions[session_id] = queue
+
+        async def events():
+            try:
+                yield f"event: endpoint\ndata: /messages?session_id={session_id}\n\n"
+                while True:
+                    try:
+                        message = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": keepalive\n\n"
+                        continue
+                    data = encode_message(message).decode("utf-8").rstrip("\n")
+                    yield f"event: message\ndata: {data}\n\n"
+            finally:
+                sessions.pop(session_id, None)
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    @app.post("/messages", status_code=202)
+    async def post_message(session_id: str, request: Request):
+        queue = sessions.get(session_id)
+        if queue is None:
+            raise HTTPException(status_code=404, detail="Unknown session")
+        try:
+            message = decode_message(await request.body())
+        except JSONRPCError as e:
+            queue.put_nowait(make_error(None, e))
+            return Response(status_code=202)
+
+        async def send(response: Dict[str, Any]) -> None:
+            queue.put_nowait(response)
+
+        async def respond():
+            if isinstance(message, list):
+                await dispatcher.handle_batch(message, send)
+                return
+            response = await dispatcher.handle(message)
+            if response is not None:
+                await send(response)
+
+        task = asyncio.create_task(respond())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return Response(status_code=202)
+
+    return app
+
+
+async def serve_sse(server: MCPServer, host: Optional[str] = None, port: Optional[int] = None) -> None:
+    """Serve ``server`` over SSE with uvicorn until interrupted"""
+    import uvicorn
+
+    config = uvicorn.Config(
+        create_sse_app(server),
+        host=host or server.config.host,
+        port=port or server.config.port,
+        log_level="warning"
+    )
+    logger.info(f"MCP Server serving JSON-RPC over SSE on {config.host}:{config.port}")
+    await uvicorn.Server(config).serve()
+
+
+async def run_server(config: MCPServerConfig = None, stdin=None, stdout=None) -> None:
+    """Start the global MCP server and serve it over ``config.transport``"""
+    config = config or MCPServerConfig()
+    server = init_mcp_server(config)
+    await server.start()
+    try:
+        if config.transport == "stdio":
+            await serve_stdio(server, stdin, stdout)
+        elif config.transport == "sse":
+            await serve_sse(server)
+        else:
+            raise ValueError(f"Unsupported MCP transport: {config.transport!r}")
+    finally:
+        await server.stop()
+
+
+__all__ = [
+    "serve_connection",
+    "serve_stdio",
+    "serve_sse",
+    "create_sse_app",
+    "run_server",
+]
@@ -0,0 +1,252 @@
+"""
+Skill input validation
+
+Compiles a skill's JSON Schema ``input_schema`` once into a validator that
+checks types, coerces loosely-typed values (``"5"`` -> ``5``,
+``"true"`` -> ``True``) and fills in defaults. The schema is walked only at
+compile time; each call runs a flat list of precomputed coercion closures.
+
+Supported keywords: ``type`` (string, integer, number, boolean, array,
+object), ``properties``, ``required``, ``items``, ``enum``, ``minimum``,
+``maximum`` and ``default``.
+"""
+
+import copy
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Coercer = Callable[[Any, str], Any]
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
+
+class SkillValidationError(ValueError):
+    """Raised when skill parameters do not match the skill's input schema"""
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__("; ".join(errors))
+
+
+class _Invalid(Exception):
+    """Internal: a single value failed coercion"""
+
+
+def _fail(path: str, expected: str, value: Any):
+    raise _Invalid(f"{path}: expected {expected}, got {type(value).__name__}")
+
+
+def _coerce_string(value: Any, path: str) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    _fail(path, "string", value)
+
+
+def _coerce_integer(value: Any, path: str) -> int:
+    if isinstance(value, bool):
+        _fail(path, "integer", value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    _fail(path, "integer", value)
+
+
+def _coerce_number(value: Any, path: str) -> float:
+    if isinstance(value, bool):
+        _fail(path, "number", value)
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    _fail(path, "number", value)
+
+
+def _coerce_boolean(value: Any, path: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    _fail(path, "boolean", value)
+
+
+def _passthrough(value: Any, path: str) -> Any:
+    return value
+
+
+_SCALAR_COERCERS: Dict[str, Coercer] = {
+    "string": _coerce_string,
+    "integer": _coerce_integer,
+    "number": _coerce_number,
+    "boolean": _coerce_boolean,
+}
+
+
+def _compile_array(schema: Dict[str, Any]) -> Coercer:
+    item_coercer = _compile(schema["items"]) if "items" in schema else None
+
+    def coerce_array(value: Any, path: str) -> list:
+        if not isinstance(value, (list, tuple)):
+            _fail(path, "array", value)
+        if item_coercer is None:
+            return list(value)
+        return [item_coercer(item, f"{path}[{i}]") for i, item in enumerate(value)]
+
+    return coerce_array
+
+
+def _compile_object(schema: Dict[str, Any]) -> Coercer:
+    if not schema.get("properties"):
+        def coerce_mapping(value: Any, path: str) -> dict:
+            if not isinstance(value, dict):
+                _fail(path, "object", value)
+            return value
+        return coerce_mapping
+
+    nested = _ObjectValidator(schema, strict=False)
+
+    def coerce_object(value: Any, path: str) -> dict:
+        if not isinstance(value, dict):
+            _fail(path, "object", value)
+        return nested.coerce(value, prefix=f"{path}.")
+
+    return coerce_object
+
+
+def _compile(schema: Dict[str, Any]) -> Coercer:
+    schema_type = schema.get("type")
+    if schema_type == "array":
+        coercer = _compile_array(schema)
+    elif schema_type == "object":
+        coercer = _compile_object(schema)
+    else:
+        coercer = _SCALAR_COERCERS.get(schema_type, _passthrough)
+
+    if "enum" in schema:
+        allowed = tuple(schema["enum"])
+        base = coercer
+
+        def coerce_enum(value: Any, path: str) -> Any:
+            value = base(value, path)
+            if value not in allowed:
+                raise _Invalid(f"{path}: must be one of {list(allowed)}")
+            return value
+
+        coercer = coerce_enum
+
+    if "minimum" in schema or "maximum" in schema:
+        low, high = schema.get("minimum"), schema.get("maximum")
+        unbounded = coercer
+
+        def coerce_range(value: Any, path: str) -> Any:
+            value = unbounded(value, path)
+            if low is not None and value < low:
+                raise _Invalid(f"{path}: must be at least {low}")
+            if high is not None and value > high:
+                raise _Invalid(f"{path}: must be at most {high}")
+            return value
+
+        coercer = coerce_range
+    return coercer
+
+
+class _ObjectValidator:
+    """Precompiled validator for an object schema's properties"""
+
+    def __init__(self, schema: Dict[str, Any], strict: bool):
+        required = set(schema.get("required", []))
+        # (name, coercer, has_default, default, copy_default, required)
+        self.fields: Tuple[Tuple[str, Coercer, bool, Any, bool, bool], ...] = tuple(
+            (
+                name,
+                _compile(prop),
+                "default" in prop,
+                prop.get("default"),
+                isinstance(prop.get("default"), (dict, list)),
+                name in required,
+            )
+            for name, prop in (schema.get("properties") or {}).items()
+        )
+        self.names = frozenset(name for name, *_ in self.fields)
+        self.strict = strict
+
+    def coerce(self, value: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        errors: List[str] = []
+        result: Dict[str, Any] = {} if self.strict else dict(value)
+
+        for name, coercer, has_default, default, copy_default, is_required in self.fields:
+            raw = value.get(name)
+            if raw is None:
+                if is_required:
+                    errors.append(f"{prefix}{name}: required")
+                elif has_default:
+                    result[name] = copy.deepcopy(default) if copy_default else default
+                elif name in value:
+                    result[name] = None
+                continue
+            try:
+                result[name] = coercer(raw, prefix + name)
+            except _Invalid as e:
+                errors.append(str(e))
+
+        # Top-level parameters become keyword arguments of execute(), so
+        # unknown names are rejected rather than failing inside the skill
+        if self.strict and not value.keys() <= self.names:
+            errors.append(f"unknown parameters: {sorted(value.keys() - self.names)}")
+
+        if errors:
+            if prefix:
+                raise _Invalid("; ".join(errors))
+            raise SkillValidationError(errors)
+        return result
+
+
+class SkillInputValidator:
+    """
+    Compiled validator for a skill's input parameters.
+
+    Calling it returns a new, coerced parameter dict with defaults applied,
+    or raises ``SkillValidationError`` listing every problem found.
+    """
+
+    def __init__(self, schema: Optional[Dict[str, Any]]):
+        schema = schema or {}
+        self._validator = _ObjectValidator(schema, strict=True)
+        self.required = [name for name, *rest in self._validator.fields if rest[-1]]
+
+    def __call__(self, parameters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if parameters is None:
+            parameters = {}
+        elif not isinstance(parameters, dict):
+            raise SkillValidationError(
+                [f"parameters: expected object, got {type(parameters).__name__}"]
+            )
+        return self._validator.coerce(parameters)
+
+
+def compile_validator(schema: Optional[Dict[str, Any]]) -> SkillInputValidator:
+    """Compile a JSON Schema ``input_schema`` into a SkillInputValidator"""
+    return SkillInputValidator(schema)
+
+
+__all__ = [
+    "SkillValidationError",
+    "SkillInputValidator",
+    "compile_validator",
+]
@@ -2,8 +2,9 @@
 Claude API 连接管理
 使用 LangChain Anthropic 集成
 """
-from typing import Optional
+from typing import Any, Optional
 from config import settings
+from utils.deadline import check, run_within_deadline
 from utils.logger import app_logger
 
 
@@ -39,6 +40,17 @@ class ClaudeClient:
     def is_ready(self) -> bool:
         return self.llm is not None
 
+    async def ainvoke(self, prompt: Any, stage: str = "LLM call") -> Any:
+        """
+        Invoke the model within the request's deadline.
+
+        Raises ``DeadlineExceeded`` straight away when less than
+        ``claude_min_budget`` seconds remain, and cancels the call once
+        the budget runs out, so callers can fall back instead of waiting.
+        """
+        check(stage, settings.claude_min_budget)
+        return await run_within_deadline(self.llm.ainvoke(prompt), stage)
+
     async def test_connection(self) -> bool:
         if not self.llm:
             return False
@@ -0,0 +1,118 @@
+"""
+请求级截止时间
+在 contextvar 中保存当前请求的截止时间，沿调用链（工作流、Agent、LLM、技能调用）传播，
+各阶段据此检查剩余预算，预算不足时立即跳过或降级
+"""
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Absolute deadline on the time.monotonic() clock; None means unbounded
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """The request's time budget ran out (or is too small) for a stage"""
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        super().__init__(f"Deadline exceeded before {stage} could finish")
+
+
+def get_deadline() -> Optional[float]:
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current request's budget, or None if unbounded"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired(tolerance: float = 0.0) -> bool:
+    """Whether the budget is spent (``tolerance`` absorbs timer granularity)"""
+    budget = remaining()
+    return budget is not None and budget <= tolerance
+
+
+def has_budget(seconds: float) -> bool:
+    """Whether at least ``seconds`` remain (always true without a deadline)"""
+    budget = remaining()
+    return budget is None or budget >= seconds
+
+
+def bound_timeout(timeout: float) -> float:
+    """``timeout`` shortened to the remaining budget (never negative)"""
+    budget = remaining()
+    if budget is None:
+        return timeout
+    return max(0.0, min(timeout, budget))
+
+
+def check(stage: str, min_seconds: float = 0.0) -> None:
+    """Raise ``DeadlineExceeded`` unless more than ``min_seconds`` remain"""
+    budget = remaining()
+    if budget is not None and budget <= min_seconds:
+        raise DeadlineExceeded(stage)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Run the block with a budget of ``seconds``.
+
+    Nested scopes can only tighten the deadline, never extend it;
+    ``None`` keeps the enclosing deadline.
+    """
+    current = _deadline.get()
+    deadline = current
+    if seconds is not None:
+        candidate = time.monotonic() + seconds
+        deadline = candidate if current is None else min(current, candidate)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def fresh_deadline_scope(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Run the block with a budget of ``seconds`` from now, replacing the
+    enclosing deadline instead of tightening it (``None``: unbounded).
+
+    For work that is meant to outlive the request's budget, such as the
+    body of a streaming response.
+    """
+    deadline = None if seconds is None else time.monotonic() + seconds
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+async def run_within_deadline(awaitable: Awaitable[T], stage: str) -> T:
+    """Await ``awaitable``, cancelling it with ``DeadlineExceeded`` once the budget is spent"""
+    budget = remaining()
+    if budget is None:
+        return await awaitable
+    if budget <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded(stage)
+    try:
+        return await asyncio.wait_for(awaitable, budget)
+    except asyncio.TimeoutError as e:
+        # A timeout of the stage's own, with budget to spare, is not ours
+        if isinstance(e, DeadlineExceeded) or not expired(tolerance=0.01):
+            raise
+        raise DeadlineExceeded(stage) from None
+
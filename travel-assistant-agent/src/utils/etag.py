@@ -0,0 +1,35 @@
+"""
+ETag 工具
+为预先序列化的 JSON 响应生成 ETag，并处理 If-None-Match 条件请求
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the response body"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header (weak comparison, as RFC 9110 requires)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def etag_json_response(
+    body: bytes,
+    etag: str,
+    if_none_match: Optional[str] = None
+) -> Response:
+    """JSON response for a cached body, or 304 when the client copy is current"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,57 @@
+"""
+流式响应工具
+将异步事件流编码为 NDJSON 或 SSE，用于逐条推送结果的接口
+"""
+import json
+from typing import Any, AsyncIterator, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+
+from utils.deadline import fresh_deadline_scope
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# (event name, JSON-serializable payload)
+StreamEvent = Tuple[str, Any]
+
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def ndjson_line(payload: Any) -> str:
+    """One NDJSON record"""
+    return _dumps(payload) + "\n"
+
+
+def sse_event(event: str, payload: Any, event_id: Optional[str] = None) -> str:
+    """One SSE event; the payload is a single-line JSON document"""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {_dumps(payload)}\n\n"
+
+
+def event_stream_response(
+    events: AsyncIterator[StreamEvent],
+    fmt: str,
+    budget: Optional[float] = None
+) -> StreamingResponse:
+    """
+    Stream ``(event, payload)`` pairs as NDJSON (``fmt="ndjson"``, the
+    event name is dropped) or SSE (``fmt="sse"``).
+
+    Each record is flushed as soon as it is produced; proxy buffering is
+    disabled so intermediaries do not hold records back. The events are
+    produced under their own deadline of ``budget`` seconds from the
+    start of the stream (``None``: unbounded), not the request's.
+    """
+    async def encode() -> AsyncIterator[str]:
+        with fresh_deadline_scope(budget):
+            async for event, payload in events:
+                yield sse_event(event, payload) if fmt == "sse" else ndjson_line(payload)
+
+    return StreamingResponse(
+        encode(),
+        media_type=SSE_MEDIA_TYPE if fmt == "sse" else NDJSON_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -16,6 +16,7 @@ from agents import (
     RecommendationAgent,
     BookingAgent
 )
+from utils.deadline import run_within_deadline
 from utils.logger import app_logger
 
 
@@ -27,6 +28,8 @@ class TravelPlanningState(TypedDict, total=False):
     booking_status: Dict[str, Any]
     final_plan: Dict[str, Any]
     error: str
+    # 因请求截止时间已过而跳过的 Agent
+    skipped_stages: list[str]
 
 
 class PlanningWorkflow:
@@ -63,5 +66,8 @@ class PlanningWorkflow:
             "collected_info": metadata or {}
         }
 
-        result = await self.graph.ainvoke(initial_state)
+        # 各 Agent 会在预算耗尽时自行跳过或降级；这里兜底取消仍在运行的阶段
+        result = await run_within_deadline(
+            self.graph.ainvoke(initial_state), "planning workflow"
+        )
         return result
@@ -0,0 +1,27 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents.mcp_client import MCPSkillResult  # noqa: E402
+
+
+class SlowClient:
+    """Fake MCP client whose skills sleep for a configured time"""
+
+    def __init__(self, delays):
+        self.delays = delays
+
+    async def call_skill(self, skill_name, parameters):
+        await asyncio.sleep(self.delays.get(skill_name, 0))
+        return MCPSkillResult(success=True, skill_name=skill_name, result={})
+
+
+@pytest.fixture
+def slow_client():
+    """Factory for a ``SlowClient`` with per-skill delays in seconds"""
+    return SlowClient
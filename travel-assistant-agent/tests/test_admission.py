@@ -0,0 +1,266 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents import mcp_client as mcp_client_module  # noqa: E402
+from agents.admission import AdmissionController, AdmissionRejected, Priority  # noqa: E402
+from agents.mcp_client import MCPClient  # noqa: E402
+from agents.mcp_transport import MCPTransport  # noqa: E402
+from mcp_server.config import MCPClientConfig  # noqa: E402
+
+
+class GatedTransport(MCPTransport):
+    """Holds every skills/call until the test opens the gate"""
+
+    name = "gated"
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.requests = []
+
+    async def connect(self):
+        pass
+
+    async def request(self, method, params=None):
+        if method == "skills/list":
+            return []
+        self.requests.append(params["name"])
+        await self.gate.wait()
+        return {"success": True, "skill_name": params["name"], "result": {}}
+
+    async def close(self):
+        pass
+
+    @property
+    def connected(self):
+        return True
+
+
+def make_client(**config):
+    config.setdefault("cache_enabled", False)
+    return MCPClient(config=MCPClientConfig(**config), transport=GatedTransport())
+
+
+async def test_queue_is_bounded_and_served_in_order():
+    admission = AdmissionController(max_concurrent=1, max_queued=2)
+    await admission.acquire("a")
+
+    order = []
+
+    async def wait(name):
+        await admission.acquire(name)
+        order.append(name)
+
+    waiters = [asyncio.create_task(wait(n)) for n in ("b", "c")]
+    await asyncio.sleep(0)
+    assert admission.queued == 2
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        await admission.acquire("d")
+    assert rejected.value.retry_after >= 1
+    assert admission.rejected == 1
+
+    admission.release("a", 0.1)
+    await asyncio.sleep(0)
+    assert order == ["b"]
+    admission.release("b", 0.1)
+    await asyncio.gather(*waiters)
+    assert order == ["b", "c"]
+
+
+async def test_saturated_skill_does_not_block_other_skills():
+    admission = AdmissionController(max_concurrent=4, skill_limits={"slow": 1})
+    await admission.acquire("slow")
+
+    blocked = asyncio.create_task(admission.acquire("slow"))
+    await asyncio.sleep(0)
+    assert admission.queued == 1
+
+    # Global room is left, so other skills are admitted straight away
+    assert admission.try_acquire("fast")
+
+    blocked.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await blocked
+    assert admission.queued == 0
+    assert admission.get_statistics()["active_by_skill"] == {"slow": 1, "fast": 1}
+
+
+async def _fill(admission, count, priority, order):
+    async def wait(name):
+        await admission.acquire(name, priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(wait(f"{priority.value}-{i}")) for i in range(count)
+    ]
+    await asyncio.sleep(0)
+    return tasks
+
+
+async def test_interactive_calls_go_before_queued_batch_work():
+    admission = AdmissionController(max_concurrent=2, batch_min_share=0)
+    for _ in range(2):
+        await admission.acquire("bulk", Priority.BATCH)
+
+    order = []
+    batch = await _fill(admission, 2, Priority.BATCH, order)
+    interactive = await _fill(admission, 2, Priority.INTERACTIVE, order)
+
+    admission.release("bulk", priority=Priority.BATCH)
+    admission.release("bulk", priority=Priority.BATCH)
+    await asyncio.sleep(0)
+    assert order == ["interactive-0", "interactive-1"]
+
+    for name in list(order):
+        admission.release(name)
+    await asyncio.gather(*batch, *interactive)
+    assert order[2:] == ["batch-0", "batch-1"]
+
+
+async def test_batch_work_keeps_its_reserved_share():
+    admission = AdmissionController(max_concurrent=4, batch_min_share=0.25)
+    for i in range(4):
+        await admission.acquire(f"busy-{i}")
+
+    order = []
+    batch = await _fill(admission, 2, Priority.BATCH, order)
+    interactive = await _fill(admission, 3, Priority.INTERACTIVE, order)
+
+    for i in range(3):
+        admission.release(f"busy-{i}")
+    await asyncio.sleep(0)
+    # One slot goes to batch work, the rest to interactive calls
+    assert sorted(order) == ["batch-0", "interactive-0", "interactive-1"]
+    assert admission.get_statistics()["active_by_priority"] == {
+        "interactive": 3, "batch": 1
+    }
+
+    for task in batch + interactive:
+        task.cancel()
+    await asyncio.gather(*batch, *interactive, return_exceptions=True)
+
+
+async def test_interactive_call_takes_a_full_queue_place_from_batch():
+    admission = AdmissionController(max_concurrent=1, max_queued=1)
+    await admission.acquire("running")
+
+    queued_batch = asyncio.create_task(admission.acquire("bulk", Priority.BATCH))
+    interactive = asyncio.create_task(admission.acquire("user"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected):
+        await queued_batch
+    assert admission.preempted == 1
+
+    admission.release("running")
+    await interactive
+    assert admission.get_statistics()["active_by_skill"] == {"user": 1}
+
+
+async def test_batch_call_is_not_preempted_for_a_rejected_interactive_call():
+    admission = AdmissionController(max_concurrent=1, max_queued=2, skill_queue_limit=1)
+    await admission.acquire("running")
+
+    queued_batch = asyncio.create_task(admission.acquire("bulk", Priority.BATCH))
+    queued_user = asyncio.create_task(admission.acquire("user"))
+    await asyncio.sleep(0)
+
+    # The queue is full and "user" already has its one queue place
+    with pytest.raises(AdmissionRejected):
+        await admission.acquire("user")
+    assert admission.preempted == 0 and not queued_batch.done()
+
+    # Both queued calls still run, the batch one first from its reserved share
+    admission.release("running")
+    await asyncio.wait_for(queued_batch, timeout=1)
+    admission.release("bulk", priority=Priority.BATCH)
+    await asyncio.wait_for(queued_user, timeout=1)
+
+
+async def test_client_rejects_calls_beyond_the_queue():
+    client = make_client(max_concurrent_calls=1, max_queued_calls=1)
+
+    first = asyncio.create_task(client.call_skill("get_weather", {"destination": "A"}))
+    second = asyncio.create_task(client.call_skill("get_weather", {"destination": "B"}))
+    await asyncio.sleep(0.01)
+
+    third = await client.call_skill("get_weather", {"destination": "C"})
+    assert not third.success
+    assert third.retry_after >= 1
+
+    client.transport.gate.set()
+    assert all(r.success for r in await asyncio.gather(first, second))
+    assert client.get_statistics()["admission"]["rejected"] == 1
+
+
+async def test_batch_larger_than_the_limit_does_not_deadlock():
+    client = make_client(max_concurrent_calls=2, max_queued_calls=10)
+    client.transport.gate.set()
+
+    results = await asyncio.wait_for(client.call_skills_parallel([
+        {"skill": "get_weather", "parameters": {"destination": f"City {i}"}}
+        for i in range(5)
+    ]), timeout=2)
+
+    assert all(r.success for r in results)
+    assert client.admission.active == 0
+
+
+async def test_preempted_batch_call_does_not_reject_the_rest_of_the_batch():
+    client = make_client(max_concurrent_calls=1, max_queued_calls=1)
+    batch = asyncio.create_task(client.call_skills_parallel([
+        {"skill": "get_weather", "parameters": {"destination": f"City {i}"}}
+        for i in range(3)
+    ], priority=Priority.BATCH))
+    while client.admission.queued < 1:
+        await asyncio.sleep(0)
+
+    # The queue is full with the batch's second call; this takes its place
+    interactive = asyncio.create_task(
+        client.call_skill("search_destination", {"destination": "Tokyo"})
+    )
+    await asyncio.sleep(0.01)
+    assert client.admission.preempted == 1
+
+    client.transport.gate.set()
+    results = await asyncio.wait_for(batch, timeout=2)
+    assert [r.success for r in results] == [True, False, True]
+    assert "preempted" in results[1].error
+    assert (await interactive).success
+    assert client.transport.requests.index("search_destination") < 2
+    assert client.admission.active == 0 and client.admission.queued == 0
+
+
+def test_endpoints_answer_429_with_retry_after(monkeypatch):
+    import main
+
+    client = make_client(max_concurrent_calls=1, max_queued_calls=0)
+    monkeypatch.setattr(mcp_client_module, "_mcp_client", client)
+    # Occupy the only slot
+    assert client.admission.try_acquire("get_weather")
+
+    api = TestClient(main.app)
+    response = api.post("/mcp/call-skill", json={
+        "skill_name": "get_weather", "parameters": {"destination": "Tokyo"}
+    })
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+    batch = api.post("/mcp/batch-call", json={"calls": [
+        {"skill_name": "get_weather", "parameters": {"destination": "Tokyo"}}
+    ]})
+    assert batch.status_code == 429
+
+    monkeypatch.setattr(main.settings, "mcp_max_batch_calls", 1)
+    too_large = api.post("/mcp/batch-call", json={"calls": [
+        {"skill_name": "get_weather", "parameters": {"destination": d}}
+        for d in ("Tokyo", "Paris")
+    ]})
+    assert too_large.status_code == 413
@@ -0,0 +1,99 @@
+import os
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from mcp_server.skills.catalog import get_catalog  # noqa: E402
+from mcp_server.skills.climatology import (  # noqa: E402
+    ClimateStore,
+    day_of_year,
+    default_cache_dir,
+)
+from mcp_server.skills.weather import GetWeatherSkill  # noqa: E402
+
+
+def test_day_of_year_lines_up_leap_and_common_years():
+    days = np.array(["2023-02-28", "2023-03-01", "2024-02-29", "2024-03-01", "2100-03-01",
+                     "2024-12-31"], dtype="datetime64[D]")
+
+    assert day_of_year(days).tolist() == [58, 60, 59, 60, 60, 365]
+
+
+def test_store_is_compiled_once_and_memory_mapped(tmp_path):
+    climate = get_catalog().section("climate")
+
+    store = ClimateStore.load(climate, cache_dir=tmp_path)
+    assert isinstance(store.normals, np.memmap)
+    assert store.normals.shape == (len(climate["destinations"]) + 1, 366, 3)
+    files = list(tmp_path.iterdir())
+    assert len(files) == 1
+
+    # Monthly normals are pinned mid-month: Tokyo's mid-August high is 31
+    assert round(float(store.normals[store.row("Tokyo"), 228, 0])) == 31
+    assert store.row("Lima") == store.row("Nowhere")
+
+    again = ClimateStore.load(climate, cache_dir=tmp_path)
+    assert list(tmp_path.iterdir()) == files
+    assert np.array_equal(again.normals, store.normals)
+
+    # Many destinations x a long trip in one slice
+    rows = [store.row(name) for name in ("Tokyo", "Paris", "Bali", "Lima")]
+    assert store.normals_for(rows, date(2024, 11, 1), 120).shape == (4, 120, 3)
+
+
+def test_cache_dir_is_private_and_configurable(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLIMATOLOGY_CACHE_DIR", str(tmp_path / "climate"))
+    assert default_cache_dir() == tmp_path / "climate"
+
+    store = ClimateStore.load(get_catalog().section("climate"))
+    assert isinstance(store.normals, np.memmap)
+    assert (tmp_path / "climate").stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_shared_cache_dir_is_not_trusted(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    store = ClimateStore.load(get_catalog().section("climate"), cache_dir=shared)
+    assert not isinstance(store.normals, np.memmap)
+    assert list(shared.iterdir()) == []
+
+
+def test_cache_file_of_the_wrong_shape_is_rebuilt(tmp_path):
+    climate = get_catalog().section("climate")
+    ClimateStore.load(climate, cache_dir=tmp_path)
+    [path] = tmp_path.iterdir()
+    np.save(path, np.zeros((2, 366, 3), dtype=np.float64))
+
+    store = ClimateStore.load(climate, cache_dir=tmp_path)
+    assert store.normals.shape == (len(climate["destinations"]) + 1, 366, 3)
+    assert store.normals.dtype == np.float32
+    assert round(float(store.normals[store.row("Tokyo"), 228, 0])) == 31
+
+
+async def test_forecast_uses_real_dates_without_a_two_week_cap():
+    skill = GetWeatherSkill()
+
+    result = await skill.execute(destination="Paris", start_date="2024-12-20", end_date="2025-02-10")
+    forecast = result["forecast"]
+    assert len(forecast) == 53
+    assert forecast[0]["date"] == "2024-12-20" and forecast[-1]["date"] == "2025-02-10"
+    assert all(day["temperature_low"] < day["temperature_high"] for day in forecast)
+
+    summer = await skill.execute(destination="Paris", start_date="2024-07-15", end_date="2024-07-15")
+    assert summer["forecast"][0]["temperature_high"] > forecast[30]["temperature_high"]
+    bali = await skill.execute(destination="Bali", start_date="2024-01-15", end_date="2024-01-15")
+    assert bali["forecast"][0]["condition"] == "Rain"
+
+    default = await skill.execute(destination="Tokyo")
+    assert len(default["forecast"]) == 7
+    assert default["forecast"][0]["date"] == date.today().isoformat()
+    assert default["forecast"][-1]["date"] == (date.today() + timedelta(days=6)).isoformat()
@@ -0,0 +1,163 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents.mcp_client import MCPClient  # noqa: E402
+from agents.search import SearchAgent  # noqa: E402
+from mcp_server.config import MCPClientConfig  # noqa: E402
+from mcp_server.protocol import MCPDispatcher  # noqa: E402
+from mcp_server.server import MCPServer  # noqa: E402
+from utils.deadline import (  # noqa: E402
+    DeadlineExceeded,
+    deadline_scope,
+    fresh_deadline_scope,
+    remaining,
+    run_within_deadline,
+)
+
+from tests.test_skill_resilience import OK, ScriptedTransport  # noqa: E402
+
+
+def test_nested_scopes_only_tighten_the_deadline():
+    assert remaining() is None
+    with deadline_scope(1.0):
+        outer = remaining()
+        with deadline_scope(10.0):
+            assert remaining() <= outer
+        with deadline_scope(0.1):
+            assert remaining() <= 0.1
+    assert remaining() is None
+
+
+def test_fresh_scope_replaces_the_deadline():
+    with deadline_scope(0.01):
+        with fresh_deadline_scope(60):
+            assert remaining() > 59
+        with fresh_deadline_scope(None):
+            assert remaining() is None
+        assert remaining() <= 0.01
+
+
+async def test_run_within_deadline_cancels_the_stage():
+    with deadline_scope(0.02):
+        with pytest.raises(DeadlineExceeded):
+            await run_within_deadline(asyncio.sleep(1), "slow stage")
+
+    # A stage's own timeout is passed through while budget remains
+    async def own_timeout():
+        raise asyncio.TimeoutError()
+
+    with deadline_scope(5):
+        with pytest.raises(asyncio.TimeoutError) as raised:
+            await run_within_deadline(own_timeout(), "stage")
+        assert not isinstance(raised.value, DeadlineExceeded)
+
+
+async def test_skill_calls_stop_at_the_deadline_without_tripping_the_breaker():
+    transport = ScriptedTransport([(1.0, OK)])
+    client = MCPClient(
+        config=MCPClientConfig(cache_enabled=False, retry_attempts=3, circuit_failure_threshold=1),
+        transport=transport
+    )
+
+    with deadline_scope(0.05):
+        result = await client.call_skill("get_weather", {"destination": "Tokyo"})
+    assert "Deadline exceeded" in result.error
+    assert transport.requests == 1
+    assert client.get_statistics()["circuit_breakers"]["get_weather"]["state"] == "closed"
+
+    with deadline_scope(0):
+        result = await client.call_skill("get_weather", {"destination": "Paris"})
+        batch = await client.call_skills_parallel([
+            {"skill": "get_weather", "parameters": {"destination": "Rome"}}
+        ])
+    assert not result.success and not batch[0].success
+    assert transport.requests == 1
+    assert client.deadline_exceeded_calls == 3
+
+
+async def test_coalesced_callers_keep_their_own_deadlines():
+    transport = ScriptedTransport([(0.1, OK)])
+    client = MCPClient(config=MCPClientConfig(cache_enabled=False), transport=transport)
+    call = {"skill": "get_weather", "parameters": {"destination": "Tokyo"}}
+
+    async def call_with_budget(budget, parallel=False):
+        with deadline_scope(budget):
+            if parallel:
+                return (await client.call_skills_parallel([call]))[0]
+            return await client.call_skill(call["skill"], call["parameters"])
+
+    # A longer budget does not inherit the shorter in-flight call's deadline
+    short, long = await asyncio.gather(call_with_budget(0.03), call_with_budget(5))
+    assert "Deadline exceeded" in short.error and long.success
+    assert transport.requests == 2 and client.coalesced_calls == 0
+
+    # A shorter budget shares the longer call but stops waiting at its own deadline
+    long, short, short_batch = await asyncio.gather(
+        call_with_budget(5), call_with_budget(0.03), call_with_budget(0.03, parallel=True)
+    )
+    assert long.success
+    assert "Deadline exceeded" in short.error and "Deadline exceeded" in short_batch.error
+    assert transport.requests == 3 and client.coalesced_calls == 2
+
+
+async def test_server_abandons_calls_past_the_callers_budget():
+    class SlowServer:
+        async def call_skill(self, name, arguments):
+            await asyncio.sleep(1)
+
+    dispatcher = MCPDispatcher(SlowServer())
+    response = await dispatcher.call(
+        "skills/call", {"name": "get_weather", "arguments": {}, "timeout": 0.01}
+    )
+    assert response["success"] is False
+    assert response["deadline_exceeded"] is True
+
+
+async def test_abandoned_calls_are_recorded_in_history_and_metrics():
+    server = MCPServer()
+
+    async def slow_run(skill, parameters):
+        await asyncio.sleep(1)
+
+    server.executor.run = slow_run
+    response = await MCPDispatcher(server).call(
+        "skills/call",
+        {"name": "get_weather", "arguments": {"destination": "Tokyo"}, "timeout": 0.01}
+    )
+    assert response["deadline_exceeded"] is True
+
+    [record] = server.get_call_history()
+    assert record["skill_name"] == "get_weather"
+    assert record["success"] is False and record["error"] == "cancelled"
+    metrics = server.get_skill_metrics()["get_weather"]
+    assert metrics["count"] == 1 and metrics["error_count"] == 1
+    assert metrics["p50_ms"] is not None
+
+
+async def test_agents_skip_their_stage_once_the_deadline_passed():
+    with deadline_scope(0):
+        state = await SearchAgent().run({"collected_info": {"destination": "北京"}})
+    assert state["skipped_stages"] == ["search_agent"]
+    assert "search_results" not in state
+
+
+def test_request_timeout_header_sets_the_budget():
+    from fastapi.testclient import TestClient
+
+    from agents import init_mcp_client
+    from main import app
+
+    asyncio.run(init_mcp_client())
+    client = TestClient(app)
+    body = {"skill_name": "get_weather", "parameters": {"destination": "Tokyo"}}
+
+    expired = client.post("/mcp/call-skill", json=body, headers={"X-Request-Timeout": "0"})
+    assert "Deadline exceeded" in expired.json()["error"]
+
+    assert client.post("/mcp/call-skill", json=body).json()["success"]
@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from mcp_server.skills.destination import SearchDestinationSkill  # noqa: E402
+from mcp_server.skills.destination_index import DestinationIndex, normalize  # noqa: E402
+
+
+def test_normalize_folds_case_accents_and_punctuation():
+    assert normalize("  Tōkyō ") == "tokyo"
+    assert normalize("Paris, France") == "paris france"
+    assert normalize("Ｂａｌｉ") == "bali"
+    assert normalize("東京") == "東京"
+
+
+def test_matches_are_ranked_not_first_found():
+    index = DestinationIndex({
+        "bali": ["Bali"],
+        "balikpapan": ["Balikpapan"],
+        "york": ["York"],
+        "new york": ["New York", "纽约"],
+    })
+
+    # A linear substring scan would stop at "bali" / "york"
+    assert index.best("Balikpapn").key == "balikpapan"
+    assert index.best("new york").key == "new york"
+    assert index.best("纽约").kind == "exact"
+
+    matches = index.search("new york city trip", limit=2)
+    assert [match.key for match in matches] == ["new york", "york"]
+    assert matches[0].kind == "span"
+    assert matches[0].score > matches[1].score
+
+
+def test_prefix_fuzzy_and_misses():
+    index = DestinationIndex({"tokyo": ["Tokyo"], "paris": ["Paris"]})
+
+    assert index.best("par").kind == "prefix"
+    assert index.best("Tokyp").key == "tokyo"
+    assert index.best("Tokyp").kind == "fuzzy"
+    assert index.best("okyo").key == "tokyo"
+    assert index.best("London") is None
+    assert index.search("   ") == []
+
+
+def test_common_words_do_not_match_on_their_own():
+    index = DestinationIndex({
+        f"place{i} springs": [] for i in range(200)
+    } | {"palm springs": []})
+
+    assert index.best("palm sprigns").key == "palm springs"
+    assert index.best("xyz springs") is None
+
+
+async def test_search_destination_resolves_aliases():
+    skill = SearchDestinationSkill()
+
+    assert (await skill.execute(destination="东京"))["destination"] == "Tokyo"
+    assert (await skill.execute(destination="巴黎"))["destination"] == "Paris"
+    assert (await skill.execute(destination="Pariss"))["destination"] == "Paris"
+    assert (await skill.execute(destination="London"))["destination"] == "London"
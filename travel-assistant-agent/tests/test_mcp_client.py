@@ -0,0 +1,79 @@
+import asyncio
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents.mcp_client import MCPClient, MCPSkillResult  # noqa: E402
+from mcp_server.config import MCPClientConfig  # noqa: E402
+
+
+class CountingClient(MCPClient):
+    """MCP client whose backend is a slow counting fake"""
+
+    def __init__(self, delay=0.05, **kwargs):
+        super().__init__(config=MCPClientConfig(cache_enabled=False), **kwargs)
+        self.delay = delay
+        self.backend_hits = 0
+
+    async def _execute_skill(self, skill_name, parameters, attempts=None, priority=None):
+        self.executions += 1
+        self.backend_hits += 1
+        await asyncio.sleep(self.delay)
+        return MCPSkillResult(
+            success=True,
+            skill_name=skill_name,
+            result={"destination": parameters["destination"]}
+        )
+
+
+async def test_identical_concurrent_calls_share_one_execution():
+    client = CountingClient()
+    params = {"destination": "Tokyo"}
+
+    results = await asyncio.gather(
+        *(client.call_skill("search_destination", params) for _ in range(20)),
+        client.call_skill("search_destination", {"destination": "Paris"})
+    )
+
+    assert client.backend_hits == 2
+    assert client.coalesced_calls == 19
+    assert all(r.result["destination"] == "Tokyo" for r in results[:20])
+    # Each waiter receives its own copy of the shared result
+    assert results[0].result is not results[1].result
+
+
+async def test_cancelling_a_waiter_does_not_cancel_shared_execution():
+    client = CountingClient(delay=0.1)
+    params = {"destination": "Paris"}
+
+    first = asyncio.create_task(client.call_skill("query_prices", params))
+    second = asyncio.create_task(client.call_skill("query_prices", params))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    result = await second
+    assert result.success
+    assert first.cancelled()
+    assert client.backend_hits == 1
+    assert client.get_statistics()["in_flight"] == 0
+
+
+async def test_skill_indexes_are_immutable_snapshots():
+    from agents.mcp_client import MCPSkillCategory
+
+    client = MCPClient()
+    await client.connect()
+
+    assert client.get_skill("get_weather").category == "weather"
+    assert client.get_skill("missing") is None
+    assert [s.name for s in client.get_skills_by_category(MCPSkillCategory.PRICING)] == [
+        "query_prices", "bulk_quote_prices"
+    ]
+    assert client.get_skills_by_category("no_such_category") == ()
+    assert client.list_skills() is client.list_skills()
+    assert isinstance(client.list_skills(), tuple)
+
+    await client.disconnect()
+    assert client.get_skill("get_weather") is None
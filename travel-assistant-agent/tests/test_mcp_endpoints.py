@@ -0,0 +1,196 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+
+def make_client():
+    from agents import init_mcp_client
+    from main import app
+
+    asyncio.run(init_mcp_client())
+    return TestClient(app)
+
+
+def test_skill_catalog_supports_etag():
+    client = make_client()
+
+    response = client.get("/mcp/skills")
+    assert response.status_code == 200
+    assert response.json()["total_count"] == 6
+    etag = response.headers["etag"]
+
+    cached = client.get("/mcp/skills", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    stale = client.get("/mcp/skills", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+
+
+def test_status_supports_etag():
+    client = make_client()
+
+    response = client.get("/mcp/status")
+    assert response.status_code == 200
+    assert response.json()["connected"] is True
+
+    cached = client.get(
+        "/mcp/status", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_batch_call_streams_results_as_ndjson_and_sse():
+    client = make_client()
+    calls = [
+        {"skill_name": "get_weather", "parameters": {"destination": f"City {i}"}}
+        for i in range(5)
+    ] + [{"skill_name": "get_weather", "parameters": {}}]
+
+    with client.stream("POST", "/mcp/batch-call?stream=ndjson", json={"calls": calls}) as response:
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.iter_lines() if line]
+
+    *results, summary = records
+    assert sorted(r["index"] for r in results) == list(range(6))
+    by_index = {r["index"]: r for r in results}
+    assert by_index[2]["result"]["destination"] == "City 2"
+    assert not by_index[5]["success"]
+    assert summary["summary"]["total_calls"] == 6
+    assert summary["summary"]["successful_calls"] == 5
+
+    response = client.post("/mcp/batch-call?stream=sse", json={"calls": calls[:2]})
+    events = [line for line in response.text.splitlines() if line.startswith("event:")]
+    assert events == ["event: result", "event: result", "event: summary"]
+
+
+def _sse_events(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def _count_skill_calls(monkeypatch, skill_name):
+    from agents import get_mcp_client
+
+    client = get_mcp_client()
+    original = client.call_skill
+    calls = []
+
+    async def call_skill(name, parameters, *args, **kwargs):
+        if name == skill_name:
+            calls.append(parameters)
+        return await original(name, parameters, *args, **kwargs)
+
+    monkeypatch.setattr(client, "call_skill", call_skill)
+    return calls
+
+
+def test_demo_planning_runs_the_template_and_plans_once(monkeypatch):
+    client = make_client()
+    plans = _count_skill_calls(monkeypatch, "create_travel_plan")
+
+    response = client.post(
+        "/agent/demo-planning-with-skills",
+        json={"destination": "Tokyo", "duration_days": 3, "interests": ["food"]}
+    )
+    body = response.json()
+    assert len(plans) == 1 and plans[0]["interests"] == ["food"]
+    assert body["travel_plan"] == body["skill_results"]["create_travel_plan"]["data"]
+    assert body["critical_path"][-1] == "create_travel_plan"
+
+    quick = client.post(
+        "/agent/demo-planning-with-skills",
+        json={"destination": "Tokyo", "duration_days": 3, "use_template": "quick_check"}
+    ).json()
+    assert quick["skills_used"] == ["search_destination", "get_destination_reviews"]
+    assert len(plans) == 2 and "error" not in quick["travel_plan"]
+
+
+def test_demo_planning_streams_skill_results_before_the_plan(monkeypatch):
+    client = make_client()
+    plans = _count_skill_calls(monkeypatch, "create_travel_plan")
+
+    response = client.post(
+        "/agent/demo-planning-with-skills/stream",
+        json={"destination": "Tokyo", "duration_days": 3}
+    )
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+
+    names = [name for name, _ in events]
+    assert names[0] == "start" and names[-1] == "done"
+    skills = [data for name, data in events if name == "skill"]
+    assert len(skills) == len(events[0][1]["skills_used"])
+    assert all(step["success"] for step in skills)
+    assert "create_travel_plan" not in [step["skill"] for step in skills]
+    assert len(plans) == 1
+    plan = next(data for name, data in events if name == "plan")
+    assert "error" not in plan["travel_plan"]
+    assert events[-1][1]["critical_path"]
+
+
+def test_streams_are_not_cut_off_by_the_request_budget():
+    client = make_client()
+    # Long spent by the time the body is produced
+    headers = {"X-Request-Timeout": "0.001"}
+
+    calls = [
+        {"skill_name": "get_weather", "parameters": {"destination": f"City {i}"}}
+        for i in range(3)
+    ]
+    response = client.post("/mcp/batch-call?stream=ndjson", json={"calls": calls}, headers=headers)
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert records[-1]["summary"]["successful_calls"] == 3
+
+    response = client.post(
+        "/agent/demo-planning-with-skills/stream",
+        json={"destination": "Paris", "duration_days": 2},
+        headers=headers
+    )
+    events = _sse_events(response.text)
+    assert all(data["success"] for name, data in events if name == "skill")
+    assert "error" not in next(data for name, data in events if name == "plan")["travel_plan"]
+
+
+def test_bulk_quotes_endpoint(monkeypatch):
+    from config import settings
+
+    client = make_client()
+    response = client.post("/mcp/bulk-quotes", json={
+        "destinations": ["Tokyo", "Bali"],
+        "date_pairs": [
+            {"check_in": "2024-06-01", "check_out": "2024-06-05"},
+            {"check_in": "2024-06-10", "check_out": "2024-06-12"},
+        ],
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["skill_name"] == "bulk_quote_prices"
+    assert body["result"]["total_quotes"] == 4
+    assert [q["dates"]["nights"] for q in body["result"]["quotes"]] == [4, 2, 4, 2]
+
+    too_many = client.post("/mcp/bulk-quotes", json={
+        "destinations": [f"City {i}" for i in range(settings.mcp_max_bulk_quotes + 1)]
+    })
+    assert too_many.status_code == 413
+
+    # The setting is the only cap: raising it lets larger grids through
+    monkeypatch.setattr(settings, "mcp_max_bulk_quotes", 6000)
+    large = client.post("/mcp/bulk-quotes", json={
+        "destinations": [f"City {i}" for i in range(5001)], "hotels_per_quote": 0
+    })
+    assert large.json()["result"]["total_quotes"] == 5001
+
+    assert client.post("/mcp/bulk-quotes", json={
+        "destinations": ["Tokyo"], "guests": -2
+    }).status_code == 422
@@ -0,0 +1,103 @@
+import asyncio
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from mcp_server import MCPServer, MCPServerConfig  # noqa: E402
+
+
+async def test_batch_preserves_order_and_bounds_concurrency():
+    server = MCPServer(MCPServerConfig(
+        batch_concurrency=4,
+        skill_concurrency_limits={"query_prices": 1}
+    ))
+    in_flight = {"total": 0, "peak": 0, "query_prices": 0, "prices_peak": 0}
+
+    async def fake_call_skill(skill_name, parameters):
+        in_flight["total"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["total"])
+        if skill_name == "query_prices":
+            in_flight["query_prices"] += 1
+            in_flight["prices_peak"] = max(
+                in_flight["prices_peak"], in_flight["query_prices"]
+            )
+        await asyncio.sleep(0.01 * (parameters["i"] % 3))
+        in_flight["total"] -= 1
+        if skill_name == "query_prices":
+            in_flight["query_prices"] -= 1
+        return {"success": True, "skill_name": skill_name, "result": parameters}
+
+    server.call_skill = fake_call_skill
+    skills = ["search_destination", "query_prices", "get_weather"]
+    calls = [
+        {"skill": skills[i % 3], "parameters": {"i": i}} for i in range(30)
+    ]
+
+    results = await server.call_skills_batch(calls)
+
+    assert [r["result"]["i"] for r in results] == list(range(30))
+    assert in_flight["peak"] <= 4
+    assert in_flight["prices_peak"] == 1
+
+
+async def test_batch_runs_real_skills():
+    server = MCPServer()
+    results = await server.call_skills_batch([
+        {"skill": "search_destination", "parameters": {"destination": "Tokyo"}},
+        {"skill": "missing_skill", "parameters": {}},
+    ])
+
+    assert results[0]["success"] is True
+    assert results[1]["success"] is False
+
+
+async def test_history_is_bounded_and_metrics_stream():
+    server = MCPServer(MCPServerConfig(history_size=5))
+    for i in range(12):
+        await server.call_skill("get_weather", {"destination": f"City {i}"})
+    await server.call_skill("get_weather", {})
+
+    assert len(server.call_history) == 5
+    recent = server.get_call_history(limit=2)
+    assert [r["success"] for r in recent] == [False, True]
+    assert "parameters" not in recent[1]
+    assert "destination" in recent[1]["parameter_names"]
+
+    metrics = server.get_skill_metrics()["get_weather"]
+    assert metrics["count"] == 13
+    assert metrics["error_count"] == 1
+    assert metrics["p50_ms"] <= metrics["p99_ms"]
+
+
+async def test_call_skill_coerces_and_rejects_parameters():
+    server = MCPServer()
+
+    ok = await server.call_skill(
+        "query_prices", {"destination": "Tokyo", "guests": "3", "rooms": 1.0}
+    )
+    assert ok["success"] is True
+    assert ok["result"]["flights"][0]["price"] == 800 * 3
+
+    bad = await server.call_skill(
+        "query_prices", {"destination": "Tokyo", "guests": "many", "nights": 2}
+    )
+    assert bad["success"] is False
+    assert len(bad["validation_errors"]) == 2
+
+
+async def test_process_mode_skill_runs_in_worker_process():
+    server = MCPServer(MCPServerConfig(process_pool_workers=1))
+    await server.start()
+    try:
+        result = await server.call_skill(
+            "create_travel_plan", {"destination": "Tokyo", "duration_days": 3}
+        )
+        threaded = await server.call_skill("query_prices", {"destination": "Tokyo"})
+    finally:
+        await server.stop()
+
+    assert result["success"] is True
+    assert len(result["result"]["itinerary"]) == 3
+    assert threaded["success"] is True
@@ -0,0 +1,339 @@
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents.mcp_client import MCPClient  # noqa: E402
+from agents.mcp_transport import (  # noqa: E402
+    InProcessTransport,
+    MCPTransportError,
+    MultiplexedTransport,
+    StdioTransport,
+)
+from mcp_server.config import MCPClientConfig  # noqa: E402
+from mcp_server.protocol import (  # noqa: E402
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    JSONRPCError,
+    MCPDispatcher,
+)
+from mcp_server.server import MCPServer  # noqa: E402
+from mcp_server.skills.catalog import unfreeze  # noqa: E402
+
+
+class LoopbackTransport(MultiplexedTransport):
+    """Multiplexed transport whose 'server' is the test itself"""
+
+    name = "loopback"
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    async def connect(self):
+        pass
+
+    async def _send(self, message):
+        self.sent.append(message)
+
+    async def close(self):
+        self._fail_pending(MCPTransportError("closed"))
+
+    @property
+    def connected(self):
+        return True
+
+
+async def test_dispatcher_reports_protocol_errors():
+    dispatcher = MCPDispatcher(MCPServer())
+
+    invalid = await dispatcher.handle({"id": 1, "method": "ping"})
+    assert invalid["error"]["code"] == INVALID_REQUEST
+
+    unknown = await dispatcher.handle({"jsonrpc": "2.0", "id": 2, "method": "nope"})
+    assert unknown["id"] == 2
+    assert unknown["error"]["code"] == METHOD_NOT_FOUND
+
+    # Notifications get no response
+    assert await dispatcher.handle({"jsonrpc": "2.0", "method": "ping"}) is None
+
+    # Skill failures are results, not protocol errors
+    response = await dispatcher.handle({
+        "jsonrpc": "2.0", "id": 3, "method": "skills/call",
+        "params": {"name": "no_such_skill", "arguments": {}}
+    })
+    assert response["result"]["success"] is False
+
+
+def _plain_types(value):
+    if isinstance(value, dict):
+        return type(value) is dict and all(_plain_types(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return type(value) is list and all(_plain_types(v) for v in value)
+    return True
+
+
+async def test_in_process_results_have_the_decoded_json_types():
+    client = MCPClient(
+        config=MCPClientConfig(cache_enabled=False), transport=InProcessTransport(MCPServer())
+    )
+    await client.connect()
+    parameters = {"destination": "Tokyo", "duration_days": 2}
+
+    result = (await client.call_skill("create_travel_plan", parameters)).result
+    assert _plain_types(result)
+    assert result == json.loads(json.dumps(result))
+    # Callers own the result; the shared catalog is untouched
+    result["itinerary"][0]["activities"].append("Changed")
+    again = (await client.call_skill("create_travel_plan", parameters)).result
+    assert "Changed" not in again["itinerary"][0]["activities"]
+
+    # Data that was never frozen is passed through, not copied
+    decoded = json.loads(json.dumps(again))
+    assert unfreeze(decoded) is decoded
+
+
+async def test_multiplexed_responses_resolve_out_of_order():
+    transport = LoopbackTransport()
+    calls = [
+        asyncio.create_task(transport.request("skills/call", {"name": f"s{i}"}))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert transport.pending_requests == 3
+
+    for message in reversed(transport.sent):
+        transport._on_message({
+            "jsonrpc": "2.0", "id": message["id"],
+            "result": message["params"]["name"]
+        })
+    transport._on_message({
+        "jsonrpc": "2.0", "id": transport.sent[0]["id"] + 100, "result": None
+    })
+
+    assert await asyncio.gather(*calls) == ["s0", "s1", "s2"]
+    assert transport.pending_requests == 0
+
+    failing = asyncio.create_task(transport.request("ping"))
+    await asyncio.sleep(0)
+    transport._on_message({
+        "jsonrpc": "2.0", "id": transport.sent[-1]["id"],
+        "error": {"code": METHOD_NOT_FOUND, "message": "nope"}
+    })
+    with pytest.raises(JSONRPCError):
+        await failing
+
+
+async def test_unanswered_requests_time_out():
+    transport = LoopbackTransport()
+    transport.timeout = 0.05
+
+    with pytest.raises(asyncio.TimeoutError):
+        await transport.request("ping")
+    results = await transport.request_batch([("ping", None), ("ping", None)])
+    assert all(isinstance(r, asyncio.TimeoutError) for r in results)
+    assert transport.pending_requests == 0
+
+
+async def test_dispatcher_streams_batch_responses():
+    dispatcher = MCPDispatcher(MCPServer())
+    sent = []
+
+    async def send(response):
+        sent.append(response)
+
+    await dispatcher.handle_batch([
+        {"jsonrpc": "2.0", "id": i, "method": "skills/call",
+         "params": {"name": "get_weather", "arguments": {"destination": f"City {i}"}}}
+        for i in range(5)
+    ] + [{"jsonrpc": "2.0", "method": "ping"}], send)
+
+    assert sorted(r["id"] for r in sent) == list(range(5))
+    assert all(r["result"]["success"] for r in sent)
+
+    sent.clear()
+    await dispatcher.handle_batch([], send)
+    assert sent[0]["error"]["code"] == INVALID_REQUEST
+
+
+async def test_batch_frame_resolves_out_of_order():
+    transport = LoopbackTransport()
+    batch = asyncio.create_task(transport.request_batch(
+        [("skills/call", {"name": f"s{i}"}) for i in range(3)]
+    ))
+    await asyncio.sleep(0)
+
+    # All three requests went out in a single frame
+    assert len(transport.sent) == 1
+    frame = transport.sent[0]
+    assert [m["params"]["name"] for m in frame] == ["s0", "s1", "s2"]
+
+    transport._on_message({"jsonrpc": "2.0", "id": frame[2]["id"], "result": "r2"})
+    transport._on_message({
+        "jsonrpc": "2.0", "id": frame[0]["id"],
+        "error": {"code": METHOD_NOT_FOUND, "message": "nope"}
+    })
+    transport._on_message({"jsonrpc": "2.0", "id": frame[1]["id"], "result": "r1"})
+
+    results = await batch
+    assert isinstance(results[0], JSONRPCError)
+    assert results[1:] == ["r1", "r2"]
+    assert transport.pending_requests == 0
+
+
+async def test_parallel_results_are_yielded_as_they_arrive():
+    transport = LoopbackTransport()
+    client = MCPClient(config=MCPClientConfig(cache_enabled=False), transport=transport)
+    results = client.iter_skills_parallel([
+        {"skill": "get_weather", "parameters": {"destination": f"City {i}"}}
+        for i in range(3)
+    ])
+
+    first = asyncio.ensure_future(results.__anext__())
+    while not transport.sent:
+        await asyncio.sleep(0)
+    frame = transport.sent[0]
+    transport._on_message({
+        "jsonrpc": "2.0", "id": frame[2]["id"],
+        "result": {"success": True, "skill_name": "get_weather", "result": {"n": 2}}
+    })
+
+    # The last call finished first and is not held back by the others
+    index, result = await first
+    assert (index, result.result) == (2, {"n": 2})
+    assert client.admission.active == 2
+
+    for position in (0, 1):
+        transport._on_message({
+            "jsonrpc": "2.0", "id": frame[position]["id"],
+            "result": {"success": True, "skill_name": "get_weather", "result": {"n": position}}
+        })
+    assert sorted([index async for index, _ in results]) == [0, 1]
+    assert client.admission.active == 0
+
+
+async def _exercise_remote_client(config):
+    client = MCPClient(config=config)
+    await client.connect()
+    try:
+        assert client.is_connected()
+        assert "search_destination" in client.list_skill_names()
+
+        destinations = [f"City {i}" for i in range(20)]
+        results = await asyncio.gather(*(
+            client.call_skill("search_destination", {"destination": d})
+            for d in destinations
+        ))
+        assert all(r.success for r in results)
+        assert [r.result["destination"] for r in results] == destinations
+
+        invalid = await client.call_skill("search_destination", {})
+        assert not invalid.success
+
+        # One batch frame; the duplicate call is coalesced client-side
+        calls = [
+            {"skill": "get_weather", "parameters": {"destination": d}}
+            for d in destinations + destinations[:1]
+        ] + [{"skill": "get_weather", "parameters": {}}]
+        batch_results = await client.call_skills_parallel(calls)
+        assert client.batches == 1
+        assert client.coalesced_calls == 1
+        assert [r.result["destination"] for r in batch_results[:-1]] == (
+            destinations + destinations[:1]
+        )
+        assert not batch_results[-1].success
+
+        metrics = await client.get_server_metrics("search_destination")
+        assert metrics["skills"]["search_destination"]["count"] == 20
+        assert client.transport.pending_requests == 0
+    finally:
+        await client.disconnect()
+    assert not client.is_connected()
+
+
+async def test_stdio_transport_pipelines_calls_to_child_process():
+    await _exercise_remote_client(MCPClientConfig(
+        transport="stdio",
+        cache_enabled=False,
+        server_command=[
+            sys.executable, "-m", "mcp_server", "--transport", "stdio", "--no-process-pool"
+        ]
+    ))
+
+
+async def test_stdio_transport_restarts_a_dead_child_process():
+    command = [sys.executable, "-m", "mcp_server", "--transport", "stdio", "--no-process-pool"]
+    client = MCPClient(
+        config=MCPClientConfig(transport="stdio", cache_enabled=False),
+        transport=StdioTransport(command)
+    )
+    await client.connect()
+    try:
+        first = client.transport._process
+        first.kill()
+        await first.wait()
+        assert not client.transport.connected
+
+        result = await client.call_skill("search_destination", {"destination": "Tokyo"})
+        assert result.success
+        assert client.transport.restarts == 1
+        assert client.transport._process.pid != first.pid
+        assert (await client.call_skills_parallel([
+            {"skill": "get_weather", "parameters": {"destination": "Paris"}}
+        ]))[0].success
+
+        # A child that cannot start is retried only after a backoff
+        transport = client.transport
+        transport.command = [sys.executable, "-c", "pass"]
+        transport._process.kill()
+        await transport._process.wait()
+        with pytest.raises(MCPTransportError, match="Could not restart"):
+            await transport.request("ping")
+        with pytest.raises(MCPTransportError, match="backing off"):
+            await transport.request("ping")
+        transport.command = command
+        transport._next_restart = 0.0
+        assert await transport.request("ping") is not None
+    finally:
+        await client.disconnect()
+
+    # A closed transport stays closed
+    with pytest.raises(MCPTransportError):
+        await client.transport.request("ping")
+
+
+async def test_sse_transport_pipelines_calls_over_one_stream():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "mcp_server", "--transport", "sse",
+         "--host", "127.0.0.1", "--port", str(port), "--no-process-pool"],
+        cwd=project_root / "src",
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        config = MCPClientConfig(
+            transport="sse", server_url=f"http://127.0.0.1:{port}", cache_enabled=False
+        )
+        # Wait for the server to accept connections
+        for _ in range(100):
+            try:
+                probe = MCPClient(config=config)
+                await probe.connect()
+                await probe.disconnect()
+                break
+            except (MCPTransportError, OSError):
+                await asyncio.sleep(0.1)
+        await _exercise_remote_client(config)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
@@ -0,0 +1,170 @@
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from mcp_server.skills.catalog import get_catalog  # noqa: E402
+from mcp_server.skills.pricing import BulkQuotePricesSkill, QueryPricesSkill  # noqa: E402
+from mcp_server.skills.quote_engine import QuoteEngine, money  # noqa: E402
+
+
+def large_engine(hotels: int) -> QuoteEngine:
+    pricing = dict(get_catalog().section("pricing"))
+    rng = np.random.default_rng(3)
+    pricing["hotels"] = [
+        {
+            "name": f"Hotel {i}",
+            "rating": round(float(rng.uniform(2.5, 5.0)), 1),
+            "price_per_night": int(rng.integers(40, 900)),
+            "amenities": ["WiFi"],
+            "location": "City Center",
+        }
+        for i in range(hotels)
+    ]
+    return QuoteEngine(pricing)
+
+
+def test_price_grids_broadcast_over_inventory():
+    engine = get_catalog().quote_engine
+
+    totals = engine.hotel_totals([1, 3, 7], rooms=2)
+    assert totals.shape == (len(engine.hotels), len(engine.room_types), 3)
+    assert totals[0, 0, 1] == 250 * 3 * 2
+
+    fares = engine.flight_prices([engine.route("Tokyo"), engine.route("Lima")], 2, "business")
+    assert fares.tolist() == [[4800, 3360], [6000, 4200]]
+    assert engine.durations[engine.route("Tokyo")] == ("12-14 hours", "16-18 hours")
+
+    nights = engine.stays([("2024-05-01", "2024-05-04"), ("2024-05-04", "2024-05-01"), (None, None)])
+    assert nights.tolist() == [3, 1, engine.default_nights]
+    assert engine.stays([("bad", "2024-05-04")]).tolist() == [engine.default_nights]
+
+
+def test_options_are_filtered_and_ranked_across_thousands():
+    engine = large_engine(2000)
+
+    rows, count = engine.hotel_options(
+        nights=4, guests=3, rooms=1, max_total_price=3000, min_rating=4.0, limit=25
+    )
+    assert 0 < len(rows) <= 25 < count
+    totals = [row["total_price"] for row in rows]
+    assert totals == sorted(totals)
+    assert all(row["room_type"] in ("family", "suite") for row in rows)
+    assert all(row["rating"] >= 4.0 and row["total_price"] <= 3000 for row in rows)
+
+    # Same answer as a brute-force scan over every combination
+    nightly = engine.hotel_rates[:, None] * engine.room_multipliers[None, :]
+    fits = (engine.room_capacity >= 3)[None, :] & (engine.hotel_ratings >= 4.0)[:, None]
+    brute = np.sort((nightly * 4)[fits & (nightly * 4 <= 3000)])
+    assert totals == [money(total) for total in brute[:25]]
+
+    by_rating, _ = engine.hotel_options(nights=4, sort_by="rating", limit=10)
+    assert [row["rating"] for row in by_rating] == sorted(
+        (row["rating"] for row in by_rating), reverse=True
+    )
+    with pytest.raises(ValueError):
+        engine.hotel_options(nights=4, sort_by="cheapest")
+
+
+async def test_query_prices_keeps_rate_card_and_adds_options():
+    result = await QueryPricesSkill().execute(
+        destination="Paris", check_in="2024-05-01", check_out="2024-05-04",
+        guests=3, max_options=3, sort_by="value"
+    )
+
+    assert [hotel["total_price"] for hotel in result["hotels"]] == [750, 1200, 270]
+    assert [flight["price"] for flight in result["flights"]] == [2100, int(700 * 0.7 * 3)]
+    assert result["total_budget_estimate"]["daily_budget"] == (750 + 2100) // 3
+    assert len(result["options"]) == 3
+    assert result["options_count"] == 6
+    assert result["options"][0]["name"] == "Budget Inn Express"
+
+    plain = await QueryPricesSkill().execute(destination="Paris")
+    assert "options" not in plain
+
+
+async def test_bulk_quotes_cover_every_destination_and_date_pair():
+    result = await BulkQuotePricesSkill().execute(
+        destinations=["Tokyo", "Paris", "Lima"],
+        date_pairs=[
+            {"check_in": "2024-05-01", "check_out": "2024-05-04"},
+            {"check_in": "2024-05-01", "check_out": "2024-05-11"},
+        ],
+        guests=3,
+        hotels_per_quote=2,
+    )
+
+    assert result["total_quotes"] == 6
+    first = result["quotes"][0]
+    assert (first["destination"], first["dates"]["nights"]) == ("Tokyo", 3)
+    # Three guests need two standard rooms
+    assert first["hotels"][0]["rooms"] == 2
+    assert first["cheapest_total"]["hotel_total"] == 90 * 3 * 2
+    assert first["cheapest_total"]["flight_total"] == int(800 * 0.7 * 3)
+
+    cheapest = result["cheapest"]
+    assert (cheapest["destination"], cheapest["dates"]["nights"]) == ("Paris", 3)
+    assert cheapest["total"] == min(q["cheapest_total"]["total"] for q in result["quotes"])
+
+    with pytest.raises(ValueError):
+        await BulkQuotePricesSkill().execute(destinations=["Tokyo"], room_type="penthouse")
+
+    # Negative counts list no hotels instead of reaching argpartition
+    none = await BulkQuotePricesSkill().execute(destinations=["Tokyo"], hotels_per_quote=-2)
+    assert none["quotes"][0]["hotels"] == []
+    assert none["quotes"][0]["cheapest_total"]["hotel_total"] > 0
+
+
+def test_price_calendar_matches_per_date_pricing():
+    engine = get_catalog().quote_engine
+    calendar = engine.price_calendar("Tokyo", "2024-03-25", "2024-04-05", nights=3, guests=3)
+
+    assert len(calendar["windows"]) == 12 and calendar["rooms"] == 2
+    route = engine.route("Tokyo")
+    for window in calendar["windows"]:
+        # Same window priced one night at a time with the standard library
+        first = date.fromisoformat(window["check_in"])
+        stay = [first + timedelta(days=n) for n in range(3)]
+        factor = sum(
+            engine.season_multipliers[route, d.month - 1]
+            * engine.night_weekday_multipliers[d.weekday()]
+            for d in stay
+        )
+        assert window["hotel_total"] == money(min(engine.hotel_rates) * 2 * factor)
+        assert window["check_out"] == (first + timedelta(days=3)).isoformat()
+
+    # Cherry blossom season costs more than late March
+    totals = {w["check_in"]: w["total"] for w in calendar["windows"]}
+    assert totals["2024-04-03"] > totals["2024-03-27"]
+    cheapest = [w["total"] for w in calendar["cheapest"]]
+    assert cheapest == sorted(cheapest) and cheapest[0] == min(totals.values())
+
+
+async def test_query_prices_calendar_mode():
+    result = await QueryPricesSkill().execute(
+        destination="Bali", check_in="2024-06-01", check_out="2024-06-08",
+        flexible_from="2024-06-01", cheapest_windows=3
+    )
+
+    calendar = result["calendar"]
+    assert calendar["nights"] == 7
+    assert len(calendar["windows"]) == 30 and len(calendar["cheapest"]) == 3
+    assert calendar["windows"][-1]["check_in"] == "2024-06-30"
+    # The rate card itself is not seasonal
+    assert result["hotels"][0]["total_price"] == 250 * 7
+
+    with pytest.raises(ValueError):
+        await QueryPricesSkill().execute(
+            destination="Bali", flexible_from="2024-01-01", flexible_to="2025-06-01"
+        )
+    with pytest.raises(ValueError):
+        await QueryPricesSkill().execute(destination="Bali", flexible_from="June 1st")
+    with pytest.raises(ValueError, match="nights"):
+        await QueryPricesSkill().execute(
+            destination="Bali", flexible_from="2024-06-01", stay_nights=100_000
+        )
@@ -0,0 +1,125 @@
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from mcp_server.skills import reviews as reviews_module  # noqa: E402
+from mcp_server.skills.catalog import get_catalog  # noqa: E402
+from mcp_server.skills.review_store import DestinationReviews, ReviewStore  # noqa: E402
+from mcp_server.skills.reviews import GetDestinationReviewsSkill  # noqa: E402
+
+
+def random_reviews(count: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    first = date(2020, 1, 1)
+    return [
+        {"author": f"user{i}", "rating": int(rating),
+         "date": (first + timedelta(days=int(day))).isoformat()}
+        for i, (rating, day) in enumerate(zip(rng.integers(1, 6, count), rng.integers(0, 1500, count)))
+    ]
+
+
+def read_all(reviews: DestinationReviews, sort_by: str, limit: int):
+    pages, cursor = [], None
+    while True:
+        page = reviews.page(sort_by, limit=limit, cursor=cursor)
+        pages.extend(page.reviews)
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+def read_all_after(reviews: DestinationReviews, cursor: str):
+    page = reviews.page("recency", limit=1000, cursor=cursor)
+    assert page.next_cursor is None
+    return page.reviews
+
+
+def test_histograms_are_maintained_as_reviews_arrive():
+    reviews = DestinationReviews({"ratings": {"5_star": 8, "1_star": 2}, "sentiments": {"positive": 10}})
+    batch = random_reviews(5000)
+    for start in range(0, len(batch), 700):
+        reviews.ingest(batch[start:start + 700])
+
+    ratings = [review["rating"] for review in batch]
+    summary = reviews.summary()
+    assert summary["total_reviews"] == 5010
+    assert summary["overall_rating"] == round((sum(ratings) + 8 * 5 + 2) / 5010, 1)
+    assert summary["rating_breakdown"]["3_star"] == round(ratings.count(3) * 100 / 5010)
+    positive = sum(rating >= 4 for rating in ratings) + 10
+    assert summary["sentiment_breakdown"]["positive"] == round(positive * 100 / 5010)
+    assert len(reviews) == 5000
+
+
+def test_cursor_pages_cover_every_review_in_order():
+    reviews = DestinationReviews()
+    batch = random_reviews(3000)
+    reviews.ingest(batch)
+
+    by_recency = read_all(reviews, "recency", limit=128)
+    # Newest first; among equal dates the later-ingested review first
+    expected = sorted(range(len(batch)), key=lambda i: (batch[i]["date"], i), reverse=True)
+    assert [review["author"] for review in by_recency] == [batch[i]["author"] for i in expected]
+
+    by_rating = read_all(reviews, "rating", limit=500)
+    assert [(r["rating"], r["date"]) for r in by_rating] == sorted(
+        ((r["rating"], r["date"]) for r in batch), reverse=True
+    )
+    assert reviews.page("rating", offset=2990, limit=50).reviews == by_rating[2990:]
+
+
+def test_cursor_is_stable_while_reviews_are_ingested():
+    reviews = DestinationReviews()
+    reviews.ingest(random_reviews(100))
+    first = reviews.page("recency", limit=40)
+
+    # Newer reviews land before the cursor, older ones after it
+    reviews.ingest([{"rating": 5, "date": "2030-01-01"}, {"rating": 1, "date": "2000-01-01"}])
+    rest = read_all_after(reviews, first.next_cursor)
+    seen = [id(review) for review in first.reviews + rest]
+    assert len(seen) == len(set(seen)) == 101
+    assert rest[-1]["date"] == "2000-01-01" and rest[-1]["sentiment"] == "negative"
+    assert reviews.page("recency", limit=1).reviews[0]["date"] == "2030-01-01"
+
+    with pytest.raises(ValueError):
+        reviews.page("rating", cursor=first.next_cursor)
+    with pytest.raises(ValueError):
+        reviews.page("recency", cursor="not a cursor")
+    with pytest.raises(ValueError):
+        reviews.ingest([{"rating": 6, "date": "2024-01-01"}])
+
+
+async def test_skill_pages_through_destination_reviews():
+    skill = GetDestinationReviewsSkill()
+
+    first = await skill.execute(destination="Tokyo", limit=2)
+    assert [review["date"] for review in first["reviews"]] == ["2024-03-15", "2024-03-10"]
+    assert first["total_reviews"] == 15420
+    assert first["rating_breakdown"] == {"5_star": 60, "4_star": 25, "3_star": 10, "2_star": 3, "1_star": 2}
+    assert first["sentiment_breakdown"] == {"positive": 85, "neutral": 12, "negative": 3}
+
+    second = await skill.execute(destination="Tokyo", limit=2, cursor=first["next_cursor"])
+    assert second["offset"] == 2
+    assert [review["date"] for review in second["reviews"]] == ["2024-02-28", "2024-02-20"]
+
+    best = await skill.execute(destination="tokyo", sort_by="rating", offset=3, limit=10)
+    assert [review["rating"] for review in best["reviews"]] == [4, 4]
+    assert best["next_cursor"] is None
+
+
+async def test_archived_only_destination_is_not_replaced_by_the_default(monkeypatch):
+    archived = {"ratings": {"5_star": 10}, "sentiments": {"positive": 10}}
+    store = ReviewStore.from_catalog(
+        {"atlantis": {"archived": archived, "reviews": []}},
+        get_catalog().section("defaults")["reviews"]
+    )
+    monkeypatch.setattr(reviews_module, "get_review_store", lambda: store)
+
+    result = await GetDestinationReviewsSkill().execute(destination="Atlantis")
+    assert result["total_reviews"] == 10 and result["overall_rating"] == 5.0
+    assert result["reviews"] == () and result["next_cursor"] is None
@@ -0,0 +1,60 @@
+import asyncio
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents.skill_agent import SkillBasedAgent  # noqa: E402
+from utils.deadline import deadline_scope  # noqa: E402
+
+
+async def test_gather_information_returns_partial_results_on_timeout(slow_client):
+    client = slow_client({"get_weather": 1.0, "query_prices": 0.05})
+    agent = SkillBasedAgent(
+        mcp_client=client,
+        gather_timeout=0.5,
+        skill_timeouts={"weather": 0.1}
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results, timed_out = await agent._gather_information({"destination": "Tokyo"})
+
+    assert loop.time() - started < 0.4
+    assert timed_out == ["weather"]
+    assert set(results) == {"destination_info", "pricing", "reviews"}
+
+
+async def test_overall_deadline_bounds_the_fan_out(slow_client):
+    client = slow_client({"get_weather": 1.0, "get_destination_reviews": 1.0})
+    agent = SkillBasedAgent(mcp_client=client, gather_timeout=0.1)
+
+    results, timed_out = await agent._gather_information({"destination": "Paris"})
+
+    assert sorted(timed_out) == ["reviews", "weather"]
+    assert set(results) == {"destination_info", "pricing"}
+
+    plan = await agent._create_plan({"destination": "Paris"}, results, timed_out)
+    assert plan["degraded"] is True
+    assert plan["missing_information"] == timed_out
+
+
+async def test_fan_out_honours_a_zero_timeout_and_the_request_deadline(slow_client):
+    client = slow_client({"get_weather": 0.3})
+
+    agent = SkillBasedAgent(mcp_client=client, gather_timeout=0)
+    assert agent.gather_timeout == 0
+    results, timed_out = await agent._gather_information({"destination": "Rome"})
+    assert sorted(timed_out) == ["destination_info", "pricing", "reviews", "weather"]
+    assert results == {}
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with deadline_scope(0.1):
+        results, timed_out = await SkillBasedAgent(mcp_client=client)._gather_information(
+            {"destination": "Rome"}
+        )
+    assert loop.time() - started < 0.25
+    assert timed_out == ["weather"]
+    assert set(results) == {"destination_info", "pricing", "reviews"}
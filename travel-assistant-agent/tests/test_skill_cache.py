@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents.mcp_client import MCPClient  # noqa: E402
+from agents.skill_cache import TTLSkillResultCache, make_cache_key  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_ignores_parameter_order():
+    assert make_cache_key("s", {"a": 1, "b": 2}) == make_cache_key("s", {"b": 2, "a": 1})
+    assert make_cache_key("s", {"a": 1}) != make_cache_key("t", {"a": 1})
+
+
+def test_per_skill_ttl_and_lru_eviction():
+    clock = FakeClock()
+    cache = TTLSkillResultCache(
+        ttls={"query_prices": 60, "search_destination": 3600},
+        max_entries=2,
+        clock=clock
+    )
+    cache.set("query_prices", {"destination": "Tokyo"}, {"price": 1})
+    cache.set("search_destination", {"destination": "Tokyo"}, {"info": 1})
+
+    clock.now = 120
+    assert cache.get("query_prices", {"destination": "Tokyo"}) is None
+    assert cache.get("search_destination", {"destination": "Tokyo"}) == {"info": 1}
+
+    cache.set("search_destination", {"destination": "Paris"}, {"info": 2})
+    cache.set("search_destination", {"destination": "Bali"}, {"info": 3})
+    assert cache.get("search_destination", {"destination": "Tokyo"}) is None
+    assert cache.get_statistics()["entries"] == 2
+
+    # Skills without a TTL are never cached
+    cache.set("create_travel_plan", {"destination": "Tokyo"}, {"plan": 1})
+    assert cache.get("create_travel_plan", {"destination": "Tokyo"}) is None
+
+
+def test_byte_bound_evicts_oldest_entries():
+    cache = TTLSkillResultCache(max_bytes=100)
+    cache.set("get_weather", {"d": 1}, {"blob": "x" * 60})
+    cache.set("get_weather", {"d": 2}, {"blob": "y" * 60})
+
+    stats = cache.get_statistics()
+    assert stats["entries"] == 1
+    assert stats["bytes"] <= 100
+    assert cache.get("get_weather", {"d": 2}) == {"blob": "y" * 60}
+
+
+async def test_client_serves_repeat_calls_from_cache():
+    client = MCPClient()
+    params = {"destination": "Tokyo", "include_tips": True}
+
+    first = await client.call_skill("search_destination", params)
+    first.result["destination"] = "mutated by caller"
+    second = await client.call_skill("search_destination", params)
+
+    assert second.result["destination"] == "Tokyo"
+    cache_stats = client.get_statistics()["cache"]
+    assert cache_stats["hits"] == 1
+    assert cache_stats["misses"] == 1
@@ -0,0 +1,86 @@
+import copy
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from mcp_server.skills.catalog import FrozenDict, get_catalog, thaw  # noqa: E402
+from mcp_server.skills.destination import SearchDestinationSkill  # noqa: E402
+from mcp_server.skills.planning import CreateTravelPlanSkill  # noqa: E402
+from mcp_server.skills.reviews import GetDestinationReviewsSkill  # noqa: E402
+from mcp_server.skills.weather import GetWeatherSkill  # noqa: E402
+
+
+def test_catalog_data_is_read_only():
+    entry = get_catalog().lookup("destinations", "Tokyo")
+
+    assert isinstance(entry, FrozenDict)
+    with pytest.raises(TypeError):
+        entry["destination"] = "Osaka"
+    with pytest.raises(TypeError):
+        entry.update(country="Korea")
+    with pytest.raises(AttributeError):
+        entry["highlights"].append("Osaka Castle")
+
+    # Copies of frozen data are the data itself; thaw() gives a mutable one
+    assert copy.deepcopy(entry) is entry
+    mutable = thaw(entry)
+    mutable["highlights"].append("Osaka Castle")
+    assert "Osaka Castle" not in entry["highlights"]
+
+
+async def test_results_are_copy_on_write_views():
+    skill = SearchDestinationSkill()
+
+    first = await skill.execute(destination="Tokyo")
+    first["destination"] = "Changed"
+    first["local_tips"] = None
+    with pytest.raises(TypeError):
+        first["highlights"][0] = "Changed"
+
+    second = await skill.execute(destination="Tokyo")
+    assert second["destination"] == "Tokyo"
+    assert second["local_tips"]
+    assert second is not first
+
+
+async def test_generic_entries_are_filled_per_destination():
+    search = await SearchDestinationSkill().execute(destination="Reykjavik", include_tips=False)
+    assert search["destination"] == "Reykjavik"
+    assert "Reykjavik" in search["description"]
+    assert search["local_tips"] is None
+
+    plan = await CreateTravelPlanSkill().execute(destination="Lima", duration_days=2)
+    assert plan["title"] == "Explore Lima"
+    assert [day["day"] for day in plan["itinerary"]] == [1, 2]
+
+    weather = await GetWeatherSkill().execute(destination="Oslo", include_forecast=False)
+    assert weather["destination"] == "Oslo"
+    assert "forecast" not in weather
+
+
+async def test_review_options_do_not_touch_shared_reviews():
+    skill = GetDestinationReviewsSkill()
+
+    trimmed = await skill.execute(destination="Bali", limit=2, include_sentiment=False)
+    assert len(trimmed["reviews"]) == 2
+    assert all("sentiment" not in review for review in trimmed["reviews"])
+
+    full = await skill.execute(destination="Bali", limit=10)
+    assert all("sentiment" in review for review in full["reviews"])
+
+
+async def test_results_serialize_like_plain_data():
+    result = await CreateTravelPlanSkill().execute(destination="Tokyo", duration_days=3, budget=2000)
+
+    # JSON for the transports, pickle for the process pool
+    assert json.loads(json.dumps(result)) == json.loads(json.dumps(thaw(result)))
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored == result
+    with pytest.raises(TypeError):
+        restored["itinerary"][0]["activities"][0] = "Changed"
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents.skill_agent import MCPSkillsPlanner, SkillDAGExecutor  # noqa: E402
+
+
+def test_comprehensive_template_layers():
+    calls = MCPSkillsPlanner.fill_parameters(
+        MCPSkillsPlanner.TEMPLATES["comprehensive"], {"destination": "Tokyo"}
+    )
+    layers = MCPSkillsPlanner.build_layers(calls)
+
+    assert [len(layer) for layer in layers] == [4, 1]
+    assert layers[1][0]["skill"] == "create_travel_plan"
+    assert calls[0]["parameters"]["destination"] == "Tokyo"
+
+
+def test_build_layers_rejects_cycles_and_unknown_steps():
+    with pytest.raises(ValueError):
+        MCPSkillsPlanner.build_layers([
+            {"skill": "a", "depends_on": ["b"]},
+            {"skill": "b", "depends_on": ["a"]},
+        ])
+    with pytest.raises(ValueError):
+        MCPSkillsPlanner.build_layers([{"skill": "a", "depends_on": ["missing"]}])
+
+
+async def test_executor_runs_layers_concurrently(slow_client):
+    client = slow_client({
+        "search_destination": 0.05,
+        "query_prices": 0.15,
+        "get_destination_reviews": 0.05,
+        "get_weather": 0.05,
+        "create_travel_plan": 0.05,
+    })
+    calls = MCPSkillsPlanner.fill_parameters(
+        MCPSkillsPlanner.TEMPLATES["comprehensive"], {"destination": "Paris"}
+    )
+
+    result = await SkillDAGExecutor(client).run(calls)
+
+    assert all(r.success for r in result.results.values())
+    assert result.critical_path == ["query_prices", "create_travel_plan"]
+    # Longest branch (0.15 + 0.05), not the 0.35s sum of all skills
+    assert result.total_time_ms < 300
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from mcp_server.skills import BaseSkill  # noqa: E402
+from mcp_server.skills.registry import (  # noqa: E402
+    SkillRegistry,
+    SkillSpec,
+    build_manifest,
+)
+
+
+def test_manifest_matches_skill_classes():
+    # Regenerate with `python -m mcp_server.skills` when this fails
+    manifest = SkillRegistry.from_manifest(include_entry_points=False)
+    assert manifest.definitions() == [
+        entry["definition"] for entry in build_manifest()["skills"]
+    ]
+
+
+def test_registry_loads_skills_on_first_use():
+    registry = SkillRegistry.from_manifest(include_entry_points=False)
+
+    assert "get_weather" in registry
+    assert registry.definition("get_weather")["category"] == "weather"
+    assert registry.validator("get_weather").required == ["destination"]
+    assert not registry.is_loaded("get_weather")
+
+    skill = registry["get_weather"]
+    assert skill.name == "get_weather"
+    assert registry.is_loaded("get_weather")
+    assert registry["get_weather"] is skill
+
+
+def test_registry_rejects_mismatched_entry_points():
+    registry = SkillRegistry([
+        SkillSpec(name="wrong_name", entry_point=".weather:GetWeatherSkill")
+    ])
+    with pytest.raises(ValueError):
+        registry["wrong_name"]
+
+
+def test_register_instance():
+    class EchoSkill(BaseSkill):
+        name = "echo"
+
+        async def execute(self, **kwargs):
+            return kwargs
+
+    registry = SkillRegistry()
+    registry.register(EchoSkill())
+
+    assert list(registry) == ["echo"]
+    assert registry.definition("echo")["name"] == "echo"
@@ -0,0 +1,195 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from agents.mcp_client import MCPClient  # noqa: E402
+from agents.mcp_transport import InProcessTransport, MCPTransport  # noqa: E402
+from agents.skill_resilience import CircuitBreaker, CircuitState, hedged_call  # noqa: E402
+from mcp_server.config import MCPClientConfig  # noqa: E402
+from mcp_server.server import MCPServer  # noqa: E402
+
+
+class ScriptedTransport(MCPTransport):
+    """Answers skills/call from a list of (delay, response) steps"""
+
+    name = "scripted"
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.requests = 0
+
+    async def connect(self):
+        pass
+
+    async def request(self, method, params=None):
+        self.requests += 1
+        delay, response = self.steps.pop(0) if len(self.steps) > 1 else self.steps[0]
+        await asyncio.sleep(delay)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def close(self):
+        pass
+
+    @property
+    def connected(self):
+        return True
+
+
+OK = {"success": True, "skill_name": "get_weather", "result": {"ok": True}}
+BOOM = {"success": False, "skill_name": "get_weather", "error": "boom", "error_type": "internal"}
+
+
+def make_client(steps, **config):
+    config.setdefault("cache_enabled", False)
+    config.setdefault("retry_backoff", 0)
+    return MCPClient(
+        config=MCPClientConfig(**config),
+        transport=ScriptedTransport(steps)
+    )
+
+
+def test_circuit_breaker_opens_and_probes():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 10
+
+    now[0] = 10
+    assert breaker.allow()          # the single half-open probe
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    now[0] = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.times_opened == 2
+
+
+async def test_hedged_call_takes_first_success():
+    delays = [0.5, 0.0]
+
+    async def call():
+        delay = delays.pop(0)
+        await asyncio.sleep(delay)
+        return delay
+
+    result, hedged = await hedged_call(call, timeout=1.0, hedge_after=0.02)
+    assert (result, hedged) == (0.0, True)
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await hedged_call(slow, timeout=0.02)
+
+
+async def test_transient_failures_are_retried():
+    client = make_client([(0, BOOM), (0, BOOM), (0, OK)], retry_attempts=3)
+
+    result = await client.call_skill("get_weather", {"destination": "Tokyo"})
+
+    assert result.success
+    assert client.retries == 2
+    assert client.transport.requests == 3
+
+
+async def test_validation_failures_are_not_retried():
+    invalid = {**BOOM, "error_type": "invalid_params", "validation_errors": ["destination: required"]}
+    client = make_client([(0, invalid)], retry_attempts=3)
+
+    result = await client.call_skill("get_weather", {"destination": "Tokyo"})
+
+    assert not result.success
+    assert client.transport.requests == 1
+
+
+async def test_bad_input_does_not_open_the_circuit():
+    client = MCPClient(
+        config=MCPClientConfig(cache_enabled=False, retry_backoff=0, circuit_failure_threshold=2),
+        transport=InProcessTransport(MCPServer())
+    )
+    bad_calls = [
+        ("get_destination_reviews", {"destination": "Tokyo", "cursor": "garbage"}),
+        ("query_prices", {"destination": "Bali", "flexible_from": "June 1st"}),
+        ("bulk_quote_prices", {"destinations": ["Tokyo"], "room_type": "penthouse"}),
+    ]
+
+    for _ in range(3):
+        for skill_name, parameters in bad_calls:
+            result = await client.call_skill(skill_name, parameters)
+            assert not result.success and "Circuit open" not in result.error
+        batch = await client.call_skills_parallel(
+            [{"skill": skill_name, "parameters": parameters} for skill_name, parameters in bad_calls]
+        )
+        assert not any(result.success for result in batch)
+
+    assert client.retries == 0
+    assert client.get_statistics()["circuit_breakers"]["get_destination_reviews"]["state"] == "closed"
+    good = await client.call_skill("get_destination_reviews", {"destination": "Tokyo"})
+    assert good.success
+
+
+async def test_unclassified_failures_are_not_retried():
+    client = make_client([(0, {"success": False, "error": "odd"})], retry_attempts=3)
+
+    result = await client.call_skill("get_weather", {"destination": "Tokyo"})
+
+    assert not result.success
+    assert client.transport.requests == 1
+
+
+async def test_timeouts_open_the_circuit_and_fail_fast():
+    client = make_client(
+        [(1.0, OK)],
+        skill_timeouts={"get_weather": 0.01},
+        retry_attempts=2,
+        circuit_failure_threshold=2
+    )
+
+    first = await client.call_skill("get_weather", {"destination": "Tokyo"})
+    assert "timed out" in first.error
+    assert client.transport.requests == 2
+
+    second = await client.call_skill("get_weather", {"destination": "Paris"})
+    assert "Circuit open" in second.error
+    assert client.transport.requests == 2
+    assert client.short_circuited_calls == 1
+    assert client.get_statistics()["circuit_breakers"]["get_weather"]["state"] == "open"
+
+    batch = await client.call_skills_parallel([
+        {"skill": "get_weather", "parameters": {"destination": "Rome"}}
+    ])
+    assert "Circuit open" in batch[0].error
+    assert client.transport.requests == 2
+
+
+async def test_slow_attempts_are_hedged_after_p95():
+    client = make_client(
+        [(0.001, OK)] * 3 + [(1.0, OK), (0.001, OK)],
+        hedge_requests=True,
+        hedge_min_samples=3
+    )
+    for city in ("A", "B", "C"):
+        await client.call_skill("get_weather", {"destination": city})
+
+    result = await asyncio.wait_for(
+        client.call_skill("get_weather", {"destination": "D"}), timeout=0.5
+    )
+
+    assert result.success
+    assert client.hedged_calls == 1
+    assert client.transport.requests == 5
@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root / "src"))
+
+from mcp_server.skills import SKILL_REGISTRY, get_skill_validator  # noqa: E402
+from mcp_server.validation import SkillValidationError, compile_validator  # noqa: E402
+
+
+def test_every_registered_skill_has_a_validator():
+    for name in SKILL_REGISTRY:
+        assert get_skill_validator(name) is not None
+
+
+def test_validator_coerces_types_and_applies_defaults():
+    validator = get_skill_validator("create_travel_plan")
+
+    params = validator({
+        "destination": "Paris",
+        "duration_days": "4",
+        "budget": "1500.5",
+        "travel_dates": {"start": "2024-04-01", "end": None},
+        "interests": ["food", 42],
+    })
+
+    assert params["duration_days"] == 4
+    assert params["budget"] == 1500.5
+    assert params["interests"] == ["food", "42"]
+    assert params["accommodation_type"] == "mid-range"
+    assert params["pace"] == "moderate"
+
+
+def test_validator_reports_all_errors():
+    validator = compile_validator({
+        "type": "object",
+        "properties": {
+            "flag": {"type": "boolean"},
+            "level": {"type": "string", "enum": ["low", "high"]},
+            "dates": {"type": "object", "properties": {"start": {"type": "string"}}},
+        },
+        "required": ["flag"],
+    })
+
+    assert validator({"flag": "yes"}) == {"flag": True}
+
+    with pytest.raises(SkillValidationError) as exc_info:
+        validator({"level": "medium", "dates": {"start": []}, "extra": 1})
+
+    errors = exc_info.value.errors
+    assert "flag: required" in errors
+    assert any(e.startswith("level:") for e in errors)
+    assert any(e.startswith("dates.start:") for e in errors)
+    assert any("unknown parameters" in e for e in errors)
+
+
+def test_validator_enforces_numeric_bounds():
+    validator = compile_validator({
+        "type": "object",
+        "properties": {"nights": {"type": "integer", "minimum": 1, "maximum": 366}},
+    })
+
+    assert validator({"nights": "366"}) == {"nights": 366}
+    for nights, message in ((0, "at least 1"), (367, "at most 366")):
+        with pytest.raises(SkillValidationError, match=message):
+            validator({"nights": nights})